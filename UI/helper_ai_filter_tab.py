@@ -28,9 +28,18 @@ Dependencies:
     - pandas: Data manipulation
 """
 
+import re
+import threading
+import numpy as np
 import streamlit as st
 import pandas as pd
-from typing import Dict, Any, Optional, Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Callable
+
+from Utils.dataframe_utils import (
+    JOBS_DATA_KEY, clear_session_frame, session_frame_version, set_session_frame
+)
 
 # Import AI tagging service
 try:
@@ -40,6 +49,148 @@ except ImportError:
     AI_SERVICE_AVAILABLE = False
     ai_tagging_service = None
 
+# pyarrow (optional) provides vectorized substring search for the tag filter
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Delay between status checks while an AI search runs in the background
+AI_SEARCH_POLL_SECONDS = 1.0
+
+# AI data type -> dataframe column holding it
+AI_DATA_COLUMNS = {
+    'tags': 'ai_tags',
+    'categories': 'ai_category',
+    'seniority': 'ai_seniority',
+    'scores': 'ai_search_score',
+    'skills': 'ai_skills',
+    'match_reasons': 'ai_match_reasons'
+}
+
+
+@st.cache_data(show_spinner=False)
+def tokenize_tags(ai_tags: pd.Series) -> pd.Series:
+    """
+    Split comma-separated AI tags into lowercased token sets.
+    
+    Args:
+        ai_tags: Series of comma-separated tag strings
+        
+    Returns:
+        pd.Series: frozenset of tags per row (empty for missing tags)
+    """
+    return ai_tags.map(
+        lambda tags: frozenset(tag.strip().lower() for tag in tags.split(',') if tag.strip())
+        if isinstance(tags, str) else frozenset()
+    )
+
+
+@st.cache_resource
+def _ai_executor() -> ThreadPoolExecutor:
+    """Shared thread pool running AI searches off the Streamlit script thread."""
+    return ThreadPoolExecutor(max_workers=4)
+
+
+@st.cache_resource
+def _ai_run_lock() -> threading.Lock:
+    """Process-wide lock serializing bulk AI runs across user sessions."""
+    return threading.Lock()
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _cached_ai_data(df_key: tuple, _jobs_df: pd.DataFrame) -> Dict[str, bool]:
+    """Cached check of which AI columns hold data; the dataframe itself is not hashed."""
+    jobs_df = _jobs_df
+    ai_columns = [col for col in AI_DATA_COLUMNS.values() if col in jobs_df.columns]
+    
+    # One notna().any() pass over all AI columns instead of a null scan per column
+    present = jobs_df[ai_columns].notna().any()
+    
+    return {key: bool(present.get(col, False)) for key, col in AI_DATA_COLUMNS.items()}
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _cached_ai_summary_stats(df_key: tuple, _jobs_df: pd.DataFrame) -> Dict[str, Any]:
+    """Cached summary statistics about AI analysis; the dataframe itself is not hashed."""
+    jobs_df = _jobs_df
+    ai_data = _cached_ai_data(df_key, jobs_df)
+    stats = {
+        'total_jobs': len(jobs_df),
+        'tagged_jobs': 0,
+        'categorized_jobs': 0,
+        'scored_jobs': 0,
+        'avg_score': 0.0,
+        'categories': [],
+        'seniority_levels': []
+    }
+    
+    if ai_data['tags']:
+        stats['tagged_jobs'] = int(jobs_df['ai_tags'].notna().sum())
+    
+    if ai_data['categories']:
+        stats['categorized_jobs'] = int(jobs_df['ai_category'].notna().sum())
+        stats['categories'] = jobs_df['ai_category'].dropna().unique().tolist()
+    
+    if ai_data['scores']:
+        stats['scored_jobs'] = int(jobs_df['ai_search_score'].notna().sum())
+        if stats['scored_jobs'] > 0:
+            stats['avg_score'] = float(jobs_df['ai_search_score'].mean())
+    
+    if ai_data['seniority']:
+        stats['seniority_levels'] = jobs_df['ai_seniority'].dropna().unique().tolist()
+    
+    return stats
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _cached_filter_options(df_key: tuple, _jobs_df: pd.DataFrame, column: str) -> List[str]:
+    """Cached ['All'] + sorted values of a column; categoricals reuse their sorted categories."""
+    values = _jobs_df[column]
+    
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        options = values.cat.categories.tolist()
+    else:
+        options = sorted(values.dropna().unique().tolist())
+    
+    return ['All'] + options
+
+
+def _equals_mask(values: pd.Series, target: Any) -> np.ndarray:
+    """Boolean mask of values == target, comparing integer codes for categoricals."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        categories = values.cat.categories
+        if target not in categories:
+            return np.zeros(len(values), dtype=bool)
+        return values.cat.codes.to_numpy() == categories.get_loc(target)
+    
+    return (values == target).to_numpy(dtype=bool)
+
+
+def _min_score_mask(scores: pd.Series, min_score: float) -> np.ndarray:
+    """Mask of scores >= min_score; missing scores never match."""
+    return scores.to_numpy(dtype='float64', na_value=np.nan) >= min_score
+
+
+def _contains_mask(values: pd.Series, query: str) -> np.ndarray:
+    """Case-insensitive literal substring mask, using Arrow compute when pyarrow is installed."""
+    if PYARROW_AVAILABLE:
+        try:
+            matches = pc.match_substring(pa.array(values, from_pandas=True), query, ignore_case=True)
+            return matches.fill_null(False).to_numpy(zero_copy_only=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            pass  # Non-string values; fall back to pandas
+    
+    return values.str.contains(_compile_tag_pattern(query), na=False).to_numpy(dtype=bool)
+
+
+@lru_cache(maxsize=64)
+def _compile_tag_pattern(query: str) -> "re.Pattern":
+    """Compile a literal, case-insensitive pattern for a tag search query."""
+    return re.compile(re.escape(query), re.IGNORECASE)
+
 
 class AIFilterHelper:
     """
@@ -52,6 +203,13 @@ class AIFilterHelper:
     - AI search result caching and management
     """
     
+    __slots__ = (
+        'session_key_prefix',
+        '_key_ai_search_results', '_key_ai_query', '_key_retag', '_key_batch_id',
+        '_key_ai_category', '_key_ai_seniority', '_key_min_ai_score', '_key_ai_tags_search',
+        '_key_ai_tags_form', '_key_ai_search_future', '_key_ai_search_messages', '_key_tagging_summary'
+    )
+    
     def __init__(self, session_key_prefix: str):
         """
         Initialize the AI Filter Helper.
@@ -60,6 +218,20 @@ class AIFilterHelper:
             session_key_prefix: Prefix for session state keys to avoid conflicts
         """
         self.session_key_prefix = session_key_prefix
+        
+        # Session state keys, built once instead of on every rerun
+        self._key_ai_search_results = f"{session_key_prefix}ai_search_results"
+        self._key_ai_query = f"{session_key_prefix}ai_query"
+        self._key_retag = f"{session_key_prefix}retag"
+        self._key_batch_id = f"{session_key_prefix}batch_id"
+        self._key_ai_category = f"{session_key_prefix}ai_category"
+        self._key_ai_seniority = f"{session_key_prefix}ai_seniority"
+        self._key_min_ai_score = f"{session_key_prefix}min_ai_score"
+        self._key_ai_tags_search = f"{session_key_prefix}ai_tags_search"
+        self._key_ai_tags_form = f"{session_key_prefix}ai_tags_form"
+        self._key_ai_search_future = f"{session_key_prefix}ai_search_future"
+        self._key_ai_search_messages = f"{session_key_prefix}ai_search_messages"
+        self._key_tagging_summary = f"{session_key_prefix}tagging_summary"
     
     @staticmethod
     def is_ai_available() -> bool:
@@ -106,7 +278,7 @@ LLAMA_API_KEY=your_llama_api_key_here
             ai_query = st.text_input(
                 "🔍 Describe your ideal job in natural language",
                 placeholder="e.g., 'Senior Python developer with machine learning experience in a remote-friendly startup'",
-                key=f"{self.session_key_prefix}ai_query",
+                key=self._key_ai_query,
                 help="Use natural language to describe what you're looking for. AI will find relevant jobs and rank them by match quality."
             )
         
@@ -128,31 +300,56 @@ LLAMA_API_KEY=your_llama_api_key_here
                 use_container_width=True,
                 help="Analyze all jobs and add AI-generated tags, skills, and categories"
             )
+            batch_button = st.button(
+                "📦 Batch AI Tags",
+                use_container_width=True,
+                help="Submit all jobs to the OpenAI Batch API (lower cost, results arrive asynchronously)"
+            )
         
         with col2:
-            if 'ai_tags' in jobs_df.columns and not jobs_df['ai_tags'].isna().all():
-                st.info(f"✅ {len(jobs_df[jobs_df['ai_tags'].notna()])} jobs already have AI tags")
+            n_tagged = int(jobs_df['ai_tags'].notna().sum()) if 'ai_tags' in jobs_df.columns else 0
+            if n_tagged > 0:
+                st.info(f"✅ {n_tagged} jobs already have AI tags")
             else:
                 st.info("No AI tags found")
         
         with col3:
             # Clear AI results button
             if st.button("🔄 Clear AI Results", help="Reset to show all jobs"):
-                if f"{self.session_key_prefix}ai_search_results" in st.session_state:
-                    del st.session_state[f"{self.session_key_prefix}ai_search_results"]
+                clear_session_frame(self._key_ai_search_results)
                 st.rerun()
         
-        # Handle AI search
+        # Outcome of a tagging run that replaced the jobs data on the previous run
+        tagging_summary = st.session_state.pop(self._key_tagging_summary, None)
+        if tagging_summary is not None:
+            self._render_tagging_summary(tagging_summary)
+        
+        # Handle AI search (new search, or one still running in the background)
         if search_button and ai_query.strip():
             return self.perform_ai_search(jobs_df, ai_query)
         
-        # Handle AI tagging
+        if self._key_ai_search_future in st.session_state:
+            return self.poll_ai_search()
+        
+        # Handle AI tagging; once the session's jobs data has been replaced the whole app
+        # reruns, so other tabs (and this fragment's arguments) pick up the tagged frame
         if tag_button:
-            return self.perform_ai_tagging(jobs_df)
+            tagged_df = self.perform_ai_tagging(jobs_df)
+            if tagged_df is not jobs_df and st.session_state.get(JOBS_DATA_KEY) is tagged_df:
+                st.rerun(scope="app")
+            return tagged_df
+        
+        # Handle batch tagging (submission or polling of a pending batch)
+        if batch_button or self._key_batch_id in st.session_state:
+            batch_tagged_df = self.perform_ai_tagging_batch(jobs_df)
+            if batch_tagged_df is not None:
+                if st.session_state.get(JOBS_DATA_KEY) is batch_tagged_df:
+                    st.rerun(scope="app")
+                return batch_tagged_df
         
         # Return cached AI search results if available
-        if f"{self.session_key_prefix}ai_search_results" in st.session_state:
-            cached_results = st.session_state[f"{self.session_key_prefix}ai_search_results"]
+        if self._key_ai_search_results in st.session_state:
+            cached_results = st.session_state[self._key_ai_search_results]
             if not cached_results.empty:
                 st.success(f"🤖 Showing {len(cached_results)} AI-filtered results from previous search")
                 return cached_results
@@ -161,75 +358,134 @@ LLAMA_API_KEY=your_llama_api_key_here
     
     def perform_ai_search(self, jobs_df: pd.DataFrame, query: str) -> Optional[pd.DataFrame]:
         """
-        Perform AI-powered job search with progress tracking and result caching.
+        Start an AI-powered job search in a background thread.
+        
+        The search runs on a shared executor so the script thread keeps rendering;
+        poll_ai_search picks up the results on later reruns.
         
         Args:
             jobs_df: DataFrame containing job data
             query: Natural language search query
             
         Returns:
-            Optional[pd.DataFrame]: AI-filtered and ranked results if successful, None otherwise
+            Optional[pd.DataFrame]: AI-filtered and ranked results if already finished, None otherwise
         """
+        lock = _ai_run_lock()
+        if not lock.acquire(blocking=False):
+            st.warning("⏳ Another AI run is in progress. Please wait and try again.")
+            return None
+        
+        # Streamlit calls don't render from the worker thread, so the search collects its
+        # warnings and errors here and poll_ai_search shows them
+        search_messages = []
+        
         try:
-            with st.spinner("🤖 Analyzing jobs with AI... This may take a moment."):
-                # Create progress bar
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-                
-                status_text.text("Analyzing your query with AI...")
-                progress_bar.progress(20)
-                
-                # Perform AI search
-                ai_results = ai_tagging_service.search_jobs_with_ai(jobs_df, query)
-                progress_bar.progress(100)
-                
-                if ai_results.empty:
-                    st.warning("No jobs found matching your AI search criteria. Try adjusting your query.")
-                    return None
-                
-                # Cache results
-                st.session_state[f"{self.session_key_prefix}ai_search_results"] = ai_results
-                
-                # Show success message with details
-                avg_score = ai_results['ai_search_score'].mean()
-                st.success(f"🎯 Found {len(ai_results)} relevant jobs! Average match score: {avg_score:.2f}")
-                
-                # Show top match reasons
-                if 'ai_match_reasons' in ai_results.columns:
-                    with st.expander("🔍 Why these jobs match your search", expanded=True):
-                        top_job = ai_results.iloc[0]
-                        st.markdown(f"**Top Match:** {top_job.get('title', 'Unknown')} at {top_job.get('company', 'Unknown')}")
-                        st.markdown(f"**Match Score:** {top_job.get('ai_search_score', 0):.2f}")
-                        st.markdown(f"**Reasons:** {top_job.get('ai_match_reasons', 'N/A')}")
-                
-                return ai_results
+            future = _ai_executor().submit(ai_tagging_service.search_jobs_with_ai, jobs_df, query, search_messages)
+        except Exception as e:
+            lock.release()
+            st.error(f"AI search failed: {str(e)}")
+            return None
+        
+        # The lock is held until the background search finishes
+        future.add_done_callback(lambda _: lock.release())
+        st.session_state[self._key_ai_search_future] = future
+        st.session_state[self._key_ai_search_messages] = search_messages
+        
+        return self.poll_ai_search()
+    
+    def poll_ai_search(self) -> Optional[pd.DataFrame]:
+        """
+        Check on a running AI search, showing its status and collecting results when done.
+        
+        Returns:
+            Optional[pd.DataFrame]: AI-filtered and ranked results if the search finished, None otherwise
+        """
+        future = st.session_state.get(self._key_ai_search_future)
+        if future is None:
+            return None
+        
+        if not future.done():
+            # Only the status fragment reruns while the search is in flight; the rest of
+            # the page renders as usual in the meantime
+            self._render_ai_search_status()
+            return None
+        
+        del st.session_state[self._key_ai_search_future]
+        
+        # Problems reported by the search, each shown once
+        search_messages = st.session_state.pop(self._key_ai_search_messages, [])
+        for level, text in dict.fromkeys(search_messages):
+            if level == 'error':
+                st.error(text)
+            else:
+                st.warning(text)
         
+        try:
+            ai_results = future.result()
         except Exception as e:
             st.error(f"AI search failed: {str(e)}")
             return None
         
-        finally:
-            # Clean up progress indicators
-            try:
-                progress_bar.empty()
-                status_text.empty()
-            except:
-                pass
+        if ai_results.empty:
+            st.warning("No jobs found matching your AI search criteria. Try adjusting your query.")
+            return None
+        
+        # Cache results (with their fingerprint, the cache key of the filters run on them)
+        set_session_frame(self._key_ai_search_results, ai_results)
+        
+        # Show success message with details
+        score_stats = ai_results['ai_search_score'].agg(['mean', 'idxmax'])
+        avg_score = score_stats['mean']
+        st.success(f"🎯 Found {len(ai_results)} relevant jobs! Average match score: {avg_score:.2f}")
+        
+        # Show top match reasons
+        if 'ai_match_reasons' in ai_results.columns:
+            with st.expander("🔍 Why these jobs match your search", expanded=True):
+                top_job = ai_results.loc[score_stats['idxmax']]
+                st.markdown(f"**Top Match:** {top_job.get('title', 'Unknown')} at {top_job.get('company', 'Unknown')}")
+                st.markdown(f"**Match Score:** {top_job.get('ai_search_score', 0):.2f}")
+                st.markdown(f"**Reasons:** {top_job.get('ai_match_reasons', 'N/A')}")
+        
+        return ai_results
+    
+    @st.fragment(run_every=AI_SEARCH_POLL_SECONDS)
+    def _render_ai_search_status(self) -> None:
+        """Show the running AI search, rerunning the whole app once it has finished."""
+        future = st.session_state.get(self._key_ai_search_future)
+        if future is not None and future.done():
+            st.rerun()
+        
+        st.status("🤖 Analyzing jobs with AI... This may take a moment.", state="running")
     
     def perform_ai_tagging(self, jobs_df: pd.DataFrame) -> pd.DataFrame:
         """
         Perform AI tagging on all jobs with progress tracking and result display.
         
+        Results are streamed into separate AI columns, with a live preview of the first rows,
+        and only replace the session's jobs data once every job has been processed.
+        
         Args:
             jobs_df: DataFrame containing job data
             
         Returns:
             pd.DataFrame: Jobs dataframe with AI tags added
         """
+        lock = _ai_run_lock()
+        if not lock.acquire(blocking=False):
+            st.warning("⏳ Another AI run is in progress. Please wait and try again.")
+            return jobs_df
+        
+        try:
+            return self._perform_ai_tagging(jobs_df)
+        finally:
+            lock.release()
+    
+    def _perform_ai_tagging(self, jobs_df: pd.DataFrame) -> pd.DataFrame:
+        """Run bulk AI tagging; callers must hold the AI run lock."""
         try:
             # Check if jobs already have AI tags
-            if 'ai_tags' in jobs_df.columns and not jobs_df['ai_tags'].isna().all():
-                if not st.checkbox("🔄 Re-tag jobs that already have AI tags", key=f"{self.session_key_prefix}retag"):
+            if self.has_ai_data(jobs_df)['tags']:
+                if not st.checkbox("🔄 Re-tag jobs that already have AI tags", key=self._key_retag):
                     st.info("Skipping jobs that already have AI tags. Check the box above to re-tag all jobs.")
                     return jobs_df
             
@@ -268,37 +524,30 @@ LLAMA_API_KEY=your_llama_api_key_here
                     progress_bar.progress(progress)
                     status_text.text(f"Processing job {current} of {total}...")
                 
-                # Perform AI tagging
-                tagged_df = ai_tagging_service.tag_jobs(jobs_df, progress_callback)
+                # Perform AI tagging, streaming results into a frame holding only the AI columns;
+                # jobs_df (and its existing tags) stays untouched until the whole run succeeded
+                preview = st.empty()
+                ai_df = ai_tagging_service.initialize_ai_columns(pd.DataFrame(index=jobs_df.index), inplace=True)
                 
-                # Show completion message
-                tagged_count = len(tagged_df[tagged_df['ai_tags'].notna()])
+                failed_count = 0
                 
-                if tagged_count > 0:
-                    st.success(f"✅ Successfully added AI tags to {tagged_count} jobs!")
+                for completed, (idx, ai_columns) in enumerate(ai_tagging_service.tag_jobs_iter(jobs_df), start=1):
+                    if ai_columns is None:
+                        failed_count += 1
+                    else:
+                        for column, value in ai_columns.items():
+                            ai_df.at[idx, column] = value
                     
-                    # Show sample tags
-                    with st.expander("🔍 Sample AI Analysis", expanded=True):
-                        sample_job = tagged_df[tagged_df['ai_tags'].notna()].iloc[0]
-                        col1, col2 = st.columns(2)
-                        
-                        with col1:
-                            st.markdown(f"**Job:** {sample_job.get('title', 'Unknown')}")
-                            st.markdown(f"**Tags:** {sample_job.get('ai_tags', 'N/A')}")
-                            st.markdown(f"**Category:** {sample_job.get('ai_category', 'N/A')}")
-                        
-                        with col2:
-                            st.markdown(f"**Skills:** {sample_job.get('ai_skills', 'N/A')}")
-                            st.markdown(f"**Seniority:** {sample_job.get('ai_seniority', 'N/A')}")
-                            st.markdown(f"**Score:** {sample_job.get('ai_relevance_score', 0):.2f}")
-                else:
-                    st.warning("⚠️ No AI tags were added. This might be due to API issues.")
-                    st.info("💡 Common causes:")
-                    st.info("• OpenAI API quota exceeded")
-                    st.info("• Rate limiting from too many requests")
-                    st.info("• Network connectivity issues")
-                    st.info("• Empty or invalid job descriptions")
+                    progress_callback(completed, len(ai_df))
+                    if completed % 50 == 1:
+                        preview.dataframe(jobs_df.head(20).assign(**ai_df.head(20)), use_container_width=True, hide_index=True)
+                
+                preview.empty()
+                ai_tagging_service.finalize_ai_columns(ai_df)
                 
+                # Copy-on-write: the new frame shares the untouched job columns with jobs_df
+                tagged_df = jobs_df.assign(**ai_df)
+                self._store_tagged_jobs(jobs_df, tagged_df, failed_count)
                 return tagged_df
         
         except Exception as e:
@@ -314,19 +563,140 @@ LLAMA_API_KEY=your_llama_api_key_here
             except:
                 pass
     
-    def render_ai_filters(self, jobs_df: pd.DataFrame, advanced_filters: Dict[str, Any]) -> None:
+    def _store_tagged_jobs(self, jobs_df: pd.DataFrame, tagged_df: pd.DataFrame, failed_count: int = 0) -> None:
+        """
+        Finish a tagging run: replace the session's jobs data and save the tags cache.
+        
+        The completion message is shown right away, or after the app rerun if
+        tagged_df replaced the session's jobs data.
+        
+        Args:
+            jobs_df: DataFrame the run tagged
+            tagged_df: jobs_df with the AI columns filled in
+            failed_count: Number of jobs the AI failed to analyze
+        """
+        replaces_jobs_data = st.session_state.get(JOBS_DATA_KEY) is jobs_df
+        if replaces_jobs_data:
+            set_session_frame(JOBS_DATA_KEY, tagged_df)
+        ai_tagging_service.save_tags_cache(tagged_df)
+        
+        tagged_rows = tagged_df['ai_tags'].notna()
+        tagging_summary = {
+            'tagged_count': int(tagged_rows.sum()),
+            'sample_job': tagged_df[tagged_rows].iloc[0].to_dict() if tagged_rows.any() else None,
+            'failed_count': failed_count
+        }
+        if replaces_jobs_data:
+            st.session_state[self._key_tagging_summary] = tagging_summary
+        else:
+            self._render_tagging_summary(tagging_summary)
+    
+    def _render_tagging_summary(self, tagging_summary: Dict[str, Any]) -> None:
+        """Show how many jobs a tagging run tagged, with a sample analysis."""
+        tagged_count = tagging_summary['tagged_count']
+        
+        if tagged_count > 0:
+            st.success(f"✅ Successfully added AI tags to {tagged_count} jobs!")
+            
+            # Show sample tags
+            sample_job = tagging_summary['sample_job']
+            with st.expander("🔍 Sample AI Analysis", expanded=True):
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    st.markdown(f"**Job:** {sample_job.get('title', 'Unknown')}")
+                    st.markdown(f"**Tags:** {sample_job.get('ai_tags', 'N/A')}")
+                    st.markdown(f"**Category:** {sample_job.get('ai_category', 'N/A')}")
+                
+                with col2:
+                    st.markdown(f"**Skills:** {sample_job.get('ai_skills', 'N/A')}")
+                    st.markdown(f"**Seniority:** {sample_job.get('ai_seniority', 'N/A')}")
+                    st.markdown(f"**Score:** {sample_job.get('ai_relevance_score', 0):.2f}")
+        else:
+            st.warning("⚠️ No AI tags were added. This might be due to API issues.")
+            st.info("💡 Common causes:")
+            st.info("• OpenAI API quota exceeded")
+            st.info("• Rate limiting from too many requests")
+            st.info("• Network connectivity issues")
+            st.info("• Empty or invalid job descriptions")
+        
+        if tagging_summary['failed_count'] > 0:
+            st.warning(f"⚠️ AI analysis failed for {tagging_summary['failed_count']} jobs; they were left untagged.")
+    
+    def perform_ai_tagging_batch(self, jobs_df: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """
+        Perform AI tagging through the OpenAI Batch API.
+        
+        The first call submits the batch and stores its ID in session state; later
+        reruns poll the batch and, once it has completed, merge the results by job ID
+        and store the tagged frame as the session's jobs data.
+        
+        Args:
+            jobs_df: DataFrame containing job data
+            
+        Returns:
+            Optional[pd.DataFrame]: Jobs dataframe with AI tags once the batch completed, None otherwise
+        """
+        batch_id = st.session_state.get(self._key_batch_id)
+        
+        if batch_id is None:
+            if not ai_tagging_service.supports_batch():
+                st.warning("⚠️ Batch tagging requires an OpenAI API key. Use 'Add AI Tags' instead.")
+                return None
+            
+            with st.status(f"📦 Submitting {len(jobs_df)} jobs for batch tagging...") as status:
+                batch_id = ai_tagging_service.submit_tagging_batch(jobs_df)
+                if batch_id is None:
+                    status.update(label="❌ Batch submission failed", state="error")
+                    return None
+                
+                st.session_state[self._key_batch_id] = batch_id
+                status.update(label=f"📦 Batch {batch_id} submitted. Results will be merged once it completes.", state="complete")
+            return None
+        
+        with st.status(f"📦 Checking AI tagging batch {batch_id}...") as status:
+            batch_info = ai_tagging_service.retrieve_tagging_batch(batch_id)
+            
+            if batch_info is None:
+                status.update(label="❌ Could not retrieve batch status", state="error")
+                return None
+            
+            if batch_info['status'] in ('failed', 'expired', 'cancelled'):
+                del st.session_state[self._key_batch_id]
+                status.update(label=f"❌ Batch {batch_id} {batch_info['status']}", state="error")
+                return None
+            
+            if batch_info['status'] != 'completed':
+                status.update(
+                    label=f"⏳ Batch {batch_info['status']}: {batch_info['completed']} of {batch_info['total']} jobs processed"
+                )
+                return None
+            
+            tagged_df = ai_tagging_service.apply_tagging_batch_results(jobs_df, batch_info['results'])
+            del st.session_state[self._key_batch_id]
+            status.update(label=f"✅ Batch {batch_id} complete", state="complete")
+            self._store_tagged_jobs(jobs_df, tagged_df)
+            return tagged_df
+    
+    def render_ai_filters(self, jobs_df: pd.DataFrame, advanced_filters: Dict[str, Any],
+                          df_key: Optional[tuple] = None) -> None:
         """
         Render AI-based filter controls if AI analysis data is available.
         
         Args:
             jobs_df: DataFrame containing job data
             advanced_filters: Dictionary to store filter values
+            df_key: Data version of jobs_df from get_data_version, if the caller already has it
         """
+        if df_key is None:
+            df_key = self.get_data_version(jobs_df)
+        
         # Check if AI tags are available
-        has_ai_tags = 'ai_tags' in jobs_df.columns and not jobs_df['ai_tags'].isna().all()
-        has_ai_categories = 'ai_category' in jobs_df.columns and not jobs_df['ai_category'].isna().all()
-        has_ai_seniority = 'ai_seniority' in jobs_df.columns and not jobs_df['ai_seniority'].isna().all()
-        has_ai_scores = 'ai_search_score' in jobs_df.columns and not jobs_df['ai_search_score'].isna().all()
+        ai_data = _cached_ai_data(df_key, jobs_df)
+        has_ai_tags = ai_data['tags']
+        has_ai_categories = ai_data['categories']
+        has_ai_seniority = ai_data['seniority']
+        has_ai_scores = ai_data['scores']
         
         if not any([has_ai_tags, has_ai_categories, has_ai_seniority, has_ai_scores]):
             st.info("🤖 No AI analysis available. Use 'Add AI Tags' or 'AI Search' above to enable AI filters.")
@@ -339,31 +709,31 @@ LLAMA_API_KEY=your_llama_api_key_here
         with col1:
             # AI Category filter
             if has_ai_categories:
-                categories = ['All'] + sorted(jobs_df['ai_category'].dropna().unique().tolist())
+                categories = _cached_filter_options(df_key, jobs_df, 'ai_category')
                 advanced_filters['ai_category'] = st.selectbox(
                     "🎯 AI Job Category",
                     categories,
-                    key=f"{self.session_key_prefix}ai_category",
+                    key=self._key_ai_category,
                     help="Categories determined by AI analysis"
                 )
             
             # AI Seniority filter
             if has_ai_seniority:
-                seniority_levels = ['All'] + sorted(jobs_df['ai_seniority'].dropna().unique().tolist())
+                seniority_levels = _cached_filter_options(df_key, jobs_df, 'ai_seniority')
                 advanced_filters['ai_seniority'] = st.selectbox(
                     "📊 AI Seniority Level",
                     seniority_levels,
-                    key=f"{self.session_key_prefix}ai_seniority",
+                    key=self._key_ai_seniority,
                     help="Seniority levels determined by AI analysis"
                 )
         
         with col2:
             # AI Relevance Score filter (if from AI search)
             if has_ai_scores:
-                score_df = jobs_df[jobs_df['ai_search_score'].notna()]
-                if len(score_df) > 0:
-                    min_score = float(score_df['ai_search_score'].min())
-                    max_score = float(score_df['ai_search_score'].max())
+                scores = jobs_df['ai_search_score'].to_numpy(dtype='float64', na_value=np.nan)
+                if np.isfinite(scores).any():
+                    min_score = float(np.nanmin(scores))
+                    max_score = float(np.nanmax(scores))
                     
                     advanced_filters['min_ai_score'] = st.slider(
                         "🎯 Minimum AI Match Score",
@@ -371,18 +741,20 @@ LLAMA_API_KEY=your_llama_api_key_here
                         max_value=max_score,
                         value=min_score,
                         step=0.05,
-                        key=f"{self.session_key_prefix}min_ai_score",
+                        key=self._key_min_ai_score,
                         help="Filter by AI-calculated relevance score"
                     )
             
-            # AI Tags search
+            # AI Tags search (in a form so filtering only reruns on Enter / Apply)
             if has_ai_tags:
-                advanced_filters['ai_tags_search'] = st.text_input(
-                    "🏷️ Search AI Tags",
-                    placeholder="e.g., machine-learning, senior, startup",
-                    key=f"{self.session_key_prefix}ai_tags_search",
-                    help="Search within AI-generated tags"
-                )
+                with st.form(self._key_ai_tags_form, border=False):
+                    advanced_filters['ai_tags_search'] = st.text_input(
+                        "🏷️ Search AI Tags",
+                        placeholder="e.g., machine-learning, senior, startup",
+                        key=self._key_ai_tags_search,
+                        help="Search within AI-generated tags"
+                    )
+                    st.form_submit_button("Apply Tag Search")
     
     def apply_ai_filters(self, filtered_df: pd.DataFrame, filters: Dict[str, Any]) -> pd.DataFrame:
         """
@@ -395,27 +767,36 @@ LLAMA_API_KEY=your_llama_api_key_here
         Returns:
             pd.DataFrame: Filtered dataframe
         """
+        # Build one fused boolean mask and slice the dataframe once
+        mask = np.ones(len(filtered_df), dtype=bool)
+        
         # AI Category filter
         if filters.get('ai_category') and filters['ai_category'] != 'All' and 'ai_category' in filtered_df.columns:
-            filtered_df = filtered_df[filtered_df['ai_category'] == filters['ai_category']]
+            mask &= _equals_mask(filtered_df['ai_category'], filters['ai_category'])
         
         # AI Seniority filter
         if filters.get('ai_seniority') and filters['ai_seniority'] != 'All' and 'ai_seniority' in filtered_df.columns:
-            filtered_df = filtered_df[filtered_df['ai_seniority'] == filters['ai_seniority']]
+            mask &= _equals_mask(filtered_df['ai_seniority'], filters['ai_seniority'])
         
         # AI Score filter
         if 'min_ai_score' in filters and 'ai_search_score' in filtered_df.columns:
-            score_mask = filtered_df['ai_search_score'] >= filters['min_ai_score']
-            filtered_df = filtered_df[score_mask]
+            mask &= _min_score_mask(filtered_df['ai_search_score'], filters['min_ai_score'])
         
-        # AI Tags search filter
+        # AI Tags search filter: comma-separated queries must match whole tags,
+        # a single term matches as a substring
         if filters.get('ai_tags_search') and 'ai_tags' in filtered_df.columns:
-            tags_mask = filtered_df['ai_tags'].str.contains(
-                filters['ai_tags_search'], case=False, na=False
-            )
-            filtered_df = filtered_df[tags_mask]
+            query = filters['ai_tags_search']
+            query_tokens = {token.strip().lower() for token in query.split(',') if token.strip()}
+            
+            if ',' in query and query_tokens:
+                mask &= tokenize_tags(filtered_df['ai_tags']).map(query_tokens.issubset).to_numpy(dtype=bool)
+            else:
+                mask &= _contains_mask(filtered_df['ai_tags'], query.strip())
+        
+        if mask.all():
+            return filtered_df
         
-        return filtered_df
+        return filtered_df[mask]
     
     def has_ai_data(self, jobs_df: pd.DataFrame) -> Dict[str, bool]:
         """
@@ -427,26 +808,38 @@ LLAMA_API_KEY=your_llama_api_key_here
         Returns:
             Dict[str, bool]: Dictionary indicating what AI data is available
         """
-        return {
-            'tags': 'ai_tags' in jobs_df.columns and not jobs_df['ai_tags'].isna().all(),
-            'categories': 'ai_category' in jobs_df.columns and not jobs_df['ai_category'].isna().all(),
-            'seniority': 'ai_seniority' in jobs_df.columns and not jobs_df['ai_seniority'].isna().all(),
-            'scores': 'ai_search_score' in jobs_df.columns and not jobs_df['ai_search_score'].isna().all(),
-            'skills': 'ai_skills' in jobs_df.columns and not jobs_df['ai_skills'].isna().all(),
-            'match_reasons': 'ai_match_reasons' in jobs_df.columns and not jobs_df['ai_match_reasons'].isna().all()
-        }
+        return _cached_ai_data(self.get_data_version(jobs_df), jobs_df)
+    
+    def get_data_version(self, jobs_df: pd.DataFrame) -> tuple:
+        """
+        Cache key of a dataframe shown in the filter tab.
+        
+        The session's jobs data and cached AI search results carry the fingerprint
+        stored with them; any other frame is fingerprinted on the spot.
+        
+        Args:
+            jobs_df: DataFrame to get the data version of
+            
+        Returns:
+            tuple: Content fingerprint of jobs_df
+        """
+        if st.session_state.get(self._key_ai_search_results) is jobs_df:
+            return session_frame_version(jobs_df, self._key_ai_search_results)
+        return session_frame_version(jobs_df, JOBS_DATA_KEY)
     
     def clear_ai_cache(self) -> None:
         """Clear all AI-related cached data from session state."""
         keys_to_clear = [
-            f"{self.session_key_prefix}ai_search_results",
-            f"{self.session_key_prefix}ai_query",
-            f"{self.session_key_prefix}retag"
+            self._key_ai_query,
+            self._key_retag,
+            self._key_batch_id
         ]
         
         for key in keys_to_clear:
             if key in st.session_state:
                 del st.session_state[key]
+        
+        clear_session_frame(self._key_ai_search_results)
     
     def get_ai_summary_stats(self, jobs_df: pd.DataFrame) -> Dict[str, Any]:
         """
@@ -458,31 +851,4 @@ LLAMA_API_KEY=your_llama_api_key_here
         Returns:
             Dict[str, Any]: Summary statistics
         """
-        ai_data = self.has_ai_data(jobs_df)
-        stats = {
-            'total_jobs': len(jobs_df),
-            'tagged_jobs': 0,
-            'categorized_jobs': 0,
-            'scored_jobs': 0,
-            'avg_score': 0.0,
-            'categories': [],
-            'seniority_levels': []
-        }
-        
-        if ai_data['tags']:
-            stats['tagged_jobs'] = len(jobs_df[jobs_df['ai_tags'].notna()])
-        
-        if ai_data['categories']:
-            stats['categorized_jobs'] = len(jobs_df[jobs_df['ai_category'].notna()])
-            stats['categories'] = jobs_df['ai_category'].dropna().unique().tolist()
-        
-        if ai_data['scores']:
-            score_df = jobs_df[jobs_df['ai_search_score'].notna()]
-            stats['scored_jobs'] = len(score_df)
-            if len(score_df) > 0:
-                stats['avg_score'] = float(score_df['ai_search_score'].mean())
-        
-        if ai_data['seniority']:
-            stats['seniority_levels'] = jobs_df['ai_seniority'].dropna().unique().tolist()
-        
-        return stats
+        return _cached_ai_summary_stats(self.get_data_version(jobs_df), jobs_df)
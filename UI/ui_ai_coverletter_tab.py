@@ -2,11 +2,16 @@ import streamlit as st
 import pandas as pd
 from datetime import datetime
 import json
-import os
 from typing import Dict, Any, List, Optional
 from services.cover_letter_service import CoverLetterGenerator
 
 
+@st.cache_resource
+def _get_cover_letter_generator() -> CoverLetterGenerator:
+    """Create the cover letter generator once per server process."""
+    return CoverLetterGenerator()
+
+
 class AICoverLetterTabUI:
     """
     AI Cover Letter Tab UI component for generating personalized cover letters.
@@ -20,7 +25,7 @@ class AICoverLetterTabUI:
     
     def __init__(self):
         """Initialize the AI Cover Letter Tab UI component."""
-        self.cover_letter_generator = CoverLetterGenerator()
+        self.cover_letter_generator = _get_cover_letter_generator()
     
     def render(self):
         """Render AI-powered cover letter generation tool."""
@@ -31,56 +36,57 @@ class AICoverLetterTabUI:
         The AI will analyze the job requirements and create a tailored cover letter for you.
         """)
         
-        # Job description input
-        st.write("**Job Description**")
-        job_description = st.text_area(
-            "Paste the job description here:",
-            height=200,
-            placeholder="Paste the full job description including company name, role, requirements, and any other relevant details..."
-        )
-        
-        # Advanced options in expander
-        with st.expander("⚙️ Advanced Options", expanded=False):
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                tone = st.selectbox(
-                    "Cover letter tone:",
-                    ["Professional", "Enthusiastic", "Confident", "Friendly"],
-                    index=0
-                )
+        # Inputs are batched in a form so typing doesn't rerun the page
+        with st.form("cover_letter_form", clear_on_submit=False):
+            # Job description input
+            st.write("**Job Description**")
+            job_description = st.text_area(
+                "Paste the job description here:",
+                height=200,
+                placeholder="Paste the full job description including company name, role, requirements, and any other relevant details..."
+            )
+            
+            # Advanced options in expander
+            with st.expander("⚙️ Advanced Options", expanded=False):
+                col1, col2 = st.columns(2)
                 
-                length = st.selectbox(
-                    "Cover letter length:",
-                    ["Concise", "Standard", "Detailed"],
-                    index=1
-                )
+                with col1:
+                    tone = st.selectbox(
+                        "Cover letter tone:",
+                        ["Professional", "Enthusiastic", "Confident", "Friendly"],
+                        index=0
+                    )
+                    
+                    length = st.selectbox(
+                        "Cover letter length:",
+                        ["Concise", "Standard", "Detailed"],
+                        index=1
+                    )
+                
+                with col2:
+                    focus_areas = st.multiselect(
+                        "Focus areas to highlight:",
+                        ["Technical Skills", "Leadership", "Problem Solving", "Team Collaboration", "Innovation", "Communication"],
+                        default=["Technical Skills", "Problem Solving"]
+                    )
+                    
+                    custom_note = st.text_input(
+                        "Additional note to include:",
+                        placeholder="Any specific point you want to mention..."
+                    )
+            
+            # Generation section
+            st.markdown("---")
+            
+            col1, col2, col3 = st.columns([1, 2, 1])
             
             with col2:
-                focus_areas = st.multiselect(
-                    "Focus areas to highlight:",
-                    ["Technical Skills", "Leadership", "Problem Solving", "Team Collaboration", "Innovation", "Communication"],
-                    default=["Technical Skills", "Problem Solving"]
-                )
-                
-                custom_note = st.text_input(
-                    "Additional note to include:",
-                    placeholder="Any specific point you want to mention..."
+                generate_button = st.form_submit_button(
+                    "🚀 Generate Cover Letter", 
+                    type="primary",
+                    use_container_width=True
                 )
         
-        # Generation section
-        st.markdown("---")
-        
-        col1, col2, col3 = st.columns([1, 2, 1])
-        
-        with col2:
-            generate_button = st.button(
-                "🚀 Generate Cover Letter", 
-                type="primary",
-                use_container_width=True,
-                disabled=not job_description.strip()
-            )
-        
         if not job_description.strip():
             st.info("📝 Please enter a job description to generate a cover letter.")
         
@@ -89,86 +95,24 @@ class AICoverLetterTabUI:
             try:
                 with st.spinner("🤖 AI is analyzing the job description and generating your cover letter..."):
                     # Generate cover letter using the existing service
-                    html_file_path, cover_letter_data = self.cover_letter_generator.generate_cover_letter_from_job(
-                        job_description=job_description
+                    html_content, cover_letter_data = self.cover_letter_generator.generate_cover_letter_from_job(
+                        job_description=job_description,
+                        return_content=True
                     )
                     
-                    # Read the generated HTML content
-                    with open(html_file_path, 'r', encoding='utf-8') as f:
-                        html_content = f.read()
-                    
-                    st.success("✅ Cover letter generated successfully!")
+                    # Keep the result (and its serialized JSON) across reruns
+                    st.session_state.cover_letter_html = html_content
+                    st.session_state.cover_letter_data = cover_letter_data
+                    st.session_state.cover_letter_json = json.dumps(cover_letter_data, indent=2)
                     
-                    # Display preview and download options
-                    col1, col2 = st.columns([2, 1])
+                    # Name the download once so the widgets stay stable across reruns
+                    company_name = cover_letter_data.get('company_name', 'Company').replace(' ', '_')
+                    position = cover_letter_data.get('position', 'Position').replace(' ', '_')
+                    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                    st.session_state.cover_letter_filename = f"cover_letter_{company_name}_{position}_{timestamp}.html"
+                    st.session_state.show_html_preview = False
                     
-                    with col1:
-                        st.subheader("📄 Cover Letter Preview")
-                        
-                        # Create a preview of the cover letter content
-                        preview_data = {
-                            "Company": cover_letter_data.get('company_name', 'N/A'),
-                            "Position": cover_letter_data.get('position', 'N/A'),
-                            "Date": cover_letter_data.get('date', 'N/A'),
-                            "Applicant": cover_letter_data.get('applicant_name', 'N/A')
-                        }
-                        
-                        for key, value in preview_data.items():
-                            st.write(f"**{key}:** {value}")
-                        
-                        # Show a portion of the cover letter content
-                        if 'cover_letter_body' in cover_letter_data:
-                            st.write("**Content Preview:**")
-                            # Show first 300 characters
-                            preview_text = cover_letter_data['cover_letter_body'][:300] + "..."
-                            st.write(preview_text)
-                    
-                    with col2:
-                        st.subheader("💾 Download Options")
-                        
-                        # Generate filename
-                        company_name = cover_letter_data.get('company_name', 'Company').replace(' ', '_')
-                        position = cover_letter_data.get('position', 'Position').replace(' ', '_')
-                        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                        filename = f"cover_letter_{company_name}_{position}_{timestamp}.html"
-                        
-                        # Download button for HTML
-                        st.download_button(
-                            label="📥 Download HTML",
-                            data=html_content,
-                            file_name=filename,
-                            mime="text/html",
-                            use_container_width=True
-                        )
-                        
-                        # Optional: Download as JSON data
-                        json_filename = filename.replace('.html', '_data.json')
-                        st.download_button(
-                            label="📊 Download Data (JSON)",
-                            data=json.dumps(cover_letter_data, indent=2),
-                            file_name=json_filename,
-                            mime="application/json",
-                            use_container_width=True
-                        )
-                        
-                        # Display HTML preview button
-                        if st.button("👁️ View Full HTML", use_container_width=True):
-                            st.session_state.show_html_preview = True
-                    
-                    # Full HTML preview in expander
-                    if st.session_state.get('show_html_preview', False):
-                        with st.expander("🌐 Full HTML Preview", expanded=True):
-                            st.components.v1.html(html_content, height=600, scrolling=True)
-                            
-                            if st.button("❌ Close Preview"):
-                                st.session_state.show_html_preview = False
-                                st.rerun()
-                    
-                    # Cleanup temporary file
-                    try:
-                        os.unlink(html_file_path)
-                    except:
-                        pass  # Ignore cleanup errors
+                    st.success("✅ Cover letter generated successfully!")
                         
             except Exception as e:
                 st.error(f"❌ Error generating cover letter: {str(e)}")
@@ -191,6 +135,10 @@ class AICoverLetterTabUI:
                     st.warning("🛠️ **Technical Issue**")
                     st.info("Please try again. If the problem persists, check the application logs.")
         
+        # Preview and download the most recent cover letter
+        if 'cover_letter_html' in st.session_state:
+            self._render_generated_cover_letter()
+        
         # Tips and information
         with st.expander("💡 Tips for Better Cover Letters", expanded=False):
             st.markdown("""
@@ -219,3 +167,72 @@ class AICoverLetterTabUI:
         
         if st.session_state.cover_letter_generated_count > 0:
             st.info(f"📊 Cover letters generated this session: {st.session_state.cover_letter_generated_count}")
+    
+    def _render_generated_cover_letter(self) -> None:
+        """Render preview and download options for the last generated cover letter."""
+        html_content = st.session_state.cover_letter_html
+        cover_letter_data = st.session_state.cover_letter_data
+        
+        # Display preview and download options
+        col1, col2 = st.columns([2, 1])
+        
+        with col1:
+            st.subheader("📄 Cover Letter Preview")
+            
+            # Create a preview of the cover letter content
+            preview_data = {
+                "Company": cover_letter_data.get('company_name', 'N/A'),
+                "Position": cover_letter_data.get('position', 'N/A'),
+                "Date": cover_letter_data.get('date', 'N/A'),
+                "Applicant": cover_letter_data.get('applicant_name', 'N/A')
+            }
+            
+            for key, value in preview_data.items():
+                st.write(f"**{key}:** {value}")
+            
+            # Show a portion of the cover letter content
+            if 'cover_letter_body' in cover_letter_data:
+                st.write("**Content Preview:**")
+                # Show first 300 characters
+                preview_text = cover_letter_data['cover_letter_body'][:300] + "..."
+                st.write(preview_text)
+        
+        with col2:
+            st.subheader("💾 Download Options")
+            
+            filename = st.session_state.cover_letter_filename
+            
+            # Download button for HTML
+            st.download_button(
+                label="📥 Download HTML",
+                data=html_content,
+                file_name=filename,
+                mime="text/html",
+                use_container_width=True
+            )
+            
+            # Optional: Download as JSON data
+            json_filename = filename.replace('.html', '_data.json')
+            st.download_button(
+                label="📊 Download Data (JSON)",
+                data=st.session_state.cover_letter_json,
+                file_name=json_filename,
+                mime="application/json",
+                use_container_width=True
+            )
+            
+            # The iframe is only built once the user asks for it
+            if st.button("👁️ Load HTML Preview", use_container_width=True):
+                st.session_state.show_html_preview = True
+        
+        # Full HTML preview in a placeholder that can be cleared on close
+        preview_container = st.empty()
+        if st.session_state.get('show_html_preview', False):
+            with preview_container.container():
+                st.write("**🌐 Full HTML Preview**")
+                st.components.v1.html(html_content, height=600, scrolling=True)
+                close_preview = st.button("❌ Close Preview")
+            
+            if close_preview:
+                st.session_state.show_html_preview = False
+                preview_container.empty()
@@ -1,9 +1,82 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
+from plotly.colors import qualitative
+from plotly.subplots import make_subplots
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple, Union, Callable
+from Utils.dataframe_utils import session_frame_version
+
+DAY_ORDER = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+# Columns read by the summary metrics row
+SUMMARY_COLUMNS = ['company', 'is_remote', 'min_amount']
+
+
+def _summary_counts(summary_df: pd.DataFrame) -> Tuple[int, int, int, int]:
+    """
+    Compute the summary metric counts in one pass over each column.
+    
+    Args:
+        summary_df: Jobs frame restricted to SUMMARY_COLUMNS
+        
+    Returns:
+        Tuple[int, int, int, int]: (total jobs, unique companies, remote jobs, jobs with salary)
+    """
+    columns = summary_df.columns
+    total_jobs = len(summary_df)
+    unique_companies = summary_df['company'].nunique() if 'company' in columns else 0
+    remote_jobs = int(summary_df['is_remote'].fillna(False).astype(bool).sum()) if 'is_remote' in columns else 0
+    jobs_with_salary = int(summary_df['min_amount'].gt(0).sum()) if 'min_amount' in columns else 0
+    return total_jobs, unique_companies, remote_jobs, jobs_with_salary
+
+
+def _value_counts(values: pd.Series, limit: Optional[int] = None) -> pd.Series:
+    """
+    Count occurrences of each value in a column.
+    
+    Args:
+        values: Column to count
+        limit: Keep only the most frequent values (all when None)
+        
+    Returns:
+        pd.Series: Counts indexed by value, most frequent first
+    """
+    counts = values.value_counts(sort=False)
+    # Categorical columns report unused categories with a zero count
+    counts = counts[counts > 0]
+    if limit:
+        # Partial selection instead of sorting every unique value
+        return counts.nlargest(limit)
+    return counts.sort_values(ascending=False)
+
+
+def _salary_by_group(groups: pd.Series, amounts: pd.Series, min_jobs: int = 2, limit: int = 10) -> pd.DataFrame:
+    """
+    Average salary per group for groups with enough postings.
+    
+    Args:
+        groups: Group label per job (company, location, ...)
+        amounts: Salary amount per job, aligned with groups
+        min_jobs: Minimum number of postings a group needs
+        limit: Number of best-paying groups to keep
+        
+    Returns:
+        pd.DataFrame: 'mean' and 'count' columns indexed by group
+    """
+    group_salary = amounts.groupby(groups, observed=True).agg(['mean', 'count'])
+    # Drop the long tail first, then select the top groups without a full sort
+    return group_salary[group_salary['count'] >= min_jobs].nlargest(limit, 'mean')
+
+
+def _daily_counts(dates: pd.Series) -> pd.Series:
+    """Count postings per calendar day, in date order."""
+    return dates.dt.date.value_counts().sort_index()
+
+
+def _day_of_week_counts(dates: pd.Series) -> pd.Series:
+    """Count postings per weekday, Monday first."""
+    return dates.dt.day_name().value_counts().reindex(DAY_ORDER, fill_value=0)
 
 
 class AnalyticsTabUI:
@@ -35,95 +108,158 @@ class AnalyticsTabUI:
             st.warning("No job data available for analytics.")
             return
         
+        # Reuse figures built on earlier reruns while the data is unchanged
+        cache_key = session_frame_version(jobs_df)
+        if st.session_state.get('analytics_cache_key') != cache_key:
+            st.session_state.analytics_cache_key = cache_key
+            st.session_state.analytics_charts = {}
+        
         # Display summary metrics
         self._render_summary_metrics(jobs_df)
         
-        # Main analytics sections
-        self._render_job_distribution_charts(jobs_df)
-        self._render_company_analytics(jobs_df)
-        self._render_salary_analytics(jobs_df)
-        self._render_location_analytics(jobs_df)
-        self._render_temporal_analytics(jobs_df)
-        self._render_hiring_manager_analytics(jobs_df)
+        columns = set(jobs_df.columns)
+        
+        # Salary mask shared by the salary and location sections
+        has_salary = jobs_df['min_amount'].fillna(0) > 0 if 'min_amount' in columns else None
+        
+        # Main analytics sections with the columns each one needs
+        sections = [
+            (set(), lambda: self._render_job_distribution_charts(jobs_df)),
+            (set(), lambda: self._render_company_analytics(jobs_df)),
+            ({'min_amount'}, lambda: self._render_salary_analytics(jobs_df, has_salary)),
+            ({'location'}, lambda: self._render_location_analytics(jobs_df, has_salary)),
+            ({'date_posted'}, lambda: self._render_temporal_analytics(jobs_df)),
+            ({'hiring_managers_count'}, lambda: self._render_hiring_manager_analytics(jobs_df))
+        ]
+        
+        for required_columns, render_section in sections:
+            if required_columns <= columns:
+                render_section()
+    
+    def _render_chart(self, name: str, build_chart: Callable[[], Union[go.Figure, str]]) -> None:
+        """
+        Render a chart, building it only if it isn't cached for the current data.
+        
+        Args:
+            name: Key of the chart in the session chart cache
+            build_chart: Returns the figure, or an info message when the chart can't be drawn
+        """
+        charts = st.session_state.analytics_charts
+        if name not in charts:
+            # Keep the Figure itself: st.plotly_chart re-validates plain dicts by
+            # rebuilding a Figure from them, which costs more than serializing one
+            charts[name] = build_chart()
+        
+        chart = charts[name]
+        if isinstance(chart, str):
+            st.info(chart)
+        else:
+            st.plotly_chart(chart, use_container_width=True)
     
     def _render_summary_metrics(self, jobs_df: pd.DataFrame) -> None:
         """Render key summary metrics at the top of the analytics tab."""
+        summary_df = jobs_df[[col for col in SUMMARY_COLUMNS if col in jobs_df.columns]]
+        total_jobs, unique_companies, remote_jobs, jobs_with_salary = _summary_counts(summary_df)
+        
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            total_jobs = len(jobs_df)
             st.metric("Total Jobs", total_jobs)
         
         with col2:
-            unique_companies = jobs_df['company'].nunique() if 'company' in jobs_df.columns else 0
             st.metric("Unique Companies", unique_companies)
         
         with col3:
-            remote_jobs = len(jobs_df[jobs_df.get('is_remote', False) == True]) if 'is_remote' in jobs_df.columns else 0
             remote_percentage = (remote_jobs / total_jobs * 100) if total_jobs > 0 else 0
             st.metric("Remote Jobs", f"{remote_jobs} ({remote_percentage:.1f}%)")
         
         with col4:
-            jobs_with_salary = len(jobs_df[jobs_df.get('min_amount', 0) > 0]) if 'min_amount' in jobs_df.columns else 0
             salary_percentage = (jobs_with_salary / total_jobs * 100) if total_jobs > 0 else 0
             st.metric("Jobs with Salary", f"{jobs_with_salary} ({salary_percentage:.1f}%)")
     
     def _render_job_distribution_charts(self, jobs_df: pd.DataFrame) -> None:
-        """Render job distribution charts (pie charts and bar charts)."""
+        """Render job distribution charts (site pie and job type bar) as one figure."""
         st.subheader("📈 Job Distribution")
         
-        col1, col2 = st.columns(2)
+        self._render_chart('job_distribution', lambda: self._build_job_distribution_chart(jobs_df))
+    
+    def _build_job_distribution_chart(self, jobs_df: pd.DataFrame) -> Union[go.Figure, str]:
+        """Build the site pie and job type bar pair, or an info message when both are unavailable."""
+        site_trace = self._build_site_distribution_trace(jobs_df)
+        job_type_trace = self._build_job_type_trace(jobs_df)
+        
+        if isinstance(site_trace, str) and isinstance(job_type_trace, str):
+            return f"{site_trace}. {job_type_trace}."
+        
+        # One figure for the pair; a missing half shows its message as the subplot title
+        fig = make_subplots(
+            rows=1,
+            cols=2,
+            specs=[[{'type': 'domain'}, {'type': 'xy'}]],
+            subplot_titles=(
+                site_trace if isinstance(site_trace, str) else "Jobs by Platform/Site",
+                job_type_trace if isinstance(job_type_trace, str) else "Top 10 Job Types"
+            )
+        )
         
-        with col1:
-            self._render_site_distribution_chart(jobs_df)
+        if not isinstance(site_trace, str):
+            fig.add_trace(site_trace, row=1, col=1)
         
-        with col2:
-            self._render_job_type_chart(jobs_df)
+        if not isinstance(job_type_trace, str):
+            fig.add_trace(job_type_trace, row=1, col=2)
+            fig.update_xaxes(title_text='Job Type', tickangle=45, row=1, col=2)
+            fig.update_yaxes(title_text='Number of Jobs', row=1, col=2)
+        
+        return fig
     
-    def _render_site_distribution_chart(self, jobs_df: pd.DataFrame) -> None:
-        """Render pie chart showing jobs by site/platform."""
+    def _build_site_distribution_trace(self, jobs_df: pd.DataFrame) -> Union[go.Pie, str]:
+        """
+        Build the pie trace showing jobs by site/platform.
+        
+        Args:
+            jobs_df: DataFrame containing job data
+            
+        Returns:
+            Union[go.Pie, str]: Pie trace, or an info message when there is no site data
+        """
         if 'site' not in jobs_df.columns:
-            st.info("Site information not available")
-            return
+            return "Site information not available"
         
-        site_counts = jobs_df['site'].value_counts()
+        site_counts = _value_counts(jobs_df['site'])
         if len(site_counts) == 0:
-            st.info("No site data available")
-            return
+            return "No site data available"
         
-        fig_site = px.pie(
+        return go.Pie(
+            labels=site_counts.index,
             values=site_counts.values,
-            names=site_counts.index,
-            title="Jobs by Platform/Site",
-            color_discrete_sequence=px.colors.qualitative.Set3
+            marker={'colors': qualitative.Set3},
+            textposition='inside',
+            textinfo='percent+label'
         )
-        fig_site.update_traces(textposition='inside', textinfo='percent+label')
-        st.plotly_chart(fig_site, use_container_width=True)
     
-    def _render_job_type_chart(self, jobs_df: pd.DataFrame) -> None:
-        """Render bar chart showing top job types."""
+    def _build_job_type_trace(self, jobs_df: pd.DataFrame) -> Union[go.Bar, str]:
+        """
+        Build the bar trace showing top job types.
+        
+        Args:
+            jobs_df: DataFrame containing job data
+            
+        Returns:
+            Union[go.Bar, str]: Bar trace, or an info message when there is no job type data
+        """
         if 'job_type' not in jobs_df.columns or jobs_df['job_type'].isna().all():
-            st.info("Job type information not available")
-            return
+            return "Job type information not available"
         
-        job_type_counts = jobs_df['job_type'].value_counts().head(10)
+        job_type_counts = _value_counts(jobs_df['job_type'], 10)
         if len(job_type_counts) == 0:
-            st.info("No job type data available")
-            return
+            return "No job type data available"
         
-        fig_type = px.bar(
+        return go.Bar(
             x=job_type_counts.index,
             y=job_type_counts.values,
-            title="Top 10 Job Types",
-            labels={'x': 'Job Type', 'y': 'Number of Jobs'},
-            color=job_type_counts.values,
-            color_continuous_scale='Blues'
-        )
-        fig_type.update_layout(
-            xaxis_tickangle=45,
+            marker={'color': job_type_counts.values, 'colorscale': 'Blues'},
             showlegend=False
         )
-        st.plotly_chart(fig_type, use_container_width=True)
     
     def _render_company_analytics(self, jobs_df: pd.DataFrame) -> None:
         """Render company-related analytics."""
@@ -139,79 +275,79 @@ class AnalyticsTabUI:
     
     def _render_top_companies_chart(self, jobs_df: pd.DataFrame) -> None:
         """Render horizontal bar chart of top companies by job count."""
+        self._render_chart('top_companies', lambda: self._build_top_companies_chart(jobs_df))
+    
+    def _build_top_companies_chart(self, jobs_df: pd.DataFrame) -> Union[go.Figure, str]:
+        """Build the top companies bar chart, or an info message when unavailable."""
         if 'company' not in jobs_df.columns:
-            st.info("Company information not available")
-            return
+            return "Company information not available"
         
-        company_counts = jobs_df['company'].value_counts().head(15)
+        company_counts = _value_counts(jobs_df['company'], 15)
         if len(company_counts) == 0:
-            st.info("No company data available")
-            return
+            return "No company data available"
         
-        fig_company = px.bar(
+        fig_company = go.Figure(go.Bar(
             x=company_counts.values,
             y=company_counts.index,
             orientation='h',
-            title="Top 15 Companies by Job Count",
-            labels={'x': 'Number of Jobs', 'y': 'Company'},
-            color=company_counts.values,
-            color_continuous_scale='Viridis'
-        )
+            marker={'color': company_counts.values, 'colorscale': 'Viridis'}
+        ))
         fig_company.update_layout(
+            title="Top 15 Companies by Job Count",
+            xaxis_title='Number of Jobs',
+            yaxis_title='Company',
             yaxis={'categoryorder': 'total ascending'},
             showlegend=False
         )
-        st.plotly_chart(fig_company, use_container_width=True)
+        return fig_company
     
     def _render_remote_vs_onsite_chart(self, jobs_df: pd.DataFrame) -> None:
         """Render chart comparing remote vs on-site jobs."""
+        self._render_chart('remote_vs_onsite', lambda: self._build_remote_vs_onsite_chart(jobs_df))
+    
+    def _build_remote_vs_onsite_chart(self, jobs_df: pd.DataFrame) -> Union[go.Figure, str]:
+        """Build the remote vs on-site bar chart, or an info message when unavailable."""
         if 'is_remote' not in jobs_df.columns:
-            st.info("Remote work information not available")
-            return
-        
-        remote_counts = jobs_df['is_remote'].value_counts()
-        
-        # Create labels and values
-        labels = []
-        values = []
-        
-        if True in remote_counts.index:
-            labels.append('Remote')
-            values.append(remote_counts[True])
-        
-        if False in remote_counts.index:
-            labels.append('On-site')
-            values.append(remote_counts[False])
-        
-        if not labels:
-            st.info("No remote work data available")
-            return
-        
-        fig_remote = px.bar(
-            x=labels,
-            y=values,
+            return "Remote work information not available"
+        
+        # Count remote/on-site with one reduction over the known values
+        is_remote = jobs_df['is_remote'].dropna().astype(bool)
+        remote_jobs = int(is_remote.sum())
+        onsite_jobs = len(is_remote) - remote_jobs
+        
+        if not (remote_jobs or onsite_jobs):
+            return "No remote work data available"
+        
+        fig_remote = go.Figure(go.Bar(
+            x=['Remote', 'On-site'],
+            y=[remote_jobs, onsite_jobs],
+            marker_color=['#2E8B57', '#4682B4']
+        ))
+        fig_remote.update_layout(
             title="Remote vs On-site Jobs",
-            labels={'x': 'Work Type', 'y': 'Number of Jobs'},
-            color=labels,
-            color_discrete_map={'Remote': '#2E8B57', 'On-site': '#4682B4'}
+            xaxis_title='Work Type',
+            yaxis_title='Number of Jobs',
+            showlegend=False
         )
-        fig_remote.update_layout(showlegend=False)
-        st.plotly_chart(fig_remote, use_container_width=True)
+        return fig_remote
     
-    def _render_salary_analytics(self, jobs_df: pd.DataFrame) -> None:
-        """Render salary-related analytics."""
-        if 'min_amount' not in jobs_df.columns or jobs_df['min_amount'].isna().all():
+    def _render_salary_analytics(self, jobs_df: pd.DataFrame, has_salary: pd.Series) -> None:
+        """
+        Render salary-related analytics.
+        
+        Args:
+            jobs_df: DataFrame containing job data
+            has_salary: Boolean mask of jobs with a positive salary
+        """
+        # Check for usable salaries before emitting the section header
+        if not has_salary.any():
             st.info("💰 Salary information not available")
             return
         
         st.subheader("💰 Salary Analysis")
         
         # Filter out zero and null salaries
-        salary_df = jobs_df[jobs_df['min_amount'] > 0].copy()
-        
-        if len(salary_df) == 0:
-            st.info("No salary data available for analysis")
-            return
+        salary_df = jobs_df.loc[has_salary]
         
         # Display salary summary metrics
         self._render_salary_summary_metrics(salary_df)
@@ -246,54 +382,61 @@ class AnalyticsTabUI:
     
     def _render_salary_distribution_chart(self, salary_df: pd.DataFrame) -> None:
         """Render salary distribution histogram."""
-        fig_salary_hist = px.histogram(
-            salary_df,
-            x='min_amount',
-            title="Salary Distribution",
-            nbins=20,
-            labels={'min_amount': 'Salary ($)', 'count': 'Number of Jobs'}
-        )
+        self._render_chart('salary_distribution', lambda: self._build_salary_distribution_chart(salary_df))
+    
+    def _build_salary_distribution_chart(self, salary_df: pd.DataFrame) -> go.Figure:
+        """Build the salary distribution histogram."""
+        fig_salary_hist = go.Figure(go.Histogram(
+            x=salary_df['min_amount'],
+            nbinsx=20
+        ))
         fig_salary_hist.update_layout(
+            title="Salary Distribution",
+            xaxis_title='Salary ($)',
+            yaxis_title='Number of Jobs',
             bargap=0.1,
             showlegend=False
         )
-        st.plotly_chart(fig_salary_hist, use_container_width=True)
+        return fig_salary_hist
     
     def _render_company_salary_chart(self, salary_df: pd.DataFrame) -> None:
         """Render average salary by company chart."""
+        self._render_chart('company_salary', lambda: self._build_company_salary_chart(salary_df))
+    
+    def _build_company_salary_chart(self, salary_df: pd.DataFrame) -> Union[go.Figure, str]:
+        """Build the average salary by company chart, or an info message when unavailable."""
         if 'company' not in salary_df.columns:
-            st.info("Company information not available for salary analysis")
-            return
-        
-        company_salary = salary_df.groupby('company')['min_amount'].agg(['mean', 'count']).sort_values('mean', ascending=False)
+            return "Company information not available for salary analysis"
         
-        # Filter companies with at least 2 job postings
-        company_salary_filtered = company_salary[company_salary['count'] >= 2].head(10)
+        # Top 10 companies with at least 2 job postings
+        company_salary_filtered = _salary_by_group(salary_df['company'], salary_df['min_amount'])
         
         if len(company_salary_filtered) == 0:
-            st.info("Insufficient data for company salary comparison")
-            return
+            return "Insufficient data for company salary comparison"
         
-        fig_company_salary = px.bar(
+        fig_company_salary = go.Figure(go.Bar(
             x=company_salary_filtered['mean'],
             y=company_salary_filtered.index,
             orientation='h',
-            title="Average Salary by Company (Top 10, min 2 jobs)",
-            labels={'x': 'Average Salary ($)', 'y': 'Company'},
-            color=company_salary_filtered['mean'],
-            color_continuous_scale='RdYlGn'
-        )
+            marker={'color': company_salary_filtered['mean'], 'colorscale': 'RdYlGn'}
+        ))
         fig_company_salary.update_layout(
+            title="Average Salary by Company (Top 10, min 2 jobs)",
+            xaxis_title='Average Salary ($)',
+            yaxis_title='Company',
             yaxis={'categoryorder': 'total ascending'},
             showlegend=False
         )
-        st.plotly_chart(fig_company_salary, use_container_width=True)
+        return fig_company_salary
     
-    def _render_location_analytics(self, jobs_df: pd.DataFrame) -> None:
-        """Render location-based analytics."""
-        if 'location' not in jobs_df.columns:
-            return
+    def _render_location_analytics(self, jobs_df: pd.DataFrame, has_salary: Optional[pd.Series]) -> None:
+        """
+        Render location-based analytics.
         
+        Args:
+            jobs_df: DataFrame containing job data
+            has_salary: Boolean mask of jobs with a positive salary (None without salary data)
+        """
         st.subheader("📍 Location Analytics")
         
         col1, col2 = st.columns(2)
@@ -302,171 +445,173 @@ class AnalyticsTabUI:
             self._render_top_locations_chart(jobs_df)
         
         with col2:
-            self._render_location_salary_chart(jobs_df)
+            self._render_location_salary_chart(jobs_df, has_salary)
     
     def _render_top_locations_chart(self, jobs_df: pd.DataFrame) -> None:
         """Render top locations by job count."""
-        location_counts = jobs_df['location'].value_counts().head(15)
+        self._render_chart('top_locations', lambda: self._build_top_locations_chart(jobs_df))
+    
+    def _build_top_locations_chart(self, jobs_df: pd.DataFrame) -> Union[go.Figure, str]:
+        """Build the top locations bar chart, or an info message when unavailable."""
+        location_counts = _value_counts(jobs_df['location'], 15)
         
         if len(location_counts) == 0:
-            st.info("No location data available")
-            return
+            return "No location data available"
         
-        fig_location = px.bar(
+        fig_location = go.Figure(go.Bar(
             x=location_counts.values,
             y=location_counts.index,
             orientation='h',
-            title="Top 15 Locations by Job Count",
-            labels={'x': 'Number of Jobs', 'y': 'Location'},
-            color=location_counts.values,
-            color_continuous_scale='Plasma'
-        )
+            marker={'color': location_counts.values, 'colorscale': 'Plasma'}
+        ))
         fig_location.update_layout(
+            title="Top 15 Locations by Job Count",
+            xaxis_title='Number of Jobs',
+            yaxis_title='Location',
             yaxis={'categoryorder': 'total ascending'},
             showlegend=False
         )
-        st.plotly_chart(fig_location, use_container_width=True)
+        return fig_location
     
-    def _render_location_salary_chart(self, jobs_df: pd.DataFrame) -> None:
+    def _render_location_salary_chart(self, jobs_df: pd.DataFrame, has_salary: Optional[pd.Series]) -> None:
         """Render average salary by location."""
-        if 'min_amount' not in jobs_df.columns:
-            st.info("Salary information not available for location analysis")
-            return
+        self._render_chart('location_salary', lambda: self._build_location_salary_chart(jobs_df, has_salary))
+    
+    def _build_location_salary_chart(self, jobs_df: pd.DataFrame, has_salary: Optional[pd.Series]) -> Union[go.Figure, str]:
+        """Build the average salary by location chart, or an info message when unavailable."""
+        if has_salary is None:
+            return "Salary information not available for location analysis"
         
         # Filter jobs with salary data
-        salary_location_df = jobs_df[(jobs_df['min_amount'] > 0) & (jobs_df['location'].notna())]
+        salary_location_df = jobs_df.loc[has_salary & jobs_df['location'].notna()]
         
         if len(salary_location_df) == 0:
-            st.info("No salary data available for location analysis")
-            return
+            return "No salary data available for location analysis"
         
-        location_salary = salary_location_df.groupby('location')['min_amount'].agg(['mean', 'count']).sort_values('mean', ascending=False)
-        
-        # Filter locations with at least 2 job postings
-        location_salary_filtered = location_salary[location_salary['count'] >= 2].head(10)
+        # Top 10 locations with at least 2 job postings
+        location_salary_filtered = _salary_by_group(salary_location_df['location'], salary_location_df['min_amount'])
         
         if len(location_salary_filtered) == 0:
-            st.info("Insufficient data for location salary comparison")
-            return
+            return "Insufficient data for location salary comparison"
         
-        fig_location_salary = px.bar(
+        fig_location_salary = go.Figure(go.Bar(
             x=location_salary_filtered['mean'],
             y=location_salary_filtered.index,
             orientation='h',
-            title="Average Salary by Location (Top 10, min 2 jobs)",
-            labels={'x': 'Average Salary ($)', 'y': 'Location'},
-            color=location_salary_filtered['mean'],
-            color_continuous_scale='Cividis'
-        )
+            marker={'color': location_salary_filtered['mean'], 'colorscale': 'Cividis'}
+        ))
         fig_location_salary.update_layout(
+            title="Average Salary by Location (Top 10, min 2 jobs)",
+            xaxis_title='Average Salary ($)',
+            yaxis_title='Location',
             yaxis={'categoryorder': 'total ascending'},
             showlegend=False
         )
-        st.plotly_chart(fig_location_salary, use_container_width=True)
+        return fig_location_salary
     
     def _render_temporal_analytics(self, jobs_df: pd.DataFrame) -> None:
         """Render time-based analytics if date information is available."""
-        if 'date_posted' not in jobs_df.columns:
+        # date_posted is parsed to datetime when jobs are loaded
+        if not pd.api.types.is_datetime64_any_dtype(jobs_df['date_posted']):
             return
         
-        # Try to parse date_posted column
-        try:
-            jobs_df_temp = jobs_df.copy()
-            jobs_df_temp['date_posted'] = pd.to_datetime(jobs_df_temp['date_posted'], errors='coerce')
-            jobs_df_temp = jobs_df_temp[jobs_df_temp['date_posted'].notna()]
-            
-            if len(jobs_df_temp) == 0:
-                return
-            
-            st.subheader("📅 Temporal Analytics")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                self._render_jobs_over_time_chart(jobs_df_temp)
-            
-            with col2:
-                self._render_jobs_by_day_of_week_chart(jobs_df_temp)
+        dates = jobs_df['date_posted'].dropna()
+        
+        if len(dates) == 0:
+            return
+        
+        st.subheader("📅 Temporal Analytics")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            self._render_jobs_over_time_chart(dates)
         
-        except Exception as e:
-            # If date parsing fails, skip temporal analytics
-            pass
+        with col2:
+            self._render_jobs_by_day_of_week_chart(dates)
     
-    def _render_jobs_over_time_chart(self, jobs_df_temp: pd.DataFrame) -> None:
+    def _render_jobs_over_time_chart(self, dates: pd.Series) -> None:
         """Render jobs posted over time."""
-        jobs_df_temp['date_only'] = jobs_df_temp['date_posted'].dt.date
-        daily_counts = jobs_df_temp['date_only'].value_counts().sort_index()
+        self._render_chart('jobs_over_time', lambda: self._build_jobs_over_time_chart(dates))
+    
+    def _build_jobs_over_time_chart(self, dates: pd.Series) -> go.Figure:
+        """Build the jobs posted over time line chart."""
+        daily_counts = _daily_counts(dates)
         
-        fig_time = px.line(
+        fig_time = go.Figure(go.Scatter(
             x=daily_counts.index,
             y=daily_counts.values,
+            mode='lines'
+        ))
+        fig_time.update_layout(
             title="Jobs Posted Over Time",
-            labels={'x': 'Date', 'y': 'Number of Jobs Posted'}
+            xaxis_title='Date',
+            yaxis_title='Number of Jobs Posted',
+            showlegend=False
         )
-        fig_time.update_layout(showlegend=False)
-        st.plotly_chart(fig_time, use_container_width=True)
+        return fig_time
     
-    def _render_jobs_by_day_of_week_chart(self, jobs_df_temp: pd.DataFrame) -> None:
+    def _render_jobs_by_day_of_week_chart(self, dates: pd.Series) -> None:
         """Render jobs posted by day of week."""
-        jobs_df_temp['day_of_week'] = jobs_df_temp['date_posted'].dt.day_name()
-        day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        day_counts = jobs_df_temp['day_of_week'].value_counts().reindex(day_order, fill_value=0)
+        self._render_chart('jobs_by_day_of_week', lambda: self._build_jobs_by_day_of_week_chart(dates))
+    
+    def _build_jobs_by_day_of_week_chart(self, dates: pd.Series) -> go.Figure:
+        """Build the jobs posted by day of week bar chart."""
+        day_counts = _day_of_week_counts(dates)
         
-        fig_dow = px.bar(
+        fig_dow = go.Figure(go.Bar(
             x=day_counts.index,
             y=day_counts.values,
+            marker={'color': day_counts.values, 'colorscale': 'Blues'}
+        ))
+        fig_dow.update_layout(
             title="Jobs Posted by Day of Week",
-            labels={'x': 'Day of Week', 'y': 'Number of Jobs Posted'},
-            color=day_counts.values,
-            color_continuous_scale='Blues'
+            xaxis_title='Day of Week',
+            yaxis_title='Number of Jobs Posted',
+            showlegend=False
         )
-        fig_dow.update_layout(showlegend=False)
-        st.plotly_chart(fig_dow, use_container_width=True)
+        return fig_dow
     
     def _render_hiring_manager_analytics(self, jobs_df: pd.DataFrame) -> None:
         """Render hiring manager analytics if available."""
-        if 'hiring_managers_count' not in jobs_df.columns:
-            return
-        
         st.subheader("👥 Hiring Manager Analytics")
         
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Jobs with vs without hiring managers
-            has_hm = jobs_df['hiring_managers_count'] > 0
-            hm_counts = has_hm.value_counts()
-            
-            labels = ['With Hiring Managers' if True in hm_counts.index else 'No Data',
-                     'Without Hiring Managers' if False in hm_counts.index else 'No Data']
-            values = [hm_counts.get(True, 0), hm_counts.get(False, 0)]
-            
-            fig_hm = px.pie(
-                values=values,
-                names=labels,
-                title="Jobs with Hiring Manager Information",
-                color_discrete_map={
-                    'With Hiring Managers': '#2E8B57',
-                    'Without Hiring Managers': '#CD5C5C'
-                }
+        self._render_chart('hiring_managers', lambda: self._build_hiring_manager_chart(jobs_df))
+    
+    def _build_hiring_manager_chart(self, jobs_df: pd.DataFrame) -> go.Figure:
+        """Build the hiring manager coverage pie and count distribution pair."""
+        # Jobs with vs without hiring managers
+        has_hm = jobs_df['hiring_managers_count'] > 0
+        with_hm = int(has_hm.sum())
+        
+        # Distribution of hiring manager count
+        hm_distribution = jobs_df.loc[has_hm, 'hiring_managers_count'].value_counts().sort_index()
+        
+        # Pie and distribution bar share one figure
+        fig_hm = make_subplots(
+            rows=1,
+            cols=2,
+            specs=[[{'type': 'domain'}, {'type': 'xy'}]],
+            subplot_titles=(
+                "Jobs with Hiring Manager Information",
+                "Distribution of Hiring Manager Count" if len(hm_distribution) > 0
+                else "No hiring manager data available for distribution analysis"
             )
-            st.plotly_chart(fig_hm, use_container_width=True)
-        
-        with col2:
-            # Distribution of hiring manager count
-            hm_distribution = jobs_df[jobs_df['hiring_managers_count'] > 0]['hiring_managers_count'].value_counts().sort_index()
-            
-            if len(hm_distribution) > 0:
-                fig_hm_dist = px.bar(
-                    x=hm_distribution.index,
-                    y=hm_distribution.values,
-                    title="Distribution of Hiring Manager Count",
-                    labels={'x': 'Number of Hiring Managers', 'y': 'Number of Jobs'},
-                    color=hm_distribution.values,
-                    color_continuous_scale='Greens'
-                )
-                fig_hm_dist.update_layout(showlegend=False)
-                st.plotly_chart(fig_hm_dist, use_container_width=True)
-            else:
-                st.info("No hiring manager data available for distribution analysis")
-    
\ No newline at end of file
+        )
+        fig_hm.add_trace(go.Pie(
+            labels=['With Hiring Managers', 'Without Hiring Managers'],
+            values=[with_hm, len(has_hm) - with_hm],
+            marker={'colors': ['#2E8B57', '#CD5C5C']}
+        ), row=1, col=1)
+        
+        if len(hm_distribution) > 0:
+            fig_hm.add_trace(go.Bar(
+                x=hm_distribution.index,
+                y=hm_distribution.values,
+                marker={'color': hm_distribution.values, 'colorscale': 'Greens'},
+                showlegend=False
+            ), row=1, col=2)
+            fig_hm.update_xaxes(title_text='Number of Hiring Managers', row=1, col=2)
+            fig_hm.update_yaxes(title_text='Number of Jobs', row=1, col=2)
+        
+        return fig_hm
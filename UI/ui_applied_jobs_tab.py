@@ -1,15 +1,129 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+import json
 import os
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple, Callable
 import io
 
+# xlsxwriter (optional) writes workbooks faster than openpyxl
+try:
+    import xlsxwriter
+    EXCEL_ENGINE = 'xlsxwriter'
+except ImportError:
+    EXCEL_ENGINE = 'openpyxl'
+
+# pyarrow (optional) formats CSV exports column-wise in C
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_CSV_AVAILABLE = True
+except ImportError:
+    PYARROW_CSV_AVAILABLE = False
+
+# String columns of the application history
+HISTORY_STRING_COLUMNS = ['title', 'company', 'location', 'job_url', 'source', 'status', 'shortlisted', 'notes']
+
+# Known values of the selectbox-driven columns
+SOURCE_OPTIONS = ["LinkedIn", "Indeed", "Glassdoor", "Company Website", "Referral", "Other"]
+STATUS_OPTIONS = ["Applied", "Under Review", "Interview Scheduled", "Rejected", "Offer"]
+SHORTLISTED_OPTIONS = ["Pending", "Yes", "No"]
+CATEGORICAL_HISTORY_COLUMNS = {
+    'source': SOURCE_OPTIONS,
+    'status': STATUS_OPTIONS,
+    'shortlisted': SHORTLISTED_OPTIONS
+}
+
+# Size at which appended applications are merged into the Parquet history
+PENDING_FLUSH_BYTES = 64 * 1024
+
+
+# Only the current version of the single history file is worth keeping
+@st.cache_data(show_spinner=False, max_entries=1)
+def _load_history_cached(path: str, file_version: Tuple[float, int], pending_path: str,
+                         pending_version: Optional[Tuple[float, int]]) -> pd.DataFrame:
+    """
+    Read the application history plus applications appended since the last merge.
+    
+    Args:
+        path: Path to the Parquet history file
+        file_version: History file (mtime, size); a new value invalidates the cached frame
+        pending_path: Path to the JSON Lines file of appended applications
+        pending_version: Pending file (mtime, size) (None when there is no pending file)
+        
+    Returns:
+        pd.DataFrame: Application history
+    """
+    # Parquet keeps the column types, so no re-typing is needed after the read
+    df = pd.read_parquet(path)
+    
+    if pending_version is not None:
+        pending_df = pd.read_json(pending_path, lines=True, dtype=False)
+        if not pending_df.empty:
+            pending_df['application_date'] = pd.to_datetime(pending_df['application_date'], errors='coerce')
+            df = pd.concat([df, pending_df], ignore_index=True) if not df.empty else pending_df
+    
+    # Selectbox columns become categoricals; values outside the known options are kept
+    for col, known_values in CATEGORICAL_HISTORY_COLUMNS.items():
+        if col in df.columns:
+            values = df[col].astype(object)
+            extra_values = sorted(set(values.dropna()) - set(known_values))
+            df[col] = pd.Categorical(values, categories=known_values + extra_values)
+    
+    return df
+
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def _history_filter_options(_df: pd.DataFrame, history_version: Tuple) -> Dict[str, List[str]]:
+    """
+    Build the sorted option lists for the application filters.
+    
+    Args:
+        _df: Application history (not hashed; history_version identifies it)
+        history_version: (mtime, size) of the history files
+        
+    Returns:
+        Dict[str, List[str]]: Distinct non-null values per filter column
+    """
+    return {
+        col: sorted(pd.unique(_df[col].dropna()).tolist())
+        for col in ('company', 'status', 'shortlisted', 'source')
+    }
+
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def _history_summary_metrics(_df: pd.DataFrame, history_version: Tuple) -> Dict[str, int]:
+    """
+    Count the application summary metrics.
+    
+    Args:
+        _df: Application history (not hashed; history_version identifies it)
+        history_version: (mtime, size) of the history files
+        
+    Returns:
+        Dict[str, int]: Metric label to count, in display order
+    """
+    # Two counting passes cover all the status and shortlist metrics
+    status_counts = _df['status'].value_counts()
+    shortlisted_counts = _df['shortlisted'].value_counts()
+    
+    return {
+        "Total Applications": len(_df),
+        "Shortlisted": int(shortlisted_counts.get('Yes', 0)),
+        "Pending": int(shortlisted_counts.get('Pending', 0)),
+        "Rejected": int(status_counts.get('Rejected', 0)),
+        "Offers": int(status_counts.get('Offer', 0))
+    }
+
+
 class AppliedJobsTabUI:
     """UI component for managing applied jobs history."""
     
     def __init__(self):
-        self.history_file = "Data/applicationHistory/history.csv"
+        self.history_file = "Data/applicationHistory/history.parquet"
+        self.legacy_history_file = "Data/applicationHistory/history.csv"
+        self.pending_file = "Data/applicationHistory/pending.jsonl"
         self.columns = [
             'application_date', 'title', 'company', 'location', 'job_url', 
             'source', 'status', 'shortlisted', 'notes'
@@ -18,53 +132,114 @@ class AppliedJobsTabUI:
     
     def _ensure_history_file_exists(self):
         """Ensure the history file and directory exist."""
+        # Runs on every rerun; a single stat covers the common case of an existing file
+        try:
+            os.stat(self.history_file)
+            return
+        except FileNotFoundError:
+            pass
+        
         os.makedirs(os.path.dirname(self.history_file), exist_ok=True)
         
-        if not os.path.exists(self.history_file):
-            # Create empty CSV with headers
+        if os.path.exists(self.legacy_history_file):
+            # One-time migration of the old CSV history
+            self._migrate_csv_history()
+        else:
+            # Create empty history with headers
             df = pd.DataFrame(columns=self.columns)
-            df.to_csv(self.history_file, index=False)
+            df.to_parquet(self.history_file, compression='zstd', index=False)
     
-    def load_application_history(self) -> pd.DataFrame:
-        """Load application history from CSV file."""
+    def _migrate_csv_history(self):
+        """Convert the legacy CSV history file to Parquet."""
         try:
-            if os.path.exists(self.history_file):
-                df = pd.read_csv(self.history_file)
-                if not df.empty:
-                    # Convert application_date to datetime
-                    df['application_date'] = pd.to_datetime(df['application_date'], errors='coerce')
-                    
-                    # Ensure string columns are properly typed
-                    string_columns = ['title', 'company', 'location', 'job_url', 'source', 'status', 'shortlisted', 'notes']
-                    for col in string_columns:
-                        if col in df.columns:
-                            df[col] = df[col].astype(str)
-                            # Replace 'nan' strings with empty strings
-                            df[col] = df[col].replace('nan', '')
-                
-                return df
-            else:
-                return pd.DataFrame(columns=self.columns)
+            # Read text columns as-is: no type inference and no NaN to clean up afterwards
+            df = pd.read_csv(
+                self.legacy_history_file,
+                dtype={col: str for col in HISTORY_STRING_COLUMNS},
+                keep_default_na=False,
+                na_filter=False
+            )
+            self.save_application_history(df)
+        except Exception as e:
+            st.error(f"Error migrating application history: {e}")
+    
+    def _history_version(self) -> Tuple[Tuple[float, int], Optional[Tuple[float, int]]]:
+        """
+        (mtime, size) of the history file and of the pending file (None when absent).
+        
+        The size catches rewrites that land within the filesystem's mtime resolution.
+        """
+        try:
+            pending_stat = os.stat(self.pending_file)
+            pending_version = (pending_stat.st_mtime, pending_stat.st_size)
+        except FileNotFoundError:
+            pending_version = None
+        history_stat = os.stat(self.history_file)
+        return (history_stat.st_mtime, history_stat.st_size), pending_version
+    
+    def load_application_history(self, history_version: Optional[Tuple] = None) -> pd.DataFrame:
+        """
+        Load application history from the Parquet file.
+        
+        Args:
+            history_version: Result of _history_version() if the caller already has it
+            
+        Returns:
+            pd.DataFrame: Application history
+        """
+        try:
+            return self._read_application_history(history_version)
+        except FileNotFoundError:
+            return pd.DataFrame(columns=self.columns)
         except Exception as e:
             st.error(f"Error loading application history: {e}")
             return pd.DataFrame(columns=self.columns)
     
+    def _read_application_history(self, history_version: Optional[Tuple] = None) -> pd.DataFrame:
+        """Load the application history, raising if the files can't be read."""
+        # Cached per file version; saves and appends change an mtime or size and force a re-read
+        file_version, pending_version = history_version or self._history_version()
+        return _load_history_cached(self.history_file, file_version, self.pending_file, pending_version)
+    
+    def _load_history_pipeline(self) -> Tuple[pd.DataFrame, Dict[str, int], Dict[str, List[str]]]:
+        """
+        Load the application history together with its summary metrics and filter options.
+        
+        Returns:
+            Tuple of the history DataFrame, summary metrics and filter options
+            (metrics and options are empty when there is no history)
+        """
+        try:
+            history_version = self._history_version()
+        except FileNotFoundError:
+            return pd.DataFrame(columns=self.columns), {}, {}
+        
+        df = self.load_application_history(history_version)
+        if df.empty:
+            return df, {}, {}
+        
+        return df, _history_summary_metrics(df, history_version), _history_filter_options(df, history_version)
+    
     def save_application_history(self, df: pd.DataFrame):
-        """Save application history to CSV file."""
+        """Save application history to the Parquet file."""
         try:
             # Ensure directory exists
             os.makedirs(os.path.dirname(self.history_file), exist_ok=True)
             
-            # Clean up the dataframe before saving
-            df_clean = df.copy()
+            # Parquet needs one type per column: datetimes for the date, strings elsewhere.
+            # Only the cleaned columns are replaced; assign shares the rest with df instead of copying it.
+            cleaned = {
+                col: df[col].astype(object).fillna('')
+                for col in HISTORY_STRING_COLUMNS if col in df.columns
+            }
+            if 'application_date' in df.columns:
+                cleaned['application_date'] = pd.to_datetime(df['application_date'], errors='coerce')
             
-            # Replace NaN values with empty strings for string columns
-            string_columns = ['title', 'company', 'location', 'job_url', 'source', 'status', 'shortlisted', 'notes']
-            for col in string_columns:
-                if col in df_clean.columns:
-                    df_clean[col] = df_clean[col].fillna('')
+            df.assign(**cleaned).to_parquet(self.history_file, compression='zstd', index=False)
             
-            df_clean.to_csv(self.history_file, index=False)
+            # Appended applications are part of the saved frame now
+            if os.path.exists(self.pending_file):
+                os.remove(self.pending_file)
             return True
         except Exception as e:
             st.error(f"Error saving application history: {e}")
@@ -91,12 +266,9 @@ class AppliedJobsTabUI:
     def add_application(self, job_data: Dict[str, Any]) -> bool:
         """Add a new job application to history."""
         try:
-            # Load existing history
-            df = self.load_application_history()
-            
             # Create new application record with proper string handling
             new_application = {
-                'application_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'application_date': datetime.now().isoformat(sep=' ', timespec='seconds'),
                 'title': str(job_data.get('title', 'Unknown')),
                 'company': str(job_data.get('company', 'Unknown')),
                 'location': str(job_data.get('location', 'Unknown')),
@@ -107,11 +279,21 @@ class AppliedJobsTabUI:
                 'notes': str(job_data.get('notes', ''))
             }
             
-            # Add to dataframe
-            new_df = pd.concat([df, pd.DataFrame([new_application])], ignore_index=True)
+            # Append one line instead of rewriting the whole history
+            with open(self.pending_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(new_application) + '\n')
             
-            # Save to file
-            return self.save_application_history(new_df)
+            # Merge into the Parquet file once enough applications have piled up. The merge
+            # rewrites the history and deletes pending.jsonl, so it only runs on a successful
+            # read; otherwise the appended applications stay pending until the next append
+            if os.path.getsize(self.pending_file) >= PENDING_FLUSH_BYTES:
+                try:
+                    history_df = self._read_application_history()
+                except Exception as e:
+                    st.warning(f"Application saved, but the history could not be merged yet: {e}")
+                    return True
+                return self.save_application_history(history_df)
+            return True
         except Exception as e:
             st.error(f"Error adding application: {e}")
             return False
@@ -128,16 +310,16 @@ class AppliedJobsTabUI:
                 company = st.text_input("Company", key="new_job_company")
                 location = st.text_input("Location", key="new_job_location")
                 source = st.selectbox("Source", 
-                                    ["LinkedIn", "Indeed", "Glassdoor", "Company Website", "Referral", "Other"],
+                                    SOURCE_OPTIONS,
                                     key="new_job_source")
             
             with col2:
                 job_url = st.text_input("Job URL (optional)", key="new_job_url")
                 status = st.selectbox("Application Status",
-                                    ["Applied", "Under Review", "Interview Scheduled", "Rejected", "Offer"],
+                                    STATUS_OPTIONS,
                                     key="new_job_status")
                 shortlisted = st.selectbox("Shortlisted",
-                                         ["Pending", "Yes", "No"],
+                                         SHORTLISTED_OPTIONS,
                                          key="new_job_shortlisted")
                 notes = st.text_area("Notes", key="new_job_notes")
             
@@ -162,8 +344,17 @@ class AppliedJobsTabUI:
                 else:
                     st.warning("⚠️ Please fill in at least Job Title and Company")
     
-    def _render_filters(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Render filters for the applied jobs."""
+    def _render_filters(self, df: pd.DataFrame, options: Dict[str, List[str]]) -> pd.DataFrame:
+        """
+        Render filters for the applied jobs.
+        
+        Args:
+            df: Application history
+            options: Distinct values per filter column
+            
+        Returns:
+            pd.DataFrame: Applications matching the selected filters
+        """
         if df.empty:
             return df
         
@@ -173,69 +364,48 @@ class AppliedJobsTabUI:
         
         with col1:
             # Company filter
-            companies = ['All'] + sorted(df['company'].dropna().unique().tolist())
+            companies = ['All'] + options['company']
             selected_company = st.selectbox("Company", companies, key="filter_company")
         
         with col2:
             # Status filter
-            statuses = ['All'] + sorted(df['status'].dropna().unique().tolist())
+            statuses = ['All'] + options['status']
             selected_status = st.selectbox("Status", statuses, key="filter_status")
         
         with col3:
             # Shortlisted filter
-            shortlisted_options = ['All'] + sorted(df['shortlisted'].dropna().unique().tolist())
+            shortlisted_options = ['All'] + options['shortlisted']
             selected_shortlisted = st.selectbox("Shortlisted", shortlisted_options, key="filter_shortlisted")
         
         with col4:
             # Source filter
-            sources = ['All'] + sorted(df['source'].dropna().unique().tolist())
+            sources = ['All'] + options['source']
             selected_source = st.selectbox("Source", sources, key="filter_source")
         
-        # Apply filters
-        filtered_df = df.copy()
-        
-        if selected_company != 'All':
-            filtered_df = filtered_df[filtered_df['company'] == selected_company]
-        
-        if selected_status != 'All':
-            filtered_df = filtered_df[filtered_df['status'] == selected_status]
+        # Apply filters as one combined mask and a single slice
+        selections = {
+            'company': selected_company,
+            'status': selected_status,
+            'shortlisted': selected_shortlisted,
+            'source': selected_source
+        }
+        masks = [(df[col] == value).to_numpy() for col, value in selections.items() if value != 'All']
         
-        if selected_shortlisted != 'All':
-            filtered_df = filtered_df[filtered_df['shortlisted'] == selected_shortlisted]
-        
-        if selected_source != 'All':
-            filtered_df = filtered_df[filtered_df['source'] == selected_source]
+        if not masks:
+            return df
         
-        return filtered_df
+        return df[np.logical_and.reduce(masks)]
     
-    def _render_summary_metrics(self, df: pd.DataFrame):
+    def _render_summary_metrics(self, metrics: Dict[str, int]):
         """Render summary metrics for applications."""
-        if df.empty:
+        if not metrics:
             return
         
         st.subheader("📊 Application Summary")
         
-        col1, col2, col3, col4, col5 = st.columns(5)
-        
-        with col1:
-            total_apps = len(df)
-            st.metric("Total Applications", total_apps)
-        
-        with col2:
-            shortlisted = len(df[df['shortlisted'] == 'Yes'])
-            st.metric("Shortlisted", shortlisted)
-        
-        with col3:
-            pending = len(df[df['shortlisted'] == 'Pending'])
-            st.metric("Pending", pending)
-        
-        with col4:
-            rejected = len(df[df['status'] == 'Rejected'])
-            st.metric("Rejected", rejected)
-        
-        with col5:
-            offers = len(df[df['status'] == 'Offer'])
-            st.metric("Offers", offers)
+        for col, (label, value) in zip(st.columns(len(metrics)), metrics.items()):
+            with col:
+                st.metric(label, value)
     
     def _render_editable_table(self, df: pd.DataFrame):
         """Render editable table for application management."""
@@ -245,19 +415,9 @@ class AppliedJobsTabUI:
         
         st.subheader("📋 Application Management")
         
-        # Ensure proper data types before displaying
-        df_display = df.copy()
-        
-        # Ensure string columns are properly typed
-        string_columns = ['title', 'company', 'location', 'job_url', 'source', 'status', 'shortlisted', 'notes']
-        for col in string_columns:
-            if col in df_display.columns:
-                df_display[col] = df_display[col].astype(str)
-                df_display[col] = df_display[col].replace('nan', '')
-        
-        # Create editable dataframe
+        # Column types are settled at load time and data_editor keeps its own copy
         edited_df = st.data_editor(
-            df_display,
+            df,
             column_config={
                 "application_date": st.column_config.DatetimeColumn(
                     "Application Date",
@@ -282,17 +442,17 @@ class AppliedJobsTabUI:
                 ),
                 "source": st.column_config.SelectboxColumn(
                     "Source",
-                    options=["LinkedIn", "Indeed", "Glassdoor", "Company Website", "Referral", "Other"],
+                    options=SOURCE_OPTIONS,
                     width="small"
                 ),
                 "status": st.column_config.SelectboxColumn(
                     "Status",
-                    options=["Applied", "Under Review", "Interview Scheduled", "Rejected", "Offer"],
+                    options=STATUS_OPTIONS,
                     width="medium"
                 ),
                 "shortlisted": st.column_config.SelectboxColumn(
                     "Shortlisted",
-                    options=["Pending", "Yes", "No"],
+                    options=SHORTLISTED_OPTIONS,
                     width="small"
                 ),
                 "notes": st.column_config.TextColumn(
@@ -321,6 +481,50 @@ class AppliedJobsTabUI:
         
         return edited_df
     
+    def _render_prepared_download(self, name: str, export_key: Tuple, build_data: Callable[[], Any],
+                                  prepare_label: str, **download_kwargs) -> None:
+        """
+        Render a prepare button that builds export data once, then its download button.
+        
+        Args:
+            name: Export name used for the session state entry
+            export_key: Identifies the exported data; a new key discards the prepared export
+            build_data: Serializes the export (str or bytes)
+            prepare_label: Label of the prepare button
+            **download_kwargs: Passed through to st.download_button
+        """
+        state_key = f"applied_jobs_{name}_export"
+        export = st.session_state.get(state_key)
+        
+        if export is None or export[0] != export_key:
+            export = None
+            if st.button(prepare_label, use_container_width=True):
+                export = (export_key, build_data())
+                st.session_state[state_key] = export
+        
+        if export is not None:
+            st.download_button(data=export[1], use_container_width=True, **download_kwargs)
+    
+    @staticmethod
+    def _to_csv_bytes(df: pd.DataFrame) -> bytes:
+        """Write the applications as CSV, through pyarrow when it is installed."""
+        if PYARROW_CSV_AVAILABLE:
+            try:
+                csv_buffer = io.BytesIO()
+                pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), csv_buffer)
+                return csv_buffer.getvalue()
+            except pa.ArrowException:
+                # Mixed-type columns (e.g. from manual edits) fall back to pandas
+                pass
+        return df.to_csv(index=False).encode('utf-8')
+    
+    @staticmethod
+    def _to_excel_bytes(df: pd.DataFrame) -> bytes:
+        """Write the applications to an in-memory Excel workbook."""
+        excel_buffer = io.BytesIO()
+        df.to_excel(excel_buffer, index=False, engine=EXCEL_ENGINE)
+        return excel_buffer.getvalue()
+    
     def _render_export_options(self, df: pd.DataFrame):
         """Render export options for application data."""
         if df.empty:
@@ -328,34 +532,34 @@ class AppliedJobsTabUI:
         
         st.subheader("📤 Export Options")
         
+        # Exports are serialized only on request and kept until the exported rows change
+        export_key = (self._history_version(), tuple(df.index))
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        
         col1, col2, col3 = st.columns(3)
         
         with col1:
             # Export as CSV
-            csv_buffer = io.StringIO()
-            df.to_csv(csv_buffer, index=False)
-            csv_data = csv_buffer.getvalue()
-            
-            st.download_button(
+            self._render_prepared_download(
+                name="csv",
+                export_key=export_key,
+                build_data=lambda: self._to_csv_bytes(df),
+                prepare_label="📄 Prepare CSV",
                 label="📄 Download as CSV",
-                data=csv_data,
-                file_name=f"applied_jobs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv",
-                use_container_width=True
+                file_name=f"applied_jobs_{timestamp}.csv",
+                mime="text/csv"
             )
         
         with col2:
             # Export as Excel
-            excel_buffer = io.BytesIO()
-            df.to_excel(excel_buffer, index=False, engine='openpyxl')
-            excel_data = excel_buffer.getvalue()
-            
-            st.download_button(
+            self._render_prepared_download(
+                name="excel",
+                export_key=export_key,
+                build_data=lambda: self._to_excel_bytes(df),
+                prepare_label="📊 Prepare Excel",
                 label="📊 Download as Excel",
-                data=excel_data,
-                file_name=f"applied_jobs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
-                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                use_container_width=True
+                file_name=f"applied_jobs_{timestamp}.xlsx",
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
             )
         
         with col3:
@@ -372,16 +576,17 @@ class AppliedJobsTabUI:
         
         st.markdown("---")
         
-        # Load application history
-        df = self.load_application_history()
+        # Load application history; the frame, its metrics and the filter options are
+        # cached per file version, so widget reruns only redo the filtering below
+        df, metrics, options = self._load_history_pipeline()
         
         # Show summary metrics
-        self._render_summary_metrics(df)
+        self._render_summary_metrics(metrics)
         
         st.markdown("---")
         
         # Render filters
-        filtered_df = self._render_filters(df)
+        filtered_df = self._render_filters(df, options)
         
         st.markdown("---")
         
@@ -408,11 +613,13 @@ class AppliedJobsTabUI:
             with col1:
                 st.subheader("📁 File Information")
                 st.info(f"**File Location:** `{self.history_file}`")
-                if os.path.exists(self.history_file):
-                    file_size = os.path.getsize(self.history_file)
-                    st.info(f"**File Size:** {file_size} bytes")
-                    mod_time = datetime.fromtimestamp(os.path.getmtime(self.history_file))
+                try:
+                    file_stat = os.stat(self.history_file)
+                    st.info(f"**File Size:** {file_stat.st_size} bytes")
+                    mod_time = datetime.fromtimestamp(file_stat.st_mtime)
                     st.info(f"**Last Modified:** {mod_time.strftime('%Y-%m-%d %H:%M:%S')}")
+                except FileNotFoundError:
+                    pass
             
             with col2:
                 st.subheader("⚠️ Danger Zone")
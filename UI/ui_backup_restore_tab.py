@@ -2,7 +2,9 @@ import streamlit as st
 import pandas as pd
 from datetime import datetime
 import json
+import io
 from typing import Dict, Any, List, Optional
+from Utils.dataframe_utils import JOBS_DATA_KEY, prepare_jobs_frame, set_session_frame
 
 
 class BackupRestoreTabUI:
@@ -19,6 +21,27 @@ class BackupRestoreTabUI:
         """Initialize the Backup & Restore Tab UI component."""
         pass
     
+    def _read_backup(self, uploaded_file) -> Optional[pd.DataFrame]:
+        """
+        Read jobs data from an uploaded backup file.
+        
+        Args:
+            uploaded_file: Uploaded JSON or Parquet backup
+            
+        Returns:
+            Restored jobs DataFrame, or None if the file is not a recognized backup
+        """
+        if uploaded_file.name.lower().endswith('.parquet'):
+            return pd.read_parquet(uploaded_file)
+        
+        backup_data = json.loads(uploaded_file.read())
+        if 'jobs_json' in backup_data:
+            return pd.read_json(io.StringIO(backup_data['jobs_json']), orient='split', dtype=False)
+        if 'jobs_data' in backup_data:
+            # Backups from older versions store one record per job
+            return pd.DataFrame(backup_data['jobs_data'])
+        return None
+    
     def render(self):
         """Render backup and restore functionality."""
         st.subheader("💾 Backup & Restore")
@@ -29,24 +52,35 @@ class BackupRestoreTabUI:
             st.write("**Create Backup**")
             if st.session_state.get('jobs_data') is not None:
                 backup_name = st.text_input("Backup name", value=f"backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+                backup_format = st.radio("Backup format", ["JSON", "Parquet"], horizontal=True,
+                                         help="Parquet backups are smaller and faster to create and restore")
                 
                 if st.button("📦 Create Backup", type="primary"):
                     try:
-                        # Create backup of current jobs data
-                        backup_data = {
-                            'timestamp': datetime.now().isoformat(),
-                            'jobs_data': st.session_state.jobs_data.to_dict('records'),
-                            'metadata': {
-                                'total_jobs': len(st.session_state.jobs_data),
-                                'columns': list(st.session_state.jobs_data.columns)
+                        if backup_format == "Parquet":
+                            # Columnar binary backup, dtypes included
+                            parquet_buffer = io.BytesIO()
+                            st.session_state.jobs_data.to_parquet(parquet_buffer, compression='zstd', index=False)
+                            backup_bytes = parquet_buffer.getvalue()
+                            backup_mime = "application/octet-stream"
+                        else:
+                            # Create backup of current jobs data, serialized column-wise
+                            backup_data = {
+                                'timestamp': datetime.now().isoformat(),
+                                'jobs_json': st.session_state.jobs_data.to_json(orient='split', index=False, date_format='iso'),
+                                'metadata': {
+                                    'total_jobs': len(st.session_state.jobs_data),
+                                    'columns': list(st.session_state.jobs_data.columns)
+                                }
                             }
-                        }
+                            backup_bytes = json.dumps(backup_data, indent=2, default=str)
+                            backup_mime = "application/json"
                         
                         st.download_button(
                             label="💾 Download Backup",
-                            data=json.dumps(backup_data, indent=2, default=str),
-                            file_name=f"{backup_name}.json",
-                            mime="application/json"
+                            data=backup_bytes,
+                            file_name=f"{backup_name}.{backup_format.lower()}",
+                            mime=backup_mime
                         )
                         st.success("✅ Backup created successfully!")
                     except Exception as e:
@@ -56,16 +90,15 @@ class BackupRestoreTabUI:
         
         with col2:
             st.write("**Restore from Backup**")
-            uploaded_file = st.file_uploader("Choose backup file", type=['json'])
+            uploaded_file = st.file_uploader("Choose backup file", type=['json', 'parquet'])
             
             if uploaded_file is not None:
                 if st.button("🔄 Restore from Backup", type="secondary"):
                     try:
-                        backup_data = json.loads(uploaded_file.read())
+                        restored_df = self._read_backup(uploaded_file)
                         
-                        if 'jobs_data' in backup_data:
-                            restored_df = pd.DataFrame(backup_data['jobs_data'])
-                            st.session_state.jobs_data = restored_df
+                        if restored_df is not None:
+                            set_session_frame(JOBS_DATA_KEY, prepare_jobs_frame(restored_df))
                             st.session_state.last_search_time = datetime.now()
                             
                             st.success(f"✅ Restored {len(restored_df)} jobs from backup!")
@@ -29,8 +29,7 @@ class DataManagementTabUI:
             st.write("**Clear Session Data**")
             if st.button("🗑️ Clear All Session Data", type="secondary"):
                 # Clear session state
-                for key in list(st.session_state.keys()):
-                    del st.session_state[key]
+                st.session_state.clear()
                 st.success("✅ Session data cleared!")
                 st.rerun()
             
@@ -1,6 +1,37 @@
 import streamlit as st
 import pandas as pd
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+from Utils.dataframe_utils import session_frame_version
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _performance_stats(_df: pd.DataFrame, df_key: tuple) -> Dict[str, Any]:
+    """
+    Compute memory, null and dtype stats for a DataFrame in one pass over its columns.
+    
+    Args:
+        _df: DataFrame to analyze (not hashed by Streamlit)
+        df_key: Data version of the DataFrame from session_frame_version, used as the cache key
+        
+    Returns:
+        Dictionary of display-ready stats
+    """
+    memory_bytes = _df.index.memory_usage(deep=True)
+    null_values = 0
+    dtype_counts: Dict[str, int] = {}
+    for _, series in _df.items():
+        memory_bytes += series.memory_usage(index=False, deep=True)
+        null_values += int(series.isna().sum())
+        dtype_name = str(series.dtype)
+        dtype_counts[dtype_name] = dtype_counts.get(dtype_name, 0) + 1
+    
+    return {
+        'Memory usage (MB)': f"{memory_bytes / 1024 / 1024:.2f}",
+        'Total rows': len(_df),
+        'Total columns': len(_df.columns),
+        'Null values': null_values,
+        'Data types': dtype_counts
+    }
 
 
 class DeveloperToolsTabUI:
@@ -25,7 +56,9 @@ class DeveloperToolsTabUI:
             st.write("**Debug Information**")
             
             with st.expander("Session State Contents", expanded=False):
-                st.json(dict(st.session_state))
+                # Session state holds the full jobs DataFrame, so only dump it on request
+                if st.button("🔍 Show Session State", key="show_session_state"):
+                    st.json(dict(st.session_state))
             
             with st.expander("Current Data Sample", expanded=False):
                 if st.session_state.get('jobs_data') is not None:
@@ -37,13 +70,6 @@ class DeveloperToolsTabUI:
         if st.button("📊 Show Performance Stats", type="secondary"):
             if st.session_state.get('jobs_data') is not None:
                 df = st.session_state.jobs_data
-                stats = {
-                    'Memory usage (MB)': f"{df.memory_usage(deep=True).sum() / 1024 / 1024:.2f}",
-                    'Total rows': len(df),
-                    'Total columns': len(df.columns),
-                    'Null values': df.isnull().sum().sum(),
-                    'Data types': df.dtypes.value_counts().to_dict()
-                }
-                st.json(stats)
+                st.json(_performance_stats(df, session_frame_version(df)))
             else:
                 st.info("No data loaded to analyze")
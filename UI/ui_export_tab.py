@@ -2,7 +2,287 @@ import streamlit as st
 import pandas as pd
 import io
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Optional, Dict, Callable, Tuple, IO
+
+from Utils.dataframe_utils import session_frame_version
+
+# xlsxwriter (optional) streams Excel rows in constant memory; openpyxl is the fallback
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+# Rows sampled to estimate the memory held by object columns
+MEMORY_SAMPLE_ROWS = 1000
+
+# Rows sampled to shortlist the columns with the most distinct values, and how many
+# of those columns are then counted exactly
+UNIQUE_SAMPLE_ROWS = 10000
+UNIQUE_CANDIDATE_COLUMNS = 10
+
+# Text columns with fewer distinct values than this share of rows become categoricals
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+
+def _pandas_infers_arrow_strings() -> bool:
+    """Whether pandas already stores text as Arrow strings (pandas 3, or future.infer_string on 2.1+)."""
+    try:
+        return bool(pd.get_option('future.infer_string'))
+    except KeyError:
+        # pandas < 2.1 has no such option; OptionError subclasses KeyError
+        return False
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _with_arrow_strings(_df: pd.DataFrame, df_key: tuple) -> pd.DataFrame:
+    """
+    Store plain-text object columns as Arrow-backed strings.
+    
+    Arrow strings keep their lengths in buffer metadata, so deep memory counts and
+    Parquet/Feather writes don't have to visit each Python str. Cached like
+    _optimize_for_export below.
+    
+    Args:
+        _df: Jobs data (not hashed by Streamlit)
+        df_key: Data version of the jobs data from session_frame_version, used as the cache key
+        
+    Returns:
+        DataFrame with text object columns converted to string[pyarrow]
+    """
+    string_columns = {
+        col: _df[col].astype('string[pyarrow]')
+        for col in _df.columns
+        if _df[col].dtype == object and pd.api.types.infer_dtype(_df[col], skipna=True) == 'string'
+    }
+    return _df.assign(**string_columns) if string_columns else _df
+
+
+# cache_resource hands back the same frame on every rerun instead of a copy; it is shared
+# across sessions, so it is keyed on the content fingerprint, and the frame is only ever read
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _optimize_for_export(_df: pd.DataFrame, df_key: tuple) -> pd.DataFrame:
+    """
+    Convert low-cardinality text columns to the category dtype.
+    
+    Args:
+        _df: Jobs data (not hashed by Streamlit)
+        df_key: Data version of the jobs data from session_frame_version, used as the cache key
+        
+    Returns:
+        DataFrame with repetitive text columns stored as categoricals
+    """
+    categorical_columns = {}
+    for col in _df.select_dtypes(include=['object', 'string']).columns:
+        try:
+            unique_ratio = _df[col].nunique(dropna=False) / len(_df)
+        except TypeError:
+            # Unhashable cells (e.g. lists) can't be categorized
+            continue
+        if unique_ratio < CATEGORY_MAX_UNIQUE_RATIO:
+            categorical_columns[col] = _df[col].astype('category')
+    
+    return _df.assign(**categorical_columns)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _date_posted_range(_dates: pd.Series, df_key: tuple) -> Optional[Tuple[Any, Any]]:
+    """
+    Find the first and last posting dates.
+    
+    Args:
+        _dates: The date_posted column (not hashed by Streamlit)
+        df_key: Content fingerprint of the jobs data and the memory optimization flag, used as the cache key
+        
+    Returns:
+        (min_date, max_date) as dates, or None if no value parses as a date
+    """
+    valid_dates = pd.to_datetime(_dates, errors='coerce').dropna()
+    if valid_dates.empty:
+        return None
+    return valid_dates.min().date(), valid_dates.max().date()
+
+
+def _estimate_memory_usage(df: pd.DataFrame) -> pd.Series:
+    """
+    Estimate memory per column (plus the index) in bytes.
+    
+    Object columns are measured on a sample of rows and scaled up, since a deep
+    memory count has to visit every Python object in them; other columns are exact.
+    
+    Args:
+        df: DataFrame to measure
+        
+    Returns:
+        Bytes per column, indexed like DataFrame.memory_usage
+    """
+    memory_usage = df.memory_usage(deep=False).astype(float)
+    object_columns = [col for col in df.columns if df[col].dtype == object]
+    other_columns = [col for col in df.columns if df[col].dtype != object]
+    
+    if other_columns:
+        memory_usage[other_columns] = df[other_columns].memory_usage(index=False, deep=True)
+    if object_columns and len(df) > 0:
+        sample_df = df[object_columns].head(MEMORY_SAMPLE_ROWS)
+        memory_usage[object_columns] = sample_df.memory_usage(index=False, deep=True) * len(df) / len(sample_df)
+    
+    return memory_usage
+
+
+def _top_unique_counts(df: pd.DataFrame, top_n: int) -> pd.Series:
+    """
+    Find the columns with the most distinct values.
+    
+    On large frames, distinct values are first counted on a sample to pick a few
+    candidate columns; only those are counted exactly.
+    
+    Args:
+        df: DataFrame to analyze
+        top_n: Number of columns to return
+        
+    Returns:
+        Exact distinct counts of the top columns, largest first
+    """
+    candidate_count = max(top_n * 2, UNIQUE_CANDIDATE_COLUMNS)
+    if len(df) > UNIQUE_SAMPLE_ROWS and len(df.columns) > candidate_count:
+        sample_counts = df.sample(UNIQUE_SAMPLE_ROWS, random_state=0).nunique()
+        df = df[sample_counts.nlargest(candidate_count).index]
+    
+    return df.nunique().nlargest(top_n)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _null_counts(_df: pd.DataFrame, df_key: tuple) -> pd.Series:
+    """
+    Count missing values per column in one pass, kept across insight refreshes.
+    
+    Args:
+        _df: Jobs data (not hashed by Streamlit)
+        df_key: Content fingerprint of the jobs data and the memory optimization flag, used as the cache key
+        
+    Returns:
+        Missing values per column
+    """
+    return _df.isna().sum()
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _summary_metrics(_df: pd.DataFrame, df_key: tuple) -> Dict[str, float]:
+    """
+    Compute the export summary metrics.
+    
+    Args:
+        _df: Jobs data (not hashed by Streamlit)
+        df_key: Content fingerprint of the jobs data and the memory optimization flag, used as the cache key
+        
+    Returns:
+        Dictionary with total rows, columns, memory in MB and completeness percentage
+    """
+    total_rows, total_columns = _df.shape
+    memory_bytes = _estimate_memory_usage(_df).sum()
+    
+    total_cells = total_rows * total_columns
+    return {
+        'total': total_rows,
+        'cols': total_columns,
+        'mem_mb': memory_bytes / 1024 / 1024,
+        'completeness': _df.count().sum() / total_cells * 100 if total_cells else 0.0
+    }
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _df_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """
+    Serialize a DataFrame to CSV bytes, cached so unchanged data is not re-serialized on reruns.
+    
+    Args:
+        df: DataFrame to serialize
+        
+    Returns:
+        UTF-8 encoded CSV
+    """
+    # Flatten a MultiIndex first; to_csv takes a much slower path for it
+    if isinstance(df.index, pd.MultiIndex):
+        df = df.reset_index()
+    
+    # Write straight to bytes so the CSV is never held as a str as well
+    buffer = io.BytesIO()
+    df.to_csv(buffer, index=False, encoding='utf-8')
+    return buffer.getvalue()
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _df_to_parquet_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize a DataFrame to Parquet (snappy-compressed) bytes."""
+    buffer = io.BytesIO()
+    df.to_parquet(buffer, engine='pyarrow', compression='snappy', index=False)
+    return buffer.getvalue()
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _df_to_feather_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize a DataFrame to Feather (lz4-compressed) bytes."""
+    buffer = io.BytesIO()
+    df.reset_index(drop=True).to_feather(buffer, compression='lz4')
+    return buffer.getvalue()
+
+
+def _iter_sheet_rows(sheet_df: pd.DataFrame):
+    """Yield the header row, then each data row with missing values as None (empty cells)."""
+    yield [str(col) for col in sheet_df.columns]
+    cell_values = sheet_df.astype(object).where(sheet_df.notna(), None)
+    yield from cell_values.itertuples(index=False, name=None)
+
+
+def _write_xlsx(sheets: Dict[str, pd.DataFrame], output: IO[bytes]) -> None:
+    """
+    Write sheets to a streaming Excel workbook.
+    
+    Rows are written in order and flushed as they go: xlsxwriter's constant_memory
+    mode when it is installed, otherwise openpyxl's write-only mode. Neither keeps
+    every cell object in memory.
+    
+    Args:
+        sheets: Sheet name to DataFrame, in sheet order
+        output: Seekable binary file object that receives the .xlsx file
+    """
+    if XLSXWRITER_AVAILABLE:
+        workbook = xlsxwriter.Workbook(output, {
+            'constant_memory': True,
+            'default_date_format': 'yyyy-mm-dd hh:mm:ss'
+        })
+        for sheet_name, sheet_df in sheets.items():
+            worksheet = workbook.add_worksheet(sheet_name)
+            for row_number, row in enumerate(_iter_sheet_rows(sheet_df)):
+                worksheet.write_row(row_number, 0, row)
+        workbook.close()
+    else:
+        from openpyxl import Workbook
+        
+        workbook = Workbook(write_only=True)
+        for sheet_name, sheet_df in sheets.items():
+            worksheet = workbook.create_sheet(sheet_name)
+            for row in _iter_sheet_rows(sheet_df):
+                worksheet.append(row)
+        workbook.save(output)
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _build_xlsx_bytes(jobs_df: pd.DataFrame,
+                      _build_extra_sheets: Callable[[pd.DataFrame], Dict[str, pd.DataFrame]]) -> bytes:
+    """
+    Build the Excel export: the jobs sheet plus derived sheets.
+    
+    Args:
+        jobs_df: Jobs data, written to the 'Jobs' sheet; the cache key
+        _build_extra_sheets: Builds the additional sheets (sheet name to DataFrame) from jobs_df
+        
+    Returns:
+        The .xlsx file contents
+    """
+    buffer = io.BytesIO()
+    _write_xlsx({'Jobs': jobs_df, **_build_extra_sheets(jobs_df)}, buffer)
+    return buffer.getvalue()
 
 
 class ExportTabUI:
@@ -12,6 +292,7 @@ class ExportTabUI:
     This class handles all data export functionality including:
     - CSV file downloads
     - Excel file downloads
+    - Parquet and Feather file downloads
     - Local file saving
     - Data filtering and export options
     - Export analytics and reporting
@@ -19,7 +300,7 @@ class ExportTabUI:
     
     def __init__(self):
         """Initialize the Export Tab UI component."""
-        pass
+        self._optimize_memory = False
     
     def render(self, jobs_df: pd.DataFrame, job_service: Any) -> None:
         """
@@ -35,63 +316,90 @@ class ExportTabUI:
             st.warning("No job data available for export.")
             return
         
+        # Content fingerprint stored with the jobs data, the key of the data caches below
+        data_key = session_frame_version(jobs_df)
+        
+        # Newer pandas already stores text as Arrow strings; older versions get converted here
+        if not _pandas_infers_arrow_strings():
+            try:
+                jobs_df = _with_arrow_strings(jobs_df, data_key)
+            except ImportError:
+                pass
+        
+        # Opt-in memory optimization, toggled in the advanced export options
+        self._optimize_memory = st.session_state.get('export_optimize_memory', False)
+        if self._optimize_memory:
+            jobs_df = _optimize_for_export(jobs_df, data_key)
+        
+        # Key for caches over the frame as displayed, which differs when memory is optimized
+        df_key = (data_key, self._optimize_memory)
+        
+        # One timestamp for every export filename in this run
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        
         # Display export summary
-        self._render_export_summary(jobs_df)
+        self._render_export_summary(jobs_df, df_key)
         
-        # Export options
-        self._render_export_options(jobs_df, job_service)
+        # Export options (download buttons, advanced options and insights are fragments:
+        # interacting with one reruns only that section instead of the whole app)
+        self._render_export_options(jobs_df, job_service, timestamp)
         
         # Advanced export features
-        self._render_advanced_export_options(jobs_df, job_service)
+        self._render_advanced_export_options(jobs_df, job_service, timestamp, df_key)
         
         # Export history and analytics
-        self._render_export_analytics(jobs_df)
+        self._render_export_analytics(jobs_df, df_key)
     
-    def _render_export_summary(self, jobs_df: pd.DataFrame) -> None:
+    def _render_export_summary(self, jobs_df: pd.DataFrame, df_key: tuple) -> None:
         """Render summary information about the data to be exported."""
         st.markdown("### 📊 Export Summary")
         
+        metrics = _summary_metrics(jobs_df, df_key)
+        
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            total_jobs = len(jobs_df)
-            st.metric("Total Jobs", total_jobs)
+            st.metric("Total Jobs", metrics['total'])
         
         with col2:
-            total_columns = len(jobs_df.columns)
-            st.metric("Total Columns", total_columns)
+            st.metric("Total Columns", metrics['cols'])
         
         with col3:
-            memory_usage = jobs_df.memory_usage(deep=True).sum() / 1024 / 1024  # MB
-            st.metric("Data Size", f"{memory_usage:.2f} MB")
+            st.metric("Data Size", f"~{metrics['mem_mb']:.2f} MB")
         
         with col4:
-            non_null_percentage = (jobs_df.count().sum() / (len(jobs_df) * len(jobs_df.columns)) * 100)
-            st.metric("Data Completeness", f"{non_null_percentage:.1f}%")
+            st.metric("Data Completeness", f"{metrics['completeness']:.1f}%")
     
-    def _render_export_options(self, jobs_df: pd.DataFrame, job_service: Any) -> None:
-        """Render the main export options (CSV, Excel, Local)."""
+    def _render_export_options(self, jobs_df: pd.DataFrame, job_service: Any, timestamp: str) -> None:
+        """Render the main export options (CSV, Excel, Parquet, Feather, Local)."""
         st.markdown("### 📥 Download Options")
         
-        col1, col2, col3 = st.columns(3)
+        col1, col2, col3, col4, col5 = st.columns(5)
         
         with col1:
-            self._render_csv_download(jobs_df)
+            self._render_csv_download(jobs_df, timestamp)
         
         with col2:
-            self._render_excel_download(jobs_df)
+            self._render_excel_download(jobs_df, timestamp)
         
         with col3:
-            self._render_local_save(jobs_df, job_service)
+            self._render_parquet_download(jobs_df, timestamp)
+        
+        with col4:
+            self._render_feather_download(jobs_df, timestamp)
+        
+        with col5:
+            self._render_local_save(jobs_df, job_service, timestamp)
     
-    def _render_csv_download(self, jobs_df: pd.DataFrame) -> None:
+    @st.fragment
+    def _render_csv_download(self, jobs_df: pd.DataFrame, timestamp: str) -> None:
         """Render CSV download button."""
-        csv_data = jobs_df.to_csv(index=False)
-        filename = f"jobs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        filename = f"jobs_{timestamp}.csv"
         
+        # The CSV is generated when the button is clicked, not on every rerun
         st.download_button(
             label="📄 Download as CSV",
-            data=csv_data,
+            data=lambda: _df_to_csv_bytes(jobs_df),
             file_name=filename,
             mime="text/csv",
             use_container_width=True,
@@ -99,30 +407,22 @@ class ExportTabUI:
         )
         
         # Display CSV info
-        csv_size = len(csv_data.encode('utf-8')) / 1024 / 1024  # MB
-        st.caption(f"File size: ~{csv_size:.2f} MB")
+        st.caption("File is generated on download")
     
-    def _render_excel_download(self, jobs_df: pd.DataFrame) -> None:
+    @st.fragment
+    def _render_excel_download(self, jobs_df: pd.DataFrame, timestamp: str) -> None:
         """Render Excel download button."""
         try:
-            buffer = io.BytesIO()
-            filename = f"jobs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+            # The workbook is built on click, so check for a writer up front
+            if not XLSXWRITER_AVAILABLE:
+                import openpyxl
             
-            with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
-                # Main jobs sheet
-                jobs_df.to_excel(writer, sheet_name='Jobs', index=False)
-                
-                # Summary sheet
-                summary_df = self._create_summary_sheet(jobs_df)
-                summary_df.to_excel(writer, sheet_name='Summary', index=False)
-                
-                # Column info sheet
-                column_info_df = self._create_column_info_sheet(jobs_df)
-                column_info_df.to_excel(writer, sheet_name='Column_Info', index=False)
+            filename = f"jobs_{timestamp}.xlsx"
             
+            # Jobs, Summary and Column_Info sheets, generated when the button is clicked
             st.download_button(
                 label="📊 Download as Excel",
-                data=buffer.getvalue(),
+                data=lambda: _build_xlsx_bytes(jobs_df, self._create_excel_extra_sheets),
                 file_name=filename,
                 mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                 use_container_width=True,
@@ -130,8 +430,7 @@ class ExportTabUI:
             )
             
             # Display Excel info
-            excel_size = len(buffer.getvalue()) / 1024 / 1024  # MB
-            st.caption(f"File size: ~{excel_size:.2f} MB")
+            st.caption("File is generated on download")
             st.caption("Includes: Jobs, Summary, Column Info sheets")
             
         except ImportError:
@@ -142,18 +441,63 @@ class ExportTabUI:
             if st.button("🔧 Install openpyxl", use_container_width=True):
                 st.code("pip install openpyxl", language="bash")
     
-    def _render_local_save(self, jobs_df: pd.DataFrame, job_service: Any) -> None:
+    @st.fragment
+    def _render_parquet_download(self, jobs_df: pd.DataFrame, timestamp: str) -> None:
+        """Render Parquet download button."""
+        # The file is built on click, so check for pyarrow up front
+        try:
+            import pyarrow
+        except ImportError as e:
+            st.error(f"❌ Parquet export unavailable: {str(e)}")
+            return
+        
+        st.download_button(
+            label="🗄️ Download as Parquet",
+            data=lambda: _df_to_parquet_bytes(jobs_df),
+            file_name=f"jobs_{timestamp}.parquet",
+            mime="application/vnd.apache.parquet",
+            use_container_width=True,
+            help="Compressed columnar file, fast to load in pandas, Spark or DuckDB"
+        )
+        
+        # Display Parquet info
+        st.caption("File is generated on download")
+    
+    @st.fragment
+    def _render_feather_download(self, jobs_df: pd.DataFrame, timestamp: str) -> None:
+        """Render Feather download button."""
+        # The file is built on click, so check for pyarrow up front
+        try:
+            import pyarrow
+        except ImportError as e:
+            st.error(f"❌ Feather export unavailable: {str(e)}")
+            return
+        
+        st.download_button(
+            label="🪶 Download as Feather",
+            data=lambda: _df_to_feather_bytes(jobs_df),
+            file_name=f"jobs_{timestamp}.feather",
+            mime="application/vnd.apache.arrow.file",
+            use_container_width=True,
+            help="Arrow IPC file, the fastest format to read back into pandas"
+        )
+        
+        # Display Feather info
+        st.caption("File is generated on download")
+    
+    def _render_local_save(self, jobs_df: pd.DataFrame, job_service: Any, timestamp: str) -> None:
         """Render local save option."""
         if st.button("💾 Save to Local CSV", use_container_width=True, help="Save file to the application's local directory"):
             try:
-                filename = f"jobs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+                filename = f"jobs_{timestamp}.csv"
                 job_service.save_jobs_to_csv(jobs_df, filename)
                 st.success(f"✅ Data saved to {filename}")
                 st.info(f"📁 File saved in the application directory")
             except Exception as e:
                 st.error(f"❌ Error saving file: {str(e)}")
     
-    def _render_advanced_export_options(self, jobs_df: pd.DataFrame, job_service: Any) -> None:
+    @st.fragment
+    def _render_advanced_export_options(self, jobs_df: pd.DataFrame, job_service: Any, timestamp: str, df_key: tuple) -> None:
         """Render advanced export options with filtering and customization."""
         st.markdown("### ⚙️ Advanced Export Options")
         
@@ -170,6 +514,16 @@ class ExportTabUI:
                     default=available_columns,
                     key="export_columns"
                 )
+                
+                # Memory optimization applies to every export on this tab, so a change
+                # needs a full rerun rather than just this fragment
+                optimize_memory = st.checkbox(
+                    "Optimize memory (category dtype)",
+                    key="export_optimize_memory",
+                    help="Store repetitive text columns as categories to cut memory use and speed up exports"
+                )
+                if optimize_memory != self._optimize_memory:
+                    st.rerun()
             
             with col2:
                 # Row filtering options
@@ -190,13 +544,11 @@ class ExportTabUI:
                     filter_by_date = st.checkbox("Filter by date range", key="export_date_filter")
                     if filter_by_date:
                         try:
-                            jobs_df_temp = jobs_df.copy()
-                            jobs_df_temp['date_posted'] = pd.to_datetime(jobs_df_temp['date_posted'], errors='coerce')
-                            valid_dates = jobs_df_temp['date_posted'].dropna()
+                            # Only the date column is converted, and only once per dataset
+                            posted_range = _date_posted_range(jobs_df['date_posted'], df_key)
                             
-                            if len(valid_dates) > 0:
-                                min_date = valid_dates.min().date()
-                                max_date = valid_dates.max().date()
+                            if posted_range is not None:
+                                min_date, max_date = posted_range
                                 
                                 date_range = st.date_input(
                                     "Select date range",
@@ -219,11 +571,11 @@ class ExportTabUI:
                 
                 with col1:
                     if st.button("📄 Export Filtered CSV", use_container_width=True):
-                        csv_data = filtered_df.to_csv(index=False)
+                        csv_data = _df_to_csv_bytes(filtered_df)
                         st.download_button(
                             label="⬇️ Download Filtered CSV",
                             data=csv_data,
-                            file_name=f"jobs_filtered_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                            file_name=f"jobs_filtered_{timestamp}.csv",
                             mime="text/csv",
                             key="download_filtered_csv"
                         )
@@ -231,14 +583,17 @@ class ExportTabUI:
                 with col2:
                     if st.button("📊 Export Filtered Excel", use_container_width=True):
                         try:
+                            if not XLSXWRITER_AVAILABLE:
+                                import openpyxl
+                            
                             buffer = io.BytesIO()
-                            with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
-                                filtered_df.to_excel(writer, sheet_name='Filtered_Jobs', index=False)
+                            _write_xlsx({'Filtered_Jobs': filtered_df}, buffer)
+                            excel_data = buffer.getvalue()
                             
                             st.download_button(
                                 label="⬇️ Download Filtered Excel",
-                                data=buffer.getvalue(),
-                                file_name=f"jobs_filtered_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
+                                data=excel_data,
+                                file_name=f"jobs_filtered_{timestamp}.xlsx",
                                 mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                                 key="download_filtered_excel"
                             )
@@ -251,51 +606,77 @@ class ExportTabUI:
                         if len(filtered_df) > 10:
                             st.caption(f"Showing first 10 rows of {len(filtered_df)} total rows")
     
-    def _render_export_analytics(self, jobs_df: pd.DataFrame) -> None:
+    @st.fragment
+    def _render_export_analytics(self, jobs_df: pd.DataFrame, df_key: tuple) -> None:
         """Render export analytics and data insights."""
         with st.expander("📈 Data Insights", expanded=False):
-            col1, col2 = st.columns(2)
+            # The expander body runs even while collapsed, so the scans wait for a click
+            if not st.session_state.get('insights_computed', False):
+                st.button(
+                    "📈 Compute insights",
+                    on_click=lambda: st.session_state.update(insights_computed=True),
+                    key="compute_insights"
+                )
+                return
             
-            with col1:
-                st.markdown("**📊 Column Statistics:**")
-                
-                # Data types
-                dtype_counts = jobs_df.dtypes.value_counts()
-                st.write("Data Types:")
-                for dtype, count in dtype_counts.items():
-                    st.write(f"  • {dtype}: {count} columns")
-                
-                # Missing data analysis
-                st.write("\n**Missing Data:**")
-                missing_data = jobs_df.isnull().sum()
-                missing_data = missing_data[missing_data > 0].sort_values(ascending=False)
-                
-                if len(missing_data) > 0:
-                    for col, missing_count in missing_data.head(5).items():
-                        percentage = (missing_count / len(jobs_df)) * 100
-                        st.write(f"  • {col}: {missing_count} ({percentage:.1f}%)")
-                else:
-                    st.write("  • No missing data found! 🎉")
+            self._render_data_insights(jobs_df, df_key)
+            st.button("🔄 Refresh insights", key="refresh_insights")
+    
+    def _render_data_insights(self, jobs_df: pd.DataFrame, df_key: tuple) -> None:
+        """Render column statistics and content analysis for the jobs data."""
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("**📊 Column Statistics:**")
             
-            with col2:
-                st.markdown("**🔍 Content Analysis:**")
-                
-                # Unique values analysis
-                st.write("Unique Values (top columns):")
-                unique_counts = jobs_df.nunique().sort_values(ascending=False)
-                for col, unique_count in unique_counts.head(5).items():
-                    percentage = (unique_count / len(jobs_df)) * 100
-                    st.write(f"  • {col}: {unique_count} ({percentage:.1f}%)")
-                
-                # Memory usage by column
-                st.write("\n**Memory Usage (top columns):**")
-                memory_usage = jobs_df.memory_usage(deep=True).sort_values(ascending=False)
-                for col, memory in memory_usage.head(5).items():
-                    memory_mb = memory / 1024 / 1024
-                    st.write(f"  • {col}: {memory_mb:.2f} MB")
+            # Data types
+            dtype_counts = jobs_df.dtypes.value_counts()
+            st.write("Data Types:")
+            for dtype, count in dtype_counts.items():
+                st.write(f"  • {dtype}: {count} columns")
+            
+            # Missing data analysis
+            st.write("\n**Missing Data:**")
+            missing_data = _null_counts(jobs_df, df_key)
+            missing_data = missing_data[missing_data > 0].sort_values(ascending=False)
+            
+            if len(missing_data) > 0:
+                for col, missing_count in missing_data.head(5).items():
+                    percentage = (missing_count / len(jobs_df)) * 100
+                    st.write(f"  • {col}: {missing_count} ({percentage:.1f}%)")
+            else:
+                st.write("  • No missing data found! 🎉")
+        
+        with col2:
+            st.markdown("**🔍 Content Analysis:**")
+            
+            # Unique values analysis
+            st.write("Unique Values (top columns):")
+            unique_counts = _top_unique_counts(jobs_df, 5)
+            for col, unique_count in unique_counts.items():
+                percentage = (unique_count / len(jobs_df)) * 100
+                st.write(f"  • {col}: {unique_count} ({percentage:.1f}%)")
+            
+            # Memory usage by column
+            st.write("\n**Memory Usage (top columns):**")
+            memory_usage = _estimate_memory_usage(jobs_df).nlargest(5)
+            for col, memory in memory_usage.items():
+                memory_mb = memory / 1024 / 1024
+                st.write(f"  • {col}: {memory_mb:.2f} MB")
+    
+    def _create_excel_extra_sheets(self, jobs_df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """Create the Summary and Column_Info sheets for the Excel export."""
+        return {
+            'Summary': self._create_summary_sheet(jobs_df),
+            'Column_Info': self._create_column_info_sheet(jobs_df)
+        }
     
     def _create_summary_sheet(self, jobs_df: pd.DataFrame) -> pd.DataFrame:
         """Create a summary sheet for Excel export."""
+        # One mask per column, shared by the metrics that need it
+        salary_series = jobs_df.loc[jobs_df['min_amount'] > 0, 'min_amount'] if 'min_amount' in jobs_df.columns else None
+        remote_count = int((jobs_df['is_remote'] == True).sum()) if 'is_remote' in jobs_df.columns else 'N/A'
+        
         summary_data = {
             'Metric': [
                 'Total Jobs',
@@ -311,9 +692,9 @@ class ExportTabUI:
                 len(jobs_df),
                 len(jobs_df.columns),
                 jobs_df['company'].nunique() if 'company' in jobs_df.columns else 'N/A',
-                len(jobs_df[jobs_df.get('is_remote', False) == True]) if 'is_remote' in jobs_df.columns else 'N/A',
-                len(jobs_df[jobs_df.get('min_amount', 0) > 0]) if 'min_amount' in jobs_df.columns else 'N/A',
-                f"${jobs_df[jobs_df.get('min_amount', 0) > 0]['min_amount'].mean():,.0f}" if 'min_amount' in jobs_df.columns and len(jobs_df[jobs_df.get('min_amount', 0) > 0]) > 0 else 'N/A',
+                remote_count,
+                salary_series.size if salary_series is not None else 'N/A',
+                f"${salary_series.mean():,.0f}" if salary_series is not None and salary_series.size > 0 else 'N/A',
                 f"{(jobs_df.count().sum() / (len(jobs_df) * len(jobs_df.columns)) * 100):.1f}%",
                 datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             ]
@@ -323,35 +704,49 @@ class ExportTabUI:
     
     def _create_column_info_sheet(self, jobs_df: pd.DataFrame) -> pd.DataFrame:
         """Create a column information sheet for Excel export."""
-        column_info = []
-        
-        for col in jobs_df.columns:
-            non_null_count = jobs_df[col].count()
-            null_count = jobs_df[col].isnull().sum()
-            null_percentage = (null_count / len(jobs_df)) * 100
-            data_type = str(jobs_df[col].dtype)
-            unique_count = jobs_df[col].nunique()
-            
-            column_info.append({
-                'Column_Name': col,
-                'Data_Type': data_type,
-                'Non_Null_Count': non_null_count,
-                'Null_Count': null_count,
-                'Null_Percentage': f"{null_percentage:.1f}%",
-                'Unique_Values': unique_count,
-                'Sample_Value': str(jobs_df[col].dropna().iloc[0]) if non_null_count > 0 else 'N/A'
-            })
-        
-        return pd.DataFrame(column_info)
+        # One null-count pass shared by the count and percentage columns; the whole sheet is
+        # built inside the content-keyed _build_xlsx_bytes cache
+        null_counts = jobs_df.isna().sum().to_numpy()
+        non_null_counts = len(jobs_df) - null_counts
+        
+        return pd.DataFrame({
+            'Column_Name': jobs_df.columns,
+            'Data_Type': jobs_df.dtypes.astype(str).to_numpy(),
+            'Non_Null_Count': non_null_counts,
+            'Null_Count': null_counts,
+            'Null_Percentage': [f"{null_count / len(jobs_df) * 100:.1f}%" for null_count in null_counts],
+            'Unique_Values': jobs_df.nunique().to_numpy(),
+            'Sample_Value': [
+                self._first_valid_value(jobs_df.iloc[:, i]) if non_null_counts[i] > 0 else 'N/A'
+                for i in range(len(jobs_df.columns))
+            ]
+        })
+    
+    @staticmethod
+    def _first_valid_value(series: pd.Series) -> str:
+        """Return the first non-null value of a column as a string, checking the first row before scanning."""
+        if series.iloc[:1].notna().iat[0]:
+            return str(series.iat[0])
+        return str(series.dropna().iat[0])
     
     def _apply_export_filters(self, jobs_df: pd.DataFrame, selected_columns: list, max_rows: int) -> pd.DataFrame:
-        """Apply export filters to the dataframe."""
-        # Start with selected columns
-        filtered_df = jobs_df[selected_columns].copy()
+        """
+        Apply export filters to the dataframe.
+        
+        The result shares data with jobs_df where pandas allows it and is meant to be
+        read-only; the export writers never modify it.
         
-        # Apply row limit if specified
-        if max_rows > 0 and max_rows < len(filtered_df):
-            filtered_df = filtered_df.head(max_rows)
+        Args:
+            jobs_df: DataFrame containing job data
+            selected_columns: Columns to export
+            max_rows: Maximum number of rows to export (0 = all)
+            
+        Returns:
+            Filtered DataFrame
+        """
+        # Apply the row limit first so only the needed rows are sliced
+        if max_rows > 0 and max_rows < len(jobs_df):
+            jobs_df = jobs_df.iloc[:max_rows]
         
-        return filtered_df
+        return jobs_df.loc[:, selected_columns]
  
\ No newline at end of file
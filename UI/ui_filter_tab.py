@@ -1,11 +1,127 @@
 
 import streamlit as st
 import pandas as pd
+import numpy as np
+from collections import deque
 from datetime import datetime, timedelta
+from itertools import islice
 from typing import Dict, Any, List, Optional, Tuple
 
 # Import AI helper
-from .helper_ai_filter_tab import AIFilterHelper
+from .helper_ai_filter_tab import AIFilterHelper, _equals_mask
+
+# Columns offered as dropdown filters
+FILTER_OPTION_COLUMNS = ['company', 'job_type', 'location', 'site', 'job_level']
+
+
+def _sorted_options(values: pd.Series) -> List[Any]:
+    """Sorted distinct non-null values; categoricals reuse their category index instead of sorting strings."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        categories = values.cat.categories
+        codes = values.cat.codes.to_numpy()
+        
+        # Only categories that still occur, e.g. after the frame was sliced by AI search
+        present = np.bincount(codes[codes >= 0], minlength=len(categories)) > 0
+        observed = categories[present]
+        return observed.tolist() if observed.is_monotonic_increasing else sorted(observed.tolist())
+    
+    return sorted(values.dropna().unique().tolist())
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _cached_filter_options(df_key: tuple, _jobs_df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Cached dropdown options and summary counts for the filter tab; the dataframe itself is not hashed.
+    
+    Args:
+        df_key: Data version of the jobs data from AIFilterHelper.get_data_version
+        _jobs_df: DataFrame containing job data
+        
+    Returns:
+        Dict[str, Any]: Sorted option lists per filter column ('options') and the summary counts
+    """
+    jobs_df = _jobs_df
+    options = {
+        col: _sorted_options(jobs_df[col])
+        for col in FILTER_OPTION_COLUMNS if col in jobs_df.columns
+    }
+    
+    return {
+        'options': options,
+        # The option lists hold each distinct non-null value once, so they double as nunique()
+        'companies': len(options.get('company', [])),
+        'job_types': len(options.get('job_type', [])),
+        'locations': len(options.get('location', [])),
+        'with_salary': int((jobs_df['min_amount'] > 0).sum()) if 'min_amount' in jobs_df.columns else 0
+    }
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _cached_parsed_dates(df_key: tuple, _jobs_df: pd.DataFrame) -> pd.Series:
+    """
+    Parse date_posted once per dataset; the dataframe itself is not hashed.
+    
+    Args:
+        df_key: Data version of the jobs data from AIFilterHelper.get_data_version
+        _jobs_df: DataFrame containing job data
+        
+    Returns:
+        pd.Series: date_posted as datetime64, with unparseable values as NaT
+    """
+    return pd.to_datetime(_jobs_df['date_posted'], errors='coerce')
+
+
+# cache_resource hands back the same Series instead of unpickling a copy of every
+# (possibly long) description on each rerun; the Series is only ever read. It is shared
+# across sessions, so the key must be the content fingerprint, never the frame's identity
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _cached_lowercase_text(df_key: tuple, _jobs_df: pd.DataFrame, column: str) -> pd.Series:
+    """
+    Lowercase a text column once per dataset; the dataframe itself is not hashed.
+    
+    Args:
+        df_key: Data version of the jobs data from AIFilterHelper.get_data_version
+        _jobs_df: DataFrame containing job data
+        column: Text column to lowercase
+        
+    Returns:
+        pd.Series: Lowercased strings, with missing values kept as NA
+    """
+    return _jobs_df[column].astype('string').str.lower()
+
+
+def _lowercase_contains_mask(jobs_df: pd.DataFrame, df_key: tuple, column: str, query: str) -> np.ndarray:
+    """Case-insensitive literal substring mask, matched against the cached lowercased column."""
+    lowered = _cached_lowercase_text(df_key, jobs_df, column)
+    return lowered.str.contains(query.lower(), regex=False, na=False).to_numpy(dtype=bool)
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _cached_salary_order(df_key: tuple, _jobs_df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sort min_amount once per dataset; the dataframe itself is not hashed.
+    
+    Args:
+        df_key: Data version of the jobs data from AIFilterHelper.get_data_version
+        _jobs_df: DataFrame containing job data
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Ascending salaries (NaN last) and the permutation that produces them
+    """
+    values = pd.to_numeric(_jobs_df['min_amount'], errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+    order = np.argsort(values, kind='stable')
+    return values[order], order
+
+
+def _salary_range_mask(jobs_df: pd.DataFrame, df_key: tuple, min_salary: float, max_salary: float) -> np.ndarray:
+    """Mask of min_salary <= min_amount <= max_salary, located by binary search in the cached sorted salaries."""
+    sorted_values, order = _cached_salary_order(df_key, jobs_df)
+    
+    lo = np.searchsorted(sorted_values, min_salary, side='left')
+    hi = np.searchsorted(sorted_values, max_salary, side='right')
+    keep = np.zeros(len(order), dtype=bool)
+    keep[order[lo:hi]] = True
+    return keep
 
 
 class FilterTabUI:
@@ -32,7 +148,7 @@ class FilterTabUI:
             st.session_state[f"{self.session_key_prefix}saved_filters"] = {}
         
         if f"{self.session_key_prefix}filter_history" not in st.session_state:
-            st.session_state[f"{self.session_key_prefix}filter_history"] = []
+            st.session_state[f"{self.session_key_prefix}filter_history"] = deque(maxlen=10)
     
     def render(self, jobs_df: pd.DataFrame) -> None:
         """
@@ -47,26 +163,46 @@ class FilterTabUI:
             st.warning("No job data available for filtering.")
             return
         
+        self._render_filter_workspace(jobs_df)
+    
+    @st.fragment
+    def _render_filter_workspace(self, jobs_df: pd.DataFrame) -> None:
+        """
+        Render AI search, filter controls and results as a fragment.
+        
+        Widget changes in here (including the AI-based filters) rerun only this
+        fragment instead of the whole dashboard script.
+        
+        Args:
+            jobs_df: DataFrame containing job data
+        """
         # AI-powered search section
         ai_filtered_df = self.ai_helper.render_ai_search_section(jobs_df)
         
         # Use AI-filtered results if available, otherwise use original
         current_jobs_df = ai_filtered_df if ai_filtered_df is not None else jobs_df
         
+        # Content fingerprint of the frame being filtered, stored with it in session state
+        # and shared by its caches
+        df_key = self.ai_helper.get_data_version(current_jobs_df)
+        
+        # Dropdown options and summary counts, computed once per dataset
+        filter_data = _cached_filter_options(df_key, current_jobs_df)
+        
         # Filter summary
-        self._render_filter_summary(current_jobs_df)
+        self._render_filter_summary(filter_data)
         
         # Main filter controls
-        filters = self._render_filter_controls(current_jobs_df)
+        filters = self._render_filter_controls(current_jobs_df, filter_data['options'])
         
         # Advanced filter options
-        advanced_filters = self._render_advanced_filters(current_jobs_df)
+        advanced_filters = self._render_advanced_filters(current_jobs_df, filter_data['options'], df_key)
         
         # Combine all filters
         all_filters = {**filters, **advanced_filters}
         
         # Apply filters
-        filtered_df = self._apply_filters(current_jobs_df, all_filters)
+        filtered_df = self._apply_filters(current_jobs_df, all_filters, df_key)
         
         # Save filter to history
         self._save_filter_to_history(all_filters, len(filtered_df))
@@ -77,27 +213,23 @@ class FilterTabUI:
         # Filter management
         self._render_filter_management(all_filters)
     
-    def _render_filter_summary(self, jobs_df: pd.DataFrame) -> None:
+    def _render_filter_summary(self, filter_data: Dict[str, Any]) -> None:
         """Render summary of available filter options."""
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            unique_companies = jobs_df['company'].nunique() if 'company' in jobs_df.columns else 0
-            st.metric("Companies", unique_companies)
+            st.metric("Companies", filter_data['companies'])
         
         with col2:
-            unique_job_types = jobs_df['job_type'].nunique() if 'job_type' in jobs_df.columns else 0
-            st.metric("Job Types", unique_job_types)
+            st.metric("Job Types", filter_data['job_types'])
         
         with col3:
-            unique_locations = jobs_df['location'].nunique() if 'location' in jobs_df.columns else 0
-            st.metric("Locations", unique_locations)
+            st.metric("Locations", filter_data['locations'])
         
         with col4:
-            jobs_with_salary = len(jobs_df[jobs_df.get('min_amount', 0) > 0]) if 'min_amount' in jobs_df.columns else 0
-            st.metric("Jobs with Salary", jobs_with_salary)
+            st.metric("Jobs with Salary", filter_data['with_salary'])
     
-    def _render_filter_controls(self, jobs_df: pd.DataFrame) -> Dict[str, Any]:
+    def _render_filter_controls(self, jobs_df: pd.DataFrame, options: Dict[str, List[Any]]) -> Dict[str, Any]:
         """Render basic filter control widgets and return filter values."""
         st.markdown("### 🎯 Basic Filters")
         
@@ -108,7 +240,7 @@ class FilterTabUI:
         with col1:
             # Company filter
             if 'company' in jobs_df.columns:
-                companies = ['All'] + sorted(jobs_df['company'].dropna().unique().tolist())
+                companies = ['All'] + options['company']
                 filters['company'] = st.selectbox(
                     "🏢 Filter by Company", 
                     companies,
@@ -118,7 +250,7 @@ class FilterTabUI:
         with col2:
             # Job type filter
             if 'job_type' in jobs_df.columns:
-                job_types = ['All'] + sorted(jobs_df['job_type'].dropna().unique().tolist())
+                job_types = ['All'] + options['job_type']
                 filters['job_type'] = st.selectbox(
                     "💼 Filter by Job Type", 
                     job_types,
@@ -183,8 +315,8 @@ class FilterTabUI:
             )
             filters['min_salary'], filters['max_salary'] = salary_range
     
-    def _render_advanced_filters(self, jobs_df: pd.DataFrame) -> Dict[str, Any]:
-        """Render advanced filter options."""
+    def _render_advanced_filters(self, jobs_df: pd.DataFrame, options: Dict[str, List[Any]], df_key: tuple) -> Dict[str, Any]:
+        """Render advanced filter options; df_key is the data version of jobs_df."""
         advanced_filters = {}
         
         with st.expander("⚙️ Advanced Filters", expanded=False):
@@ -193,7 +325,7 @@ class FilterTabUI:
             with col1:
                 # Location filter
                 if 'location' in jobs_df.columns:
-                    locations = ['All'] + sorted(jobs_df['location'].dropna().unique().tolist())
+                    locations = ['All'] + options['location']
                     advanced_filters['location'] = st.selectbox(
                         "📍 Filter by Location",
                         locations,
@@ -202,7 +334,7 @@ class FilterTabUI:
                 
                 # Site filter
                 if 'site' in jobs_df.columns:
-                    sites = ['All'] + sorted(jobs_df['site'].dropna().unique().tolist())
+                    sites = ['All'] + options['site']
                     advanced_filters['site'] = st.selectbox(
                         "🌐 Filter by Site",
                         sites,
@@ -211,7 +343,7 @@ class FilterTabUI:
                 
                 # Experience level filter
                 if 'job_level' in jobs_df.columns:
-                    job_levels = ['All'] + sorted(jobs_df['job_level'].dropna().unique().tolist())
+                    job_levels = ['All'] + options['job_level']
                     advanced_filters['job_level'] = st.selectbox(
                         "📊 Filter by Experience Level",
                         job_levels,
@@ -219,19 +351,22 @@ class FilterTabUI:
                     )
             
             with col2:
-                # Text search in job titles
-                advanced_filters['title_search'] = st.text_input(
-                    "🔍 Search in Job Titles",
-                    placeholder="e.g., Python, Senior, Manager",
-                    key=f"{self.session_key_prefix}title_search"
-                )
-                
-                # Text search in descriptions
-                advanced_filters['description_search'] = st.text_input(
-                    "📝 Search in Descriptions",
-                    placeholder="e.g., React, AWS, Machine Learning",
-                    key=f"{self.session_key_prefix}description_search"
-                )
+                # Text searches in a form so filtering only reruns on Enter / Apply, not per edit
+                with st.form(f"{self.session_key_prefix}text_search_form", border=False):
+                    # Text search in job titles
+                    advanced_filters['title_search'] = st.text_input(
+                        "🔍 Search in Job Titles",
+                        placeholder="e.g., Python, Senior, Manager",
+                        key=f"{self.session_key_prefix}title_search"
+                    )
+                    
+                    # Text search in descriptions
+                    advanced_filters['description_search'] = st.text_input(
+                        "📝 Search in Descriptions",
+                        placeholder="e.g., React, AWS, Machine Learning",
+                        key=f"{self.session_key_prefix}description_search"
+                    )
+                    st.form_submit_button("Apply Text Search")
                 
                 # Hiring manager filter
                 if 'hiring_managers_count' in jobs_df.columns:
@@ -243,7 +378,7 @@ class FilterTabUI:
             
             # Date filters
             if 'date_posted' in jobs_df.columns:
-                self._render_date_filters(jobs_df, advanced_filters)
+                self._render_date_filters(jobs_df, advanced_filters, df_key)
             
             # Company rating filter
             if 'company_rating' in jobs_df.columns:
@@ -262,18 +397,16 @@ class FilterTabUI:
                     )
             
             # AI-based filters (if AI tags are available)
-            self.ai_helper.render_ai_filters(jobs_df, advanced_filters)
+            self.ai_helper.render_ai_filters(jobs_df, advanced_filters, df_key)
         
         return advanced_filters
     
-    def _render_date_filters(self, jobs_df: pd.DataFrame, advanced_filters: Dict[str, Any]) -> None:
-        """Render date-based filters."""
+    def _render_date_filters(self, jobs_df: pd.DataFrame, advanced_filters: Dict[str, Any], df_key: tuple) -> None:
+        """Render date-based filters; df_key is the data version of jobs_df."""
         st.markdown("**📅 Date Filters**")
         
         try:
-            jobs_df_temp = jobs_df.copy()
-            jobs_df_temp['date_posted'] = pd.to_datetime(jobs_df_temp['date_posted'], errors='coerce')
-            valid_dates = jobs_df_temp['date_posted'].dropna()
+            valid_dates = _cached_parsed_dates(df_key, jobs_df).dropna()
             
             if len(valid_dates) > 0:
                 min_date = valid_dates.min().date()
@@ -321,84 +454,92 @@ class FilterTabUI:
         except Exception:
             st.info("Date filtering not available - invalid date format")
     
-    def _apply_filters(self, jobs_df: pd.DataFrame, filters: Dict[str, Any]) -> pd.DataFrame:
-        """Apply all filters to the jobs dataframe."""
-        filtered_df = jobs_df.copy()
+    def _apply_filters(self, jobs_df: pd.DataFrame, filters: Dict[str, Any], df_key: tuple) -> pd.DataFrame:
+        """Apply all filters to the jobs dataframe; df_key is the data version of jobs_df."""
+        # Nothing moved off its default: skip mask building and the AI filter pass.
+        # Salary and rating bounds always count as active since they drop rows without a value.
+        if all(value in (None, '', 'All') for key, value in filters.items() if key != 'remote'):
+            return jobs_df
+        
+        # One boolean mask per active filter, all against the unfiltered frame,
+        # combined and sliced once at the end
+        masks = []
         
         # Basic filters
         if filters.get('company') and filters['company'] != 'All':
-            filtered_df = filtered_df[filtered_df['company'] == filters['company']]
+            masks.append(_equals_mask(jobs_df['company'], filters['company']))
         
         if filters.get('job_type') and filters['job_type'] != 'All':
-            filtered_df = filtered_df[filtered_df['job_type'] == filters['job_type']]
+            masks.append(_equals_mask(jobs_df['job_type'], filters['job_type']))
         
         if filters.get('remote_value') is not None:
-            filtered_df = filtered_df[filtered_df['is_remote'] == filters['remote_value']]
+            masks.append((jobs_df['is_remote'] == filters['remote_value']).to_numpy(dtype=bool))
         
         # Salary filters
         if 'min_salary' in filters and 'max_salary' in filters:
-            salary_mask = (
-                (filtered_df['min_amount'] >= filters['min_salary']) & 
-                (filtered_df['min_amount'] <= filters['max_salary'])
-            )
-            filtered_df = filtered_df[salary_mask]
+            masks.append(_salary_range_mask(jobs_df, df_key, filters['min_salary'], filters['max_salary']))
         
         # Advanced filters
         if filters.get('location') and filters['location'] != 'All':
-            filtered_df = filtered_df[filtered_df['location'] == filters['location']]
+            masks.append(_equals_mask(jobs_df['location'], filters['location']))
         
         if filters.get('site') and filters['site'] != 'All':
-            filtered_df = filtered_df[filtered_df['site'] == filters['site']]
+            masks.append(_equals_mask(jobs_df['site'], filters['site']))
         
         if filters.get('job_level') and filters['job_level'] != 'All':
-            filtered_df = filtered_df[filtered_df['job_level'] == filters['job_level']]
+            masks.append(_equals_mask(jobs_df['job_level'], filters['job_level']))
         
-        # Text search filters
+        # Text search filters (literal, case-insensitive substring match)
         if filters.get('title_search'):
-            title_mask = filtered_df['title'].str.contains(
-                filters['title_search'], case=False, na=False
-            )
-            filtered_df = filtered_df[title_mask]
+            masks.append(_lowercase_contains_mask(jobs_df, df_key, 'title', filters['title_search']))
         
-        if filters.get('description_search') and 'description' in filtered_df.columns:
-            desc_mask = filtered_df['description'].str.contains(
-                filters['description_search'], case=False, na=False
-            )
-            filtered_df = filtered_df[desc_mask]
+        if filters.get('description_search') and 'description' in jobs_df.columns:
+            masks.append(_lowercase_contains_mask(jobs_df, df_key, 'description', filters['description_search']))
         
         # Hiring manager filter
-        if filters.get('has_hiring_managers'):
+        if filters.get('has_hiring_managers') and 'hiring_managers_count' in jobs_df.columns:
             if filters['has_hiring_managers'] == 'With Hiring Managers':
-                filtered_df = filtered_df[filtered_df.get('hiring_managers_count', 0) > 0]
+                masks.append((jobs_df['hiring_managers_count'] > 0).to_numpy(dtype=bool))
             elif filters['has_hiring_managers'] == 'Without Hiring Managers':
-                filtered_df = filtered_df[filtered_df.get('hiring_managers_count', 0) == 0]
+                masks.append((jobs_df['hiring_managers_count'] == 0).to_numpy(dtype=bool))
         
         # Date filters
         if 'date_from' in filters and 'date_to' in filters:
             try:
-                filtered_df_temp = filtered_df.copy()
-                filtered_df_temp['date_posted'] = pd.to_datetime(filtered_df_temp['date_posted'], errors='coerce')
+                dates = _cached_parsed_dates(df_key, jobs_df)
                 
-                date_mask = (
-                    (filtered_df_temp['date_posted'].dt.date >= filters['date_from']) &
-                    (filtered_df_temp['date_posted'].dt.date <= filters['date_to'])
-                )
-                filtered_df = filtered_df[date_mask]
+                # Compare whole days as datetime64 bounds instead of building .dt.date objects
+                tz = dates.dt.tz
+                start = pd.Timestamp(filters['date_from'], tz=tz)
+                end = pd.Timestamp(filters['date_to'], tz=tz) + pd.Timedelta(days=1)
+                date_mask = (dates >= start) & (dates < end)
+                masks.append(date_mask.to_numpy(dtype=bool))
             except Exception:
                 pass
         
         # Rating filter
-        if 'min_rating' in filters and 'company_rating' in filtered_df.columns:
-            rating_mask = filtered_df['company_rating'] >= filters['min_rating']
-            filtered_df = filtered_df[rating_mask]
+        if 'min_rating' in filters and 'company_rating' in jobs_df.columns:
+            masks.append((jobs_df['company_rating'] >= filters['min_rating']).to_numpy(dtype=bool))
+        
+        filtered_df = jobs_df[np.logical_and.reduce(masks)] if masks else jobs_df
         
         # AI-based filters
         filtered_df = self.ai_helper.apply_ai_filters(filtered_df, filters)
         
         return filtered_df
     
+    @st.fragment
     def _render_filter_results(self, filtered_df: pd.DataFrame, original_df: pd.DataFrame) -> None:
-        """Render filtered job results with multiple display options."""
+        """
+        Render filtered job results with multiple display options as a fragment.
+        
+        Changing the display format, page size, page or table columns reruns only
+        this fragment, so the filters are not re-applied.
+        
+        Args:
+            filtered_df: DataFrame after all filters were applied
+            original_df: Unfiltered DataFrame, for the percentage metric
+        """
         st.markdown("### 📊 Filter Results")
         
         # Results summary
@@ -470,23 +611,34 @@ class FilterTabUI:
         )
         
         if selected_columns:
+            # Positional row/column take in one step instead of a label-based column copy
             st.dataframe(
-                display_df[selected_columns],
+                display_df.iloc[:, display_df.columns.get_indexer(selected_columns)],
                 use_container_width=True,
                 hide_index=True
             )
     
     def _render_card_view(self, display_df: pd.DataFrame) -> None:
         """Render results in card format with company logos."""
-        for idx, job in display_df.iterrows():
+        for job in display_df.itertuples(index=False):
+            # Optional columns may be missing, so read them with getattr defaults
+            company_logo = getattr(job, 'company_logo', None)
+            job_type = getattr(job, 'job_type', None)
+            is_remote = getattr(job, 'is_remote', None)
+            min_amount = getattr(job, 'min_amount', None)
+            max_amount = getattr(job, 'max_amount', None)
+            hiring_managers_count = getattr(job, 'hiring_managers_count', 0)
+            job_url = getattr(job, 'job_url', None)
+            job_url_direct = getattr(job, 'job_url_direct', None)
+            
             with st.container():
                 col1, col2, col3 = st.columns([1, 4, 1])
                 
                 with col1:
                     # Company logo
-                    if pd.notna(job.get('company_logo')) and job.get('company_logo'):
+                    if pd.notna(company_logo) and company_logo:
                         try:
-                            st.image(job['company_logo'], width=60)
+                            st.image(company_logo, width=60)
                         except Exception:
                             st.write("🏢")
                     else:
@@ -494,64 +646,67 @@ class FilterTabUI:
                 
                 with col2:
                     # Job details
-                    st.markdown(f"**{job.get('title', 'No Title')}**")
-                    st.write(f"🏢 {job.get('company', 'Unknown')}")
-                    st.write(f"📍 {job.get('location', 'Unknown')}")
+                    st.markdown(f"**{getattr(job, 'title', 'No Title')}**")
+                    st.write(f"🏢 {getattr(job, 'company', 'Unknown')}")
+                    st.write(f"📍 {getattr(job, 'location', 'Unknown')}")
                     
                     # Additional info in columns
                     info_col1, info_col2 = st.columns(2)
                     with info_col1:
-                        if pd.notna(job.get('job_type')):
-                            st.write(f"💼 {job.get('job_type')}")
-                        if pd.notna(job.get('is_remote')):
-                            remote_text = "🏠 Remote" if job.get('is_remote') else "🏢 On-site"
+                        if pd.notna(job_type):
+                            st.write(f"💼 {job_type}")
+                        if pd.notna(is_remote):
+                            remote_text = "🏠 Remote" if is_remote else "🏢 On-site"
                             st.write(remote_text)
                     
                     with info_col2:
-                        if pd.notna(job.get('min_amount')) and job.get('min_amount') > 0:
-                            salary = f"💰 ${job.get('min_amount'):,.0f}"
-                            if pd.notna(job.get('max_amount')) and job.get('max_amount') > 0:
-                                salary += f" - ${job.get('max_amount'):,.0f}"
+                        if pd.notna(min_amount) and min_amount > 0:
+                            salary = f"💰 ${min_amount:,.0f}"
+                            if pd.notna(max_amount) and max_amount > 0:
+                                salary += f" - ${max_amount:,.0f}"
                             st.write(salary)
                         
                         # Hiring manager info
-                        if job.get('hiring_managers_count', 0) > 0:
-                            st.write(f"👥 {int(job.get('hiring_managers_count', 0))} hiring manager(s)")
+                        if hiring_managers_count > 0:
+                            st.write(f"👥 {int(hiring_managers_count)} hiring manager(s)")
                 
                 with col3:
                     # Action buttons
-                    if pd.notna(job.get('job_url')):
-                        st.link_button("View Job", job['job_url'], use_container_width=True)
+                    if pd.notna(job_url):
+                        st.link_button("View Job", job_url, use_container_width=True)
                     
-                    if pd.notna(job.get('job_url_direct')):
-                        st.link_button("Direct Link", job['job_url_direct'], use_container_width=True)
+                    if pd.notna(job_url_direct):
+                        st.link_button("Direct Link", job_url_direct, use_container_width=True)
                 
                 st.divider()
     
     def _render_compact_list(self, display_df: pd.DataFrame) -> None:
         """Render results in compact list format."""
-        for idx, job in display_df.iterrows():
+        for job in display_df.itertuples(index=False):
             col1, col2 = st.columns([4, 1])
             
             with col1:
                 # Single line with key info
-                title = job.get('title', 'No Title')
-                company = job.get('company', 'Unknown')
-                location = job.get('location', 'Unknown')
+                title = getattr(job, 'title', 'No Title')
+                company = getattr(job, 'company', 'Unknown')
+                location = getattr(job, 'location', 'Unknown')
+                is_remote = getattr(job, 'is_remote', None)
+                min_amount = getattr(job, 'min_amount', None)
                 
                 info_parts = [f"**{title}**", f"at {company}", f"in {location}"]
                 
-                if pd.notna(job.get('is_remote')) and job.get('is_remote'):
+                if pd.notna(is_remote) and is_remote:
                     info_parts.append("(Remote)")
                 
-                if pd.notna(job.get('min_amount')) and job.get('min_amount') > 0:
-                    info_parts.append(f"- ${job.get('min_amount'):,.0f}")
+                if pd.notna(min_amount) and min_amount > 0:
+                    info_parts.append(f"- ${min_amount:,.0f}")
                 
                 st.markdown(" ".join(info_parts))
             
             with col2:
-                if pd.notna(job.get('job_url')):
-                    st.link_button("View", job['job_url'], use_container_width=True)
+                job_url = getattr(job, 'job_url', None)
+                if pd.notna(job_url):
+                    st.link_button("View", job_url, use_container_width=True)
     
     def _save_filter_to_history(self, filters: Dict[str, Any], result_count: int) -> None:
         """Save current filter combination to history."""
@@ -559,17 +714,18 @@ class FilterTabUI:
         active_filters = {k: v for k, v in filters.items() 
                          if v and v != 'All' and v != '' and k != 'remote_value'}
         
-        if active_filters:
+        history = st.session_state[f"{self.session_key_prefix}filter_history"]
+        
+        # Reruns with unchanged filters would otherwise fill the history with duplicates
+        if active_filters and not (history and history[0]['filters'] == active_filters):
             filter_entry = {
                 'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
                 'filters': active_filters,
                 'result_count': result_count
             }
             
-            # Add to history (keep last 10)
-            history = st.session_state[f"{self.session_key_prefix}filter_history"]
-            history.insert(0, filter_entry)
-            st.session_state[f"{self.session_key_prefix}filter_history"] = history[:10]
+            # Add to history (the deque keeps the last 10)
+            history.appendleft(filter_entry)
     
     def _render_filter_management(self, current_filters: Dict[str, Any]) -> None:
         """Render filter management options (save, load, history)."""
@@ -618,7 +774,7 @@ class FilterTabUI:
             history = st.session_state[f"{self.session_key_prefix}filter_history"]
             
             if history:
-                for i, entry in enumerate(history[:5]):  # Show last 5
+                for i, entry in enumerate(islice(history, 5)):  # Show last 5
                     with st.container():
                         col1, col2, col3 = st.columns([3, 1, 1])
                         
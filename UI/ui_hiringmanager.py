@@ -3,6 +3,7 @@ import pandas as pd
 import os
 from typing import Dict, Any, Optional, Tuple, List
 from datetime import datetime
+from Utils.dataframe_utils import JOBS_DATA_KEY, set_session_frame
 
 
 class HiringManagerUI:
@@ -235,7 +236,7 @@ class HiringManagerUI:
                 jobs_with_managers = job_service.fetch_hiring_managers_for_jobs(jobs_df)
                 
                 # Update session state
-                st.session_state.jobs_data = jobs_with_managers
+                set_session_frame(JOBS_DATA_KEY, jobs_with_managers)
                 st.session_state.hiring_last_fetch_time = datetime.now()
                 
                 # Calculate results
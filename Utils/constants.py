@@ -351,4 +351,7 @@ USER_DATA = {
         "Amazon Web Services",
         "Microsoft Azure"
         ]
-    }
\ No newline at end of file
+    }
+
+# Low-cardinality job columns stored as pandas categoricals once jobs are loaded
+CATEGORICAL_JOB_COLUMNS = ['company', 'location', 'site', 'job_type', 'job_level']
@@ -0,0 +1,110 @@
+"""
+DataFrame helpers shared by the dashboard tabs.
+
+The jobs DataFrame (and frames derived from it, such as AI search results) is
+stored in session state together with a content fingerprint computed once at
+assignment time. Tabs look the fingerprint up with session_frame_version and
+use it as the key of their process-wide caches instead of re-hashing the data
+on every rerun. prepare_jobs_frame normalizes freshly loaded jobs before
+they are stored.
+"""
+
+import hashlib
+import pandas as pd
+import streamlit as st
+
+from Utils.constants import CATEGORICAL_JOB_COLUMNS
+
+JOBS_DATA_KEY = 'jobs_data'
+
+
+def dataframe_fingerprint(df: pd.DataFrame) -> tuple:
+    """
+    Content fingerprint of a dataframe, used as the key of the process-wide data caches.
+
+    Every value, the index, the row order and the dtypes feed the hash, so a new
+    dataset never picks up entries computed for another one (object ids are reused
+    once a frame is freed, so identity can't be part of the key). Hashing visits
+    every cell; store frames with set_session_frame so it runs once per assignment.
+
+    Args:
+        df: DataFrame to fingerprint
+
+    Returns:
+        tuple: Row count, column names and a digest of the contents
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(pd.util.hash_pandas_object(df.index).to_numpy().tobytes())
+
+    for column, values in df.items():
+        try:
+            hashed = pd.util.hash_pandas_object(values, index=False)
+        except TypeError:
+            # Unhashable cells (lists, dicts) are hashed through their string form
+            hashed = pd.util.hash_pandas_object(values.astype(str), index=False)
+        digest.update(f"{column}:{values.dtype}".encode())
+        digest.update(hashed.to_numpy().tobytes())
+
+    return (len(df), tuple(df.columns), digest.hexdigest())
+
+
+def prepare_jobs_frame(jobs_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Normalize freshly loaded jobs (scraped or restored) in place.
+
+    Posting dates are parsed once so downstream tabs read datetimes directly, and
+    repeated strings become category codes for faster grouping and counting.
+
+    Args:
+        jobs_df: DataFrame of loaded jobs
+
+    Returns:
+        pd.DataFrame: The same dataframe, converted
+    """
+    if 'date_posted' in jobs_df.columns:
+        jobs_df['date_posted'] = pd.to_datetime(jobs_df['date_posted'], errors='coerce')
+
+    for col in CATEGORICAL_JOB_COLUMNS:
+        if col in jobs_df.columns:
+            jobs_df[col] = jobs_df[col].astype('category')
+
+    return jobs_df
+
+
+def set_session_frame(key: str, df: pd.DataFrame) -> None:
+    """
+    Store a dataframe in session state along with its fingerprint.
+
+    Args:
+        key: Session state key of the frame (e.g. JOBS_DATA_KEY)
+        df: DataFrame to store
+    """
+    st.session_state[key] = df
+    # The frame is kept next to its fingerprint so a direct reassignment of key can't
+    # be mistaken for the fingerprinted frame
+    st.session_state[f"{key}_version"] = (df, dataframe_fingerprint(df))
+
+
+def clear_session_frame(key: str) -> None:
+    """Remove a dataframe stored with set_session_frame and its fingerprint."""
+    for session_key in (key, f"{key}_version"):
+        if session_key in st.session_state:
+            del st.session_state[session_key]
+
+
+def session_frame_version(df: pd.DataFrame, key: str = JOBS_DATA_KEY) -> tuple:
+    """
+    Fingerprint of a dataframe, read from session state when it is the frame stored under key.
+
+    Args:
+        df: DataFrame to get the fingerprint of
+        key: Session state key the frame was stored under with set_session_frame
+
+    Returns:
+        tuple: The stored fingerprint, or a freshly computed one for any other frame
+    """
+    stored = st.session_state.get(f"{key}_version")
+    if stored is not None and stored[0] is df:
+        return stored[1]
+
+    return dataframe_fingerprint(df)
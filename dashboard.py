@@ -11,7 +11,9 @@ from UI.ui_main import MainUITabs
 from UI.ui_summaryMetrics import SummaryMetricsUI
 from UI.ui_utilities import UtilitiesUI
 from Utils.constants import FOOTER_HTML, STYLES_STREAMLIT
+from Utils.dataframe_utils import JOBS_DATA_KEY, prepare_jobs_frame, set_session_frame
 from services.job_portal_service import JobPortalService
+from services.perform_ai_tagging import ai_tagging_service
 from UI.ui_sidebar import JobSearchSidebar
 
 
@@ -125,7 +127,10 @@ class JobPortalDashboard:
                 linkedin_fetch_description=search_config['linkedin_description']
             )
             
-            st.session_state.jobs_data = jobs_df
+            # Reuse AI tags saved from earlier tagging runs
+            jobs_df = ai_tagging_service.merge_cached_tags(jobs_df)
+            
+            set_session_frame(JOBS_DATA_KEY, prepare_jobs_frame(jobs_df))
             st.session_state.last_search_time = datetime.now()
             
             st.success(f"✅ Found {len(jobs_df)} jobs!")
@@ -10,17 +10,23 @@ This service provides a unified interface for different AI providers:
 import os
 import json
 import streamlit as st
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Union, Tuple
 from abc import ABC, abstractmethod
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# (context window, max completion tokens) assumed for models without a known entry
+DEFAULT_TOKEN_LIMITS = (8192, 4096)
+
 
 class BaseAIProvider(ABC):
     """Abstract base class for AI providers."""
     
+    # Model -> (context window, max completion tokens)
+    TOKEN_LIMITS: Dict[str, Tuple[int, int]] = {}
+    
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key
         self.client = None
@@ -49,6 +55,10 @@ class BaseAIProvider(ABC):
         """Get the default model for this provider."""
         pass
     
+    def get_token_limits(self, model: Optional[str] = None) -> Tuple[int, int]:
+        """Get (context window, max completion tokens) of a model (default model if None)."""
+        return self.TOKEN_LIMITS.get(model or self.get_default_model(), DEFAULT_TOKEN_LIMITS)
+    
     @abstractmethod
     def get_chatcompletion(self, prompt: str, 
                           max_tokens: int = 300, 
@@ -56,11 +66,47 @@ class BaseAIProvider(ABC):
                           model: Optional[str] = None) -> Optional[str]:
         """Get chat completion with a simple prompt."""
         pass
+    
+    @abstractmethod
+    def create_async_client(self) -> Any:
+        """Create an async client (bound to the event loop it is used in)."""
+        pass
+    
+    async def generate_completion_async(self, client: Any,
+                                        messages: List[Dict[str, str]],
+                                        max_tokens: int = 300,
+                                        temperature: float = 0.3,
+                                        model: Optional[str] = None,
+                                        response_format: Optional[Dict[str, str]] = None) -> Optional[str]:
+        """Generate completion from messages using an async client."""
+        try:
+            model = model or self.get_default_model()
+            extra_args = {'response_format': response_format} if response_format else {}
+            response = await client.chat.completions.create(
+                model=model,
+                messages=messages,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                **extra_args
+            )
+            return response.choices[0].message.content.strip()
+        except Exception as e:
+            st.warning(f"Async API call failed: {str(e)}")
+            return None
 
 
 class OpenAIProvider(BaseAIProvider):
     """OpenAI API provider."""
     
+    TOKEN_LIMITS = {
+        "gpt-3.5-turbo": (16385, 4096),
+        "gpt-3.5-turbo-16k": (16385, 4096),
+        "gpt-4": (8192, 4096),
+        "gpt-4-turbo-preview": (128000, 4096),
+        "gpt-4o": (128000, 16384),
+        "gpt-4o-mini": (128000, 16384)
+    }
+    
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or os.getenv('OPENAI_API_KEY')
         super().__init__(self.api_key)
@@ -107,6 +153,11 @@ class OpenAIProvider(BaseAIProvider):
         """Get default OpenAI model."""
         return "gpt-3.5-turbo"
     
+    def create_async_client(self) -> Any:
+        """Create an AsyncOpenAI client."""
+        from openai import AsyncOpenAI
+        return AsyncOpenAI(api_key=self.api_key)
+    
     def get_chatcompletion(self, prompt: str, 
                           max_tokens: int = 300, 
                           temperature: float = 0.3,
@@ -134,6 +185,76 @@ class OpenAIProvider(BaseAIProvider):
             model=model
         )
     
+    def submit_batch(self, requests: List[Dict[str, Any]],
+                     completion_window: str = "24h") -> Optional[str]:
+        """
+        Submit chat completion requests through the OpenAI Batch API.
+        
+        Args:
+            requests: Batch request lines with custom_id, method, url and body
+            completion_window: Time window in which the batch must complete
+            
+        Returns:
+            Batch ID as string or None if failed
+        """
+        if not self.is_available():
+            return None
+        
+        try:
+            payload = "\n".join(json.dumps(request) for request in requests).encode("utf-8")
+            batch_file = self.client.files.create(
+                file=("batch_input.jsonl", payload),
+                purpose="batch"
+            )
+            batch = self.client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window=completion_window
+            )
+            return batch.id
+        except Exception as e:
+            st.warning(f"OpenAI batch submission failed: {str(e)}")
+            return None
+    
+    def retrieve_batch(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve batch status and, once completed, the response content per request.
+        
+        Args:
+            batch_id: ID returned by submit_batch
+            
+        Returns:
+            Dict with status, request counts and results (custom_id -> content) or None if failed
+        """
+        if not self.is_available():
+            return None
+        
+        try:
+            batch = self.client.batches.retrieve(batch_id)
+            counts = batch.request_counts
+            batch_info = {
+                'status': batch.status,
+                'completed': counts.completed if counts else 0,
+                'total': counts.total if counts else 0,
+                'results': {}
+            }
+            
+            if batch.status == "completed" and batch.output_file_id:
+                output = self.client.files.content(batch.output_file_id).text
+                for line in output.splitlines():
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    response = record.get('response') or {}
+                    if response.get('status_code') == 200:
+                        content = response['body']['choices'][0]['message']['content']
+                        batch_info['results'][record['custom_id']] = content.strip()
+            
+            return batch_info
+        except Exception as e:
+            st.warning(f"OpenAI batch retrieval failed: {str(e)}")
+            return None
+    
     def get_available_models(self) -> List[str]:
         """Get available OpenAI models."""
         return [
@@ -149,6 +270,17 @@ class OpenAIProvider(BaseAIProvider):
 class GroqProvider(BaseAIProvider):
     """Groq API provider for fast inference with Llama and other models."""
     
+    TOKEN_LIMITS = {
+        "llama3-8b-8192": (8192, 8192),
+        "llama3-70b-8192": (8192, 8192),
+        "llama-3.1-8b-instant": (131072, 8192),
+        "llama-3.1-70b-versatile": (131072, 8192),
+        "llama-3.1-405b-reasoning": (131072, 8192),
+        "mixtral-8x7b-32768": (32768, 32768),
+        "gemma-7b-it": (8192, 8192),
+        "gemma2-9b-it": (8192, 8192)
+    }
+    
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or os.getenv('GROQ_API_KEY')
         super().__init__(self.api_key)
@@ -195,6 +327,11 @@ class GroqProvider(BaseAIProvider):
         """Get default Groq model."""
         return "llama3-8b-8192"
     
+    def create_async_client(self) -> Any:
+        """Create an AsyncGroq client."""
+        from groq import AsyncGroq
+        return AsyncGroq(api_key=self.api_key)
+    
     def get_chatcompletion(self, prompt: str, 
                           max_tokens: int = 300, 
                           temperature: float = 0.3,
@@ -300,6 +437,13 @@ class UnifiedAIService:
             return True
         return False
     
+    def get_token_limits(self) -> Tuple[int, int]:
+        """Get (context window, max completion tokens) of the current model."""
+        if not self.is_available():
+            return DEFAULT_TOKEN_LIMITS
+        
+        return self.providers[self.current_provider].get_token_limits(self.current_model)
+    
     def get_available_models(self, provider_name: Optional[str] = None) -> List[str]:
         """Get available models for a provider."""
         provider = provider_name or self.current_provider
@@ -352,6 +496,31 @@ class UnifiedAIService:
             model=model or self.current_model
         )
     
+    def supports_batch(self) -> bool:
+        """Check if batch processing is available (requires OpenAI)."""
+        return 'openai' in self.providers
+    
+    def get_batch_model(self) -> str:
+        """Get the model used for batch requests."""
+        if self.current_provider == 'openai' and self.current_model:
+            return self.current_model
+        return self.providers['openai'].get_default_model()
+    
+    def submit_batch(self, requests: List[Dict[str, Any]],
+                     completion_window: str = "24h") -> Optional[str]:
+        """Submit a batch of chat completion requests using OpenAI."""
+        if not self.supports_batch():
+            return None
+        
+        return self.providers['openai'].submit_batch(requests, completion_window)
+    
+    def retrieve_batch(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        """Retrieve batch status and results using OpenAI."""
+        if not self.supports_batch():
+            return None
+        
+        return self.providers['openai'].retrieve_batch(batch_id)
+    
     def generate_json_completion(self, prompt: str, 
                                max_tokens: int = 300, 
                                temperature: float = 0.3) -> Optional[Dict[str, Any]]:
@@ -366,6 +535,40 @@ class UnifiedAIService:
         if not response:
             return None
         
+        return self.parse_json_response(response)
+    
+    def create_async_client(self) -> Any:
+        """Create an async client for the current provider."""
+        if not self.is_available():
+            return None
+        
+        return self.providers[self.current_provider].create_async_client()
+    
+    async def generate_json_completion_async(self, client: Any, prompt: str,
+                                             max_tokens: int = 300,
+                                             temperature: float = 0.3,
+                                             response_format: Optional[Dict[str, str]] = None) -> Optional[Any]:
+        """Generate JSON completion with an async client created by create_async_client."""
+        if not self.is_available():
+            return None
+        
+        provider = self.providers[self.current_provider]
+        response = await provider.generate_completion_async(
+            client,
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=max_tokens,
+            temperature=temperature,
+            model=self.current_model,
+            response_format=response_format
+        )
+        
+        if not response:
+            return None
+        
+        return self.parse_json_response(response)
+    
+    def parse_json_response(self, response: str) -> Optional[Any]:
+        """Parse a JSON completion, including JSON wrapped in markdown code blocks."""
         # Try to parse JSON
         try:
             return json.loads(response)
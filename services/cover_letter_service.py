@@ -13,16 +13,18 @@ class CoverLetterGenerator:
         self.ai_service = ai_service
     
     def generate_cover_letter_from_job(self, job_description: str, 
-                                     output_file: Optional[str] = None) -> Tuple[str, Dict]:
+                                     output_file: Optional[str] = None,
+                                     return_content: bool = False) -> Tuple[str, Dict]:
         """
         Generate a cover letter from job description using AI
         
         Args:
             job_description: The job posting description
             output_file: Optional output file path. If None, creates temp file
+            return_content: Return the HTML itself instead of writing a file
             
         Returns:
-            Tuple of (file_path, cover_letter_data)
+            Tuple of (file_path or HTML content, cover_letter_data)
         """
         # Extract cover letter data using AI
         cover_letter_data = self._extract_cover_letter_data(job_description)
@@ -30,6 +32,9 @@ class CoverLetterGenerator:
         if not cover_letter_data:
             raise Exception("Failed to generate cover letter data from job description")
         
+        if return_content:
+            return self.render_cover_letter_html(cover_letter_data), cover_letter_data
+        
         # Generate the HTML file
         html_file = self.generate_cover_letter(cover_letter_data, output_file)
         
@@ -187,6 +192,18 @@ Work Experience:
             print(f"Error analyzing company: {e}")
             return None
     
+    def render_cover_letter_html(self, data: Dict[str, str]) -> str:
+        """
+        Render cover letter data into the HTML template
+        
+        Args:
+            data: Dictionary containing all the cover letter data
+            
+        Returns:
+            Cover letter HTML content
+        """
+        return COVER_LETTER_TEMPLATE.format(**data)
+    
     def generate_cover_letter(self, data: Dict[str, str], output_file: Optional[str] = None) -> str:
         """
         Generate a cover letter HTML file
@@ -198,7 +215,7 @@ Work Experience:
         Returns:
             Path to the generated HTML file
         """
-        html_content = COVER_LETTER_TEMPLATE.format(**data)
+        html_content = self.render_cover_letter_html(data)
         
         if output_file is None:
             # Create a temporary file
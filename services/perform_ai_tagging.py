@@ -9,14 +9,31 @@ This service provides:
 - Support for multiple AI providers (OpenAI, Groq, Llama)
 """
 
+import asyncio
+import os
 import pandas as pd
 import streamlit as st
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple, Iterator, AsyncIterator
 from datetime import datetime
 
 # Import unified AI service
 from .ai_service import ai_service
 
+# On-disk cache of AI tags so they survive app restarts
+AI_TAGS_CACHE_FILE = "Data/aiTags/ai_tags.parquet"
+AI_TAG_COLUMNS = ['ai_tags', 'ai_skills', 'ai_category', 'ai_seniority', 'ai_relevance_score']
+
+# Token budget used to pack jobs into multi-job tagging prompts
+TAG_OUTPUT_TOKENS_PER_JOB = 200
+TAG_PROMPT_OVERHEAD_TOKENS = 250
+CHARS_PER_TOKEN = 4
+
+
+@st.cache_data(show_spinner=False)
+def load_ai_tags_cache(cache_file: str, modified_time: float) -> pd.DataFrame:
+    """Read the AI tags cache; modified_time is part of the cache key so rewrites invalidate it."""
+    return pd.read_parquet(cache_file)
+
 
 class AITaggingService:
     """
@@ -45,13 +62,19 @@ class AITaggingService:
         """Set the AI provider and model."""
         return self.ai_service.set_provider(provider_name, model)
     
-    def tag_jobs(self, jobs_df: pd.DataFrame, progress_callback=None) -> pd.DataFrame:
+    def tag_jobs(self, jobs_df: pd.DataFrame, progress_callback=None,
+                 concurrency: int = 32, chunk_size: Optional[int] = None) -> pd.DataFrame:
         """
         Add AI-generated tags to jobs.
         
+        Jobs are packed into multi-job prompts sized to the current model's token limits,
+        and chunks are analyzed concurrently (at most `concurrency` requests in flight).
+        
         Args:
             jobs_df: DataFrame containing job data
             progress_callback: Optional callback function for progress updates
+            concurrency: Maximum number of concurrent AI requests
+            chunk_size: Optional cap on the number of jobs packed into a single prompt
             
         Returns:
             DataFrame with added AI tags
@@ -66,70 +89,425 @@ class AITaggingService:
         
         st.info(f"🔧 Starting AI analysis for {len(jobs_df)} jobs...")
         
-        tagged_df = jobs_df.copy()
-        
-        # Initialize AI columns
-        tagged_df['ai_tags'] = ''
-        tagged_df['ai_skills'] = ''
-        tagged_df['ai_category'] = ''
-        tagged_df['ai_seniority'] = ''
-        tagged_df['ai_relevance_score'] = 0.0
+        tagged_df = self.initialize_ai_columns(jobs_df)
         
         total_jobs = len(jobs_df)
         successful_tags = 0
         
-        for idx, job in jobs_df.iterrows():
-            try:
-                if progress_callback:
-                    progress_callback(idx + 1, total_jobs)
+        for processed, (idx, ai_columns) in enumerate(
+            self.tag_jobs_iter(jobs_df, concurrency, chunk_size), start=1
+        ):
+            if ai_columns is not None:
+                successful_tags += 1
+                for column, value in ai_columns.items():
+                    tagged_df.at[idx, column] = value
+            
+            if progress_callback:
+                progress_callback(processed, total_jobs)
+        
+        st.info(f"🎯 Successfully processed {successful_tags} out of {total_jobs} jobs")
+        return self.finalize_ai_columns(tagged_df)
+    
+    def tag_jobs_iter(self, jobs_df: pd.DataFrame, concurrency: int = 32,
+                      chunk_size: Optional[int] = None) -> Iterator[Tuple[Any, Optional[Dict[str, Any]]]]:
+        """
+        Stream AI tagging results as they arrive.
+        
+        Args:
+            jobs_df: DataFrame containing job data
+            concurrency: Maximum number of concurrent AI requests
+            chunk_size: Optional cap on the number of jobs packed into a single prompt
+            
+        Yields:
+            (index label, {AI column: value}) for each job, in completion order; the
+            columns are None for jobs the AI failed to analyze
+        """
+        if jobs_df.empty:
+            return
+        
+        loop = asyncio.new_event_loop()
+        results = self._tag_jobs_stream(jobs_df, concurrency, chunk_size)
+        
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(results.__anext__())
+                except StopAsyncIteration:
+                    break
+        finally:
+            loop.run_until_complete(results.aclose())
+            loop.close()
+    
+    async def _tag_jobs_stream(self, jobs_df: pd.DataFrame, concurrency: int = 32,
+                               chunk_size: Optional[int] = None) -> AsyncIterator[Tuple[Any, Optional[Dict[str, Any]]]]:
+        """Analyze jobs concurrently in multi-job chunks, yielding each job's AI columns (None on failure)."""
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async with self.ai_service.create_async_client() as client:
+            async def _tag_chunk(chunk: List[Tuple[Any, str]]):
+                try:
+                    async with semaphore:
+                        ai_response = await self.ai_service.generate_json_completion_async(
+                            client,
+                            prompt=self._build_chunk_tagging_prompt([job_text for _, job_text in chunk]),
+                            max_tokens=TAG_OUTPUT_TOKENS_PER_JOB * len(chunk),
+                            temperature=0.3,
+                            response_format={"type": "json_object"}
+                        )
+                    analyses = self._index_chunk_analyses(ai_response)
+                except Exception:
+                    analyses = {}
                 
-                # Prepare job text for analysis
+                # Jobs missing from the response (or from a failed request) are failures
+                return [(idx, analyses.get(number)) for number, (idx, _) in enumerate(chunk, start=1)]
+            
+            jobs_to_tag = []
+            for position, (idx, job) in enumerate(jobs_df.iterrows(), start=1):
                 job_text = self._prepare_job_text(job)
                 
                 if not job_text.strip():
-                    st.warning(f"Job {idx + 1}: Empty job text, skipping...")
+                    st.warning(f"Job {position}: Empty job text, skipping...")
                     continue
                 
-                # Get AI analysis
-                ai_analysis = self._analyze_job_with_ai(job_text)
-                
-                if ai_analysis:
-                    tagged_df.at[idx, 'ai_tags'] = ai_analysis.get('tags', '')
-                    tagged_df.at[idx, 'ai_skills'] = ai_analysis.get('skills', '')
-                    tagged_df.at[idx, 'ai_category'] = ai_analysis.get('category', '')
-                    tagged_df.at[idx, 'ai_seniority'] = ai_analysis.get('seniority', '')
-                    tagged_df.at[idx, 'ai_relevance_score'] = ai_analysis.get('relevance_score', 0.0)
-                    successful_tags += 1
-                else:
-                    st.warning(f"Job {idx + 1}: AI analysis failed")
+                jobs_to_tag.append((idx, job_text))
             
-            except Exception as e:
-                st.warning(f"Error processing job {idx + 1}: {str(e)}")
+            tasks = [
+                asyncio.ensure_future(_tag_chunk(chunk))
+                for chunk in self._chunk_jobs_for_model(jobs_to_tag, chunk_size)
+            ]
+            
+            # Yield as each chunk returns; one failed chunk doesn't stop the rest
+            try:
+                for task in asyncio.as_completed(tasks):
+                    for idx, ai_analysis in await task:
+                        yield idx, (self._analysis_to_columns(ai_analysis) if ai_analysis else None)
+            finally:
+                for task in tasks:
+                    task.cancel()
+    
+    def _chunk_jobs_for_model(self, jobs_to_tag: List[Tuple[Any, str]],
+                              chunk_size: Optional[int] = None) -> List[List[Tuple[Any, str]]]:
+        """
+        Pack jobs into prompts that fit the current model's token limits.
+        
+        Each job costs its text (estimated at CHARS_PER_TOKEN characters per token) plus
+        TAG_OUTPUT_TOKENS_PER_JOB completion tokens; a chunk's prompt and completion must fit
+        the context window and its completion the model's max completion tokens.
+        
+        Args:
+            jobs_to_tag: (index label, job text) pairs
+            chunk_size: Optional cap on the number of jobs per chunk
+            
+        Returns:
+            List of chunks of (index label, job text) pairs
+        """
+        context_tokens, max_completion_tokens = self.ai_service.get_token_limits()
+        max_jobs = max(1, max_completion_tokens // TAG_OUTPUT_TOKENS_PER_JOB)
+        if chunk_size:
+            max_jobs = min(max_jobs, chunk_size)
+        
+        chunks = []
+        chunk, chunk_tokens = [], TAG_PROMPT_OVERHEAD_TOKENS
+        
+        for idx, job_text in jobs_to_tag:
+            job_tokens = len(job_text) // CHARS_PER_TOKEN + TAG_OUTPUT_TOKENS_PER_JOB
+            
+            if chunk and (len(chunk) >= max_jobs or chunk_tokens + job_tokens > context_tokens):
+                chunks.append(chunk)
+                chunk, chunk_tokens = [], TAG_PROMPT_OVERHEAD_TOKENS
+            
+            chunk.append((idx, job_text))
+            chunk_tokens += job_tokens
+        
+        if chunk:
+            chunks.append(chunk)
+        
+        return chunks
+    
+    def _build_chunk_tagging_prompt(self, job_texts: List[str]) -> str:
+        """Build a single prompt that tags several numbered jobs at once."""
+        numbered_jobs = "\n\n".join(
+            f"{number}) {job_text}" for number, job_text in enumerate(job_texts, start=1)
+        )
+        
+        return f"""
+            Analyze these {len(job_texts)} numbered job postings and provide structured information for each:
+
+            {numbered_jobs}
+
+            Please provide a JSON object {{"jobs": [...]}} with one entry per numbered job, each with:
+            1. "id": The job's number from the list above
+            2. "tags": 5-10 relevant keywords/tags (comma-separated)
+            3. "skills": Technical skills required (comma-separated)
+            4. "category": Job category (e.g., Software Engineering, Data Science, Marketing)
+            5. "seniority": Seniority level (Entry, Mid, Senior, Lead, Executive)
+            6. "relevance_score": Overall job attractiveness score (0.0-1.0)
+
+            Return only valid JSON format.
+            """
+    
+    def _index_chunk_analyses(self, ai_response: Any) -> Dict[int, Dict[str, Any]]:
+        """Map a multi-job JSON response to {job number: analysis}."""
+        if isinstance(ai_response, dict):
+            ai_response = ai_response.get('jobs', [])
+        
+        if not isinstance(ai_response, list):
+            return {}
+        
+        analyses = {}
+        for entry in ai_response:
+            try:
+                analyses[int(entry['id'])] = entry
+            except (KeyError, TypeError, ValueError):
                 continue
         
-        st.info(f"🎯 Successfully processed {successful_tags} out of {total_jobs} jobs")
+        return analyses
+    
+    def supports_batch(self) -> bool:
+        """Check if batch tagging is available for the configured providers."""
+        return self.ai_service.supports_batch()
+    
+    def submit_tagging_batch(self, jobs_df: pd.DataFrame) -> Optional[str]:
+        """
+        Submit AI tagging for all jobs as a single OpenAI batch.
+        
+        Each job becomes one request line whose custom_id is the job's stable ID
+        (see _batch_job_ids), so results can be merged back with apply_tagging_batch_results
+        even if the jobs data has been reloaded or reordered in the meantime.
+        
+        Args:
+            jobs_df: DataFrame containing job data
+            
+        Returns:
+            Batch ID if the batch was submitted, None otherwise
+        """
+        if not self.supports_batch() or jobs_df.empty:
+            return None
+        
+        model = self.ai_service.get_batch_model()
+        requests = []
+        submitted_ids = set()
+        
+        for custom_id, (_, job) in zip(self._batch_job_ids(jobs_df), jobs_df.iterrows()):
+            # custom_id must be unique within a batch; duplicate jobs share one result
+            if custom_id in submitted_ids:
+                continue
+            
+            job_text = self._prepare_job_text(job)
+            if not job_text.strip():
+                continue
+            
+            submitted_ids.add(custom_id)
+            requests.append({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": model,
+                    "messages": [{"role": "user", "content": self._build_tagging_prompt(job_text)}],
+                    "max_tokens": 300,
+                    "temperature": 0.3
+                }
+            })
+        
+        if not requests:
+            return None
+        
+        return self.ai_service.submit_batch(requests)
+    
+    def retrieve_tagging_batch(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        """Retrieve status and results of a tagging batch."""
+        return self.ai_service.retrieve_batch(batch_id)
+    
+    def apply_tagging_batch_results(self, jobs_df: pd.DataFrame, results: Dict[str, str]) -> pd.DataFrame:
+        """
+        Merge completed batch responses back into the jobs dataframe.
+        
+        Results are matched to jobs by their stable ID, so they land on the right rows
+        even if the jobs were reloaded since submission; results for jobs that are no
+        longer present are dropped.
+        
+        Args:
+            jobs_df: Current jobs DataFrame
+            results: Mapping of custom_id to raw completion content
+            
+        Returns:
+            DataFrame with added AI tags
+        """
+        analyses = {}
+        for custom_id, content in results.items():
+            try:
+                ai_analysis = self.ai_service.parse_json_response(content)
+            except Exception:
+                ai_analysis = None
+            
+            if isinstance(ai_analysis, dict):
+                analyses[custom_id] = self._analysis_to_columns(ai_analysis)
+        
+        tagged_df = self.initialize_ai_columns(jobs_df)
+        if not analyses:
+            return self.finalize_ai_columns(tagged_df)
+        
+        # One row of AI columns per job, aligned by ID (duplicate jobs share a result)
+        batch_ids = self._batch_job_ids(tagged_df)
+        ai_columns = pd.DataFrame.from_dict(analyses, orient='index').reindex(batch_ids)
+        has_result = batch_ids.isin(list(analyses))
+        
+        for column, values in ai_columns.items():
+            tagged_df.loc[has_result, column] = values.to_numpy()[has_result]
+        
+        return self.finalize_ai_columns(tagged_df)
+    
+    def _batch_job_ids(self, jobs_df: pd.DataFrame) -> pd.Index:
+        """Batch custom_id of each job: its tags cache key value, else its index label."""
+        key_column = self._tags_cache_key(jobs_df)
+        ids = jobs_df.index if key_column is None else jobs_df[key_column]
+        return pd.Index(ids.astype(str))
+    
+    def save_tags_cache(self, tagged_df: pd.DataFrame, cache_file: str = AI_TAGS_CACHE_FILE) -> bool:
+        """
+        Persist AI tags to a Parquet cache, replacing earlier entries for the same jobs.
+        
+        Only jobs with an actual AI result (non-null ai_tags) are written, so jobs that
+        were skipped or failed don't overwrite tags cached by an earlier run.
+        
+        Args:
+            tagged_df: DataFrame with AI tag columns
+            cache_file: Path of the Parquet cache file
+            
+        Returns:
+            True if the cache was written, False otherwise
+        """
+        key_column = self._tags_cache_key(tagged_df)
+        if key_column is None or not set(AI_TAG_COLUMNS).issubset(tagged_df.columns):
+            return False
+        
+        try:
+            tags_df = tagged_df.loc[tagged_df['ai_tags'].notna(), [key_column] + AI_TAG_COLUMNS]
+            if tags_df.empty:
+                return False
+            tags_df = tags_df.drop_duplicates(subset=key_column, keep='last')
+            
+            cached_df = self._read_tags_cache(cache_file)
+            if cached_df is not None and key_column in cached_df.columns:
+                stale_rows = cached_df[key_column].isin(tags_df[key_column])
+                tags_df = pd.concat([cached_df[~stale_rows], tags_df], ignore_index=True)
+            
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            tags_df.to_parquet(cache_file, compression='zstd', index=False)
+            return True
+        except ImportError:
+            st.warning("pyarrow not installed, AI tags will not be cached. Run: pip install pyarrow")
+            return False
+        except Exception as e:
+            st.warning(f"Could not save AI tags cache: {str(e)}")
+            return False
+    
+    def merge_cached_tags(self, jobs_df: pd.DataFrame, cache_file: str = AI_TAGS_CACHE_FILE) -> pd.DataFrame:
+        """
+        Attach previously saved AI tags to freshly loaded jobs.
+        
+        Args:
+            jobs_df: DataFrame containing job data without AI tags
+            cache_file: Path of the Parquet cache file
+            
+        Returns:
+            DataFrame with cached AI tags merged in (unchanged if nothing is cached)
+        """
+        key_column = self._tags_cache_key(jobs_df)
+        if key_column is None or 'ai_tags' in jobs_df.columns:
+            return jobs_df
+        
+        try:
+            cached_df = self._read_tags_cache(cache_file)
+        except Exception:
+            return jobs_df
+        
+        if cached_df is None or key_column not in cached_df.columns:
+            return jobs_df
+        
+        cached_df = cached_df[cached_df[key_column].isin(jobs_df[key_column])]
+        if cached_df.empty:
+            return jobs_df
+        
+        merged_df = jobs_df.merge(cached_df, on=key_column, how='left')
+        return self.finalize_ai_columns(merged_df)
+    
+    def _tags_cache_key(self, jobs_df: pd.DataFrame) -> Optional[str]:
+        """Column identifying a job across searches ('id' from the scraper, else the job URL)."""
+        for column in ('id', 'job_url'):
+            if column in jobs_df.columns:
+                return column
+        return None
+    
+    def _read_tags_cache(self, cache_file: str) -> Optional[pd.DataFrame]:
+        """Load the AI tags cache if it exists."""
+        if not os.path.exists(cache_file):
+            return None
+        return load_ai_tags_cache(cache_file, os.path.getmtime(cache_file))
+    
+    def initialize_ai_columns(self, jobs_df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
+        """
+        Return jobs_df (or a copy of it) with empty AI tagging columns.
+        
+        The columns start out missing, so jobs the AI never analyzed (skipped or failed)
+        keep a null ai_tags and can be told apart from tagged ones.
+        """
+        tagged_df = jobs_df if inplace else jobs_df.copy()
+        
+        tagged_df['ai_tags'] = None
+        tagged_df['ai_skills'] = None
+        tagged_df['ai_category'] = None
+        tagged_df['ai_seniority'] = None
+        tagged_df['ai_relevance_score'] = float('nan')
+        
         return tagged_df
     
-    def search_jobs_with_ai(self, jobs_df: pd.DataFrame, user_query: str) -> pd.DataFrame:
+    def finalize_ai_columns(self, tagged_df: pd.DataFrame) -> pd.DataFrame:
+        """Store low-cardinality AI columns as categoricals once tagging is done."""
+        for column in ('ai_category', 'ai_seniority'):
+            tagged_df[column] = tagged_df[column].astype('category')
+        
+        return tagged_df
+    
+    def _analysis_to_columns(self, ai_analysis: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a job's AI analysis to the dataframe's AI column values."""
+        return {
+            'ai_tags': ai_analysis.get('tags', ''),
+            'ai_skills': ai_analysis.get('skills', ''),
+            'ai_category': ai_analysis.get('category', ''),
+            'ai_seniority': ai_analysis.get('seniority', ''),
+            'ai_relevance_score': ai_analysis.get('relevance_score', 0.0)
+        }
+    
+    def _apply_analysis(self, tagged_df: pd.DataFrame, idx: Any, ai_analysis: Dict[str, Any]) -> None:
+        """Write a single job's AI analysis into the tagged dataframe."""
+        for column, value in self._analysis_to_columns(ai_analysis).items():
+            tagged_df.at[idx, column] = value
+    
+    def search_jobs_with_ai(self, jobs_df: pd.DataFrame, user_query: str,
+                            messages: Optional[List[Tuple[str, str]]] = None) -> pd.DataFrame:
         """
         Perform AI-powered job search based on natural language query.
         
         Args:
             jobs_df: DataFrame containing job data
             user_query: Natural language search query
+            messages: Optional list collecting ('warning' | 'error', text) problems instead of
+                showing them with Streamlit; pass one when searching off the script thread
             
         Returns:
             Filtered and ranked DataFrame based on AI analysis
         """
         if not self.is_available():
-            st.error("AI service not available. Please configure OpenAI API key.")
+            self._report(messages, 'error', "AI service not available. Please configure OpenAI API key.")
             return jobs_df
         
         if jobs_df.empty or not user_query.strip():
             return jobs_df
         
         # Analyze user query to extract intent and keywords
-        query_analysis = self._analyze_user_query(user_query)
+        query_analysis = self._analyze_user_query(user_query, messages)
         
         if not query_analysis:
             return jobs_df
@@ -140,12 +518,12 @@ class AITaggingService:
         for idx, job in jobs_df.iterrows():
             try:
                 job_text = self._prepare_job_text(job)
-                relevance_score = self._calculate_relevance_score(job_text, query_analysis)
+                relevance_score = self._calculate_relevance_score(job_text, query_analysis, messages)
                 
                 if relevance_score > 0.3:  # Threshold for relevance
                     job_data = job.to_dict()
                     job_data['ai_search_score'] = relevance_score
-                    job_data['ai_match_reasons'] = self._get_match_reasons(job_text, query_analysis)
+                    job_data['ai_match_reasons'] = self._get_match_reasons(job_text, query_analysis, messages)
                     scored_jobs.append(job_data)
             
             except Exception as e:
@@ -160,6 +538,13 @@ class AITaggingService:
         
         return result_df
     
+    def _report(self, messages: Optional[List[Tuple[str, str]]], level: str, text: str) -> None:
+        """Show a problem with Streamlit, or collect it in messages when one is given."""
+        if messages is None:
+            (st.error if level == 'error' else st.warning)(text)
+        else:
+            messages.append((level, text))
+    
     def _prepare_job_text(self, job: pd.Series) -> str:
         """Prepare job text for AI analysis."""
         text_parts = []
@@ -190,13 +575,9 @@ class AITaggingService:
         
         return "\n".join(text_parts)
     
-    def _analyze_job_with_ai(self, job_text: str) -> Optional[Dict[str, Any]]:
-        """Analyze job with AI to extract tags and categorization."""
-        if not self.is_available():
-            return self._get_mock_analysis(job_text)
-        
-        try:
-            prompt = f"""
+    def _build_tagging_prompt(self, job_text: str) -> str:
+        """Build the prompt used to tag a single job."""
+        return f"""
             Analyze this job posting and provide structured information:
 
             Job Text:
@@ -211,9 +592,15 @@ class AITaggingService:
 
             Return only valid JSON format.
             """
-            
+    
+    def _analyze_job_with_ai(self, job_text: str) -> Optional[Dict[str, Any]]:
+        """Analyze job with AI to extract tags and categorization."""
+        if not self.is_available():
+            return self._get_mock_analysis(job_text)
+        
+        try:
             result = self.ai_service.generate_json_completion(
-                prompt=prompt,
+                prompt=self._build_tagging_prompt(job_text),
                 max_tokens=300,
                 temperature=0.3
             )
@@ -240,7 +627,8 @@ class AITaggingService:
                 st.warning(f"AI job analysis failed: {error_msg}. Using mock analysis.")
                 return self._get_mock_ai_analysis(job_text)
     
-    def _analyze_user_query(self, query: str) -> Optional[Dict[str, Any]]:
+    def _analyze_user_query(self, query: str,
+                            messages: Optional[List[Tuple[str, str]]] = None) -> Optional[Dict[str, Any]]:
         """Analyze user query to extract search intent and keywords."""
         if not self.is_available():
             return self._get_mock_query_analysis(query)
@@ -272,10 +660,11 @@ class AITaggingService:
             return result if result else self._get_mock_query_analysis(query)
         
         except Exception as e:
-            st.warning(f"AI query analysis failed: {str(e)}")
+            self._report(messages, 'warning', f"AI query analysis failed: {str(e)}")
             return self._get_mock_query_analysis(query)
     
-    def _calculate_relevance_score(self, job_text: str, query_analysis: Dict[str, Any]) -> float:
+    def _calculate_relevance_score(self, job_text: str, query_analysis: Dict[str, Any],
+                                   messages: Optional[List[Tuple[str, str]]] = None) -> float:
         """Calculate relevance score between job and query analysis."""
         if not self.is_available():
             return 0.75  # Mock score
@@ -311,7 +700,7 @@ class AITaggingService:
             return 0.75
         
         except Exception as e:
-            st.warning(f"AI relevance scoring failed: {str(e)}")
+            self._report(messages, 'warning', f"AI relevance scoring failed: {str(e)}")
             return 0.75
     
     def _get_mock_analysis(self, job_text: str) -> Dict[str, Any]:
@@ -401,7 +790,8 @@ class AITaggingService:
             'intent': 'technical_role'
         }
     
-    def _get_match_reasons(self, job_text: str, query_analysis: Dict[str, Any]) -> str:
+    def _get_match_reasons(self, job_text: str, query_analysis: Dict[str, Any],
+                           messages: Optional[List[Tuple[str, str]]] = None) -> str:
         """Get reasons why a job matches the user query."""
         if not self.is_available():
             return "Mock AI: Job matches based on keywords and requirements."
@@ -425,7 +815,7 @@ class AITaggingService:
             return response if response else "AI analysis unavailable"
         
         except Exception as e:
-            st.warning(f"AI match reason analysis failed: {str(e)}")
+            self._report(messages, 'warning', f"AI match reason analysis failed: {str(e)}")
             return "AI analysis unavailable"
 
 